@@ -3,9 +3,9 @@
 This file should contain only setup stuff, and will only be executed once when VW starts up.
 """
 from dlibrary.document import HatchVectorFill, TileVectorFill, ImageVectorFill, GradientVectorFill, Clazz, LineStyle, \
-    SymbolDefinition, RecordDefinition
+    SymbolDefinition, RecordDefinition, RecordField
 from dlibrary.object import Rectangle, Locus, Symbol, Group, PluginObject
-from dlibrary.object_base import ObjectRepository, ObjectTypeEnum
+from dlibrary.object_base import ObjectRepository, ObjectTypeEnum, RecordSchemaRepository
 
 __author__ = 'Dieter Geerts <dieter@dworks.be>'
 __version__ = '2017.1.0'
@@ -24,3 +24,5 @@ ObjectRepository().register(ObjectTypeEnum.RECTANGLE, Rectangle)
 ObjectRepository().register(ObjectTypeEnum.GROUP, Group)
 ObjectRepository().register(ObjectTypeEnum.SYMBOL, Symbol)
 ObjectRepository().register(ObjectTypeEnum.PLUGIN_OBJECT, PluginObject)
+
+RecordSchemaRepository().register_converter_factory(RecordField.get_converter)
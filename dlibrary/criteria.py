@@ -1,8 +1,10 @@
 """Module for criteria, which is used for getting stuff (objects or properties of objects), based on criteria.
 """
+import itertools
 import vs
-from dlibrary.document import Layer, RecordDefinition
-from dlibrary.object_base import ObjectRepository
+from dlibrary.document import Layer, RecordDefinition, Clazz
+from dlibrary.object_base import ObjectRepository, ObjectTypeEnum
+from dlibrary.utility import SingletonABCMeta, AbstractScopedCache, AbstractScopedCacheDecorator
 
 
 class Criteria(object):
@@ -12,40 +14,299 @@ class Criteria(object):
     for criteria is building them to get something in return, so a fluid interface is more readable and shorter in code.
     """
 
+    # VW criteria use names for object types, other types are given by their number.
+    __TYPE_NAMES = {ObjectTypeEnum.LOCUS: 'LOCUS', ObjectTypeEnum.RECTANGLE: 'RECT', ObjectTypeEnum.GROUP: 'GROUP',
+                    ObjectTypeEnum.SYMBOL: 'SYMBOL', ObjectTypeEnum.PLUGIN_OBJECT: 'PLUGINOBJECT'}
+    # Resources aren't in layers, so VW will never find them by criteria.
+    __RESOURCE_TYPES = {ObjectTypeEnum.HATCH_FILL_DEFINITION, ObjectTypeEnum.TILE_FILL_DEFINITION,
+                        ObjectTypeEnum.GRADIENT_FILL_DEFINITION, ObjectTypeEnum.IMAGE_FILL_DEFINITION,
+                        ObjectTypeEnum.LINE_STYLE_DEFINITION, ObjectTypeEnum.CLASS_DEFINITION,
+                        ObjectTypeEnum.RECORD_DEFINITION, ObjectTypeEnum.SYMBOL_DEFINITION}
+
     def __init__(self):
         self.__criteria = set()
+        self.__query = None
 
-    def is_viewport(self):
+    def __add(self, criterion: str):
         """:rtype: Criteria"""
-        self.__criteria.add('T=VIEWPORT')
+        self.__criteria.add(criterion)
+        self.__query = None
         return self
 
-    def has_record(self, record: RecordDefinition):
+    def is_viewport(self):
         """:rtype: Criteria"""
-        self.__criteria.add('R in [\'%s\']' % record.name if record else None)
-        return self
+        return self.__add('T=VIEWPORT')
+
+    def has_record(self, record: RecordDefinition):
+        """No record means no restriction, so nothing is added then.
+        :rtype: Criteria
+        """
+        return self.__add('R in [%s]' % self.__format_value(record.name)) if record else self
 
     def on_layer(self, layer: Layer):
+        """No layer means no restriction, so nothing is added then.
+        :rtype: Criteria
+        """
+        return self.__add('L=%s' % self.__format_value(layer.name)) if layer else self
+
+    def is_type(self, object_type: int):
+        """:type object_type: ObjectTypeEnum
+        :raises ValueError: For resource types, like record definitions, as objects of those are never found.
+        :rtype: Criteria
+        """
+        if object_type in self.__RESOURCE_TYPES:
+            raise ValueError('Resources can\'t be found by criteria, object type: %s' % object_type)
+        return self.__add('T=%s' % self.__TYPE_NAMES.get(object_type, object_type))
+
+    def in_clazz(self, clazz: Clazz):
+        """No class means no restriction, so nothing is added then.
+        :rtype: Criteria
+        """
+        return self.__add('C=%s' % self.__format_value(clazz.name)) if clazz else self
+
+    def is_selected(self, selected: bool=True):
         """:rtype: Criteria"""
-        self.__criteria.add('L=\'%s\'' % layer.name if layer else None)
-        return self
+        return self.__add('SEL=%s' % self.__format_value(selected))
+
+    def is_visible(self, visible: bool=True):
+        """:rtype: Criteria"""
+        return self.__add('V=%s' % self.__format_value(visible))
+
+    def has_field_value(self, record: RecordDefinition, field_name: str, value, operator: str='='):
+        """Objects that have the record, of which the field compares to the value. Numbers are compared as numbers,
+        all other values as text. No record means no restriction, so nothing is added then.
+        :type value: str | int | float | bool
+        :param operator: One of =, <>, <, >, <= or >=.
+        :rtype: Criteria
+        """
+        if operator not in ('=', '<>', '<', '>', '<=', '>='):
+            raise ValueError('Unknown criteria operator: %s' % operator)
+        return self.__add('%s.%s%s%s' % (self.__format_value(record.name), self.__format_value(field_name), operator,
+                                         self.__format_value(value))) if record else self
+
+    def any_of(self, *criteria):
+        """Objects that meet at least one of the given criteria sets. Empty criteria sets don't restrict anything, so
+        if one is given, nothing is added.
+        :type criteria: Criteria
+        :rtype: Criteria
+        """
+        criteria_strings = [c.compile().criteria_string for c in criteria]
+        if not criteria_strings or not all(criteria_strings):
+            return self
+        return self.__add(' | '.join('(%s)' % c for c in criteria_strings))
+
+    def excluding(self, criteria):
+        """Objects that don't meet the given criteria set.
+        :type criteria: Criteria
+        :rtype: Criteria
+        """
+        return self.__add('NOT (%s)' % (criteria.compile().criteria_string or 'ALL'))
+
+    @staticmethod
+    def __format_value(value) -> str:
+        if isinstance(value, bool):
+            return 'TRUE' if value else 'FALSE'
+        elif isinstance(value, int):
+            return '%d' % value
+        elif isinstance(value, float):
+            # VW only stores up to 6 digits, and doesn't know about the exponent notation.
+            return ('%.6f' % value).rstrip('0').rstrip('.')
+        return '\'%s\'' % str(value).replace('\'', '\'\'')
 
     def in_objects(self):
         """:rtype: Criteria"""
-        self.__criteria.add('INOBJECT')
-        return self
+        return self.__add('INOBJECT')
 
     def in_symbols(self):
         """:rtype: Criteria"""
-        self.__criteria.add('INSYMBOL')
-        return self
+        return self.__add('INSYMBOL')
+
+    def compile(self):
+        """Get the immutable query for the criteria set, which can be kept and reused, also as a dict key.
+        :rtype: CriteriaQuery
+        """
+        if self.__query is None:
+            self.__query = CriteriaQuery(self.__criteria)
+        return self.__query
 
     def get(self) -> set:
         """Get all objects that meet the criteria set.
         :rtype: set(AbstractKeyedObject)
         """
-        objects = set()
-        vs.ForEachObject(
-            lambda h: objects.add(ObjectRepository().get(h)),
-            ' & '.join('(%s)' % c for c in self.__criteria))
-        return objects
+        repository = ObjectRepository()
+        return {repository.get(handle) for handle in self.__get_handles()}
+
+    def iter(self):
+        """Get all objects that meet the criteria set, one by one, in document order.
+        VW can't stop searching for objects halfway, so only handles are gathered up front. The wrappers are created
+        when asked for, so stopping early spares the creation of all others, and they are never all held in memory.
+        :rtype: collections.Iterator[AbstractKeyedObject]
+        """
+        repository = ObjectRepository()
+        for handle in self.__get_handles():
+            yield repository.get(handle)
+
+    def first(self):
+        """Get the first object in document order that meets the criteria set, or None if there is none.
+        :rtype: AbstractKeyedObject
+        """
+        return next(self.iter(), None)
+
+    def any(self) -> bool:
+        """Whether any object meets the criteria set, without creating any wrappers."""
+        return self.count() > 0
+
+    def exists(self) -> bool:
+        """Same as any, whether any object meets the criteria set, without creating any wrappers."""
+        return self.any()
+
+    def count(self) -> int:
+        """The number of objects that meet the criteria set, without creating any wrappers."""
+        counter = [0]
+
+        def count(_):
+            counter[0] += 1
+        self.compile().for_each(count)
+        return counter[0]
+
+    def bb_area_sum(self) -> float:
+        """The sum of the bounding box areas of all objects that meet the criteria set, without creating any wrappers.
+        """
+        area = [0.0]
+
+        def add(handle):
+            top_left, bottom_right = vs.GetBBox(handle)
+            area[0] += (bottom_right[0] - top_left[0]) * (top_left[1] - bottom_right[1])
+        self.compile().for_each(add)
+        return area[0]
+
+    def bb_extents(self):
+        """The bounding box around all objects that meet the criteria set, without creating any wrappers.
+        :returns: The top left and bottom right point, or None if no object meets the criteria set.
+        :rtype: ((float, float), (float, float))
+        """
+        extents = []
+
+        def extend(handle):
+            (bb_left, bb_top), (bb_right, bb_bottom) = vs.GetBBox(handle)
+            if not extents:
+                extents.extend((bb_left, bb_top, bb_right, bb_bottom))
+            else:
+                left, top, right, bottom = extents
+                extents[:] = min(left, bb_left), max(top, bb_top), max(right, bb_right), min(bottom, bb_bottom)
+        self.compile().for_each(extend)
+        if not extents:
+            return None
+        left, top, right, bottom = extents
+        return (left, top), (right, bottom)
+
+    def take(self, count: int) -> list:
+        """Get the first count objects in document order that meet the criteria set.
+        :rtype: list[AbstractKeyedObject]
+        """
+        return list(itertools.islice(self.iter(), count))
+
+    def __get_handles(self) -> tuple:
+        """:rtype: tuple[vs.Handle]"""
+        return self.compile().get_handles()
+
+
+class CriteriaQuery(object):
+    """Immutable, compiled criteria, which holds the criteria string for VW, so it only has to be built once.
+    Queries with the same criteria are equal and have the same hash, so they can share results, see CriteriaResults.
+    """
+
+    def __init__(self, criteria):
+        """
+        :type criteria: collections.Iterable[str]
+        """
+        self.__criteria = frozenset(criteria)
+        # Sorted, so that equal queries will always give VW the same string.
+        self.__criteria_string = ' & '.join('(%s)' % c for c in sorted(self.__criteria))
+        self.__hash = hash(self.__criteria)
+
+    @property
+    def criteria(self) -> frozenset:
+        return self.__criteria
+
+    @property
+    def criteria_string(self) -> str:
+        return self.__criteria_string
+
+    def get_handles(self) -> tuple:
+        """Get the handles of all objects that meet the criteria, in document order.
+        :rtype: tuple[vs.Handle]
+        """
+        return CriteriaResults().get(self)
+
+    def for_each(self, callback):
+        """Call the callback with the handle of each object that meets the criteria, in document order.
+        The shared handles are used while CriteriaResults is open, otherwise VW's search calls the callback directly,
+        so that no handles have to be gathered for counting or aggregating.
+        :type callback: (vs.Handle) -> None
+        """
+        results = CriteriaResults()
+        if results.is_open:
+            for handle in results.get(self):
+                callback(handle)
+        else:
+            vs.ForEachObject(callback, self.__criteria_string)
+
+    def __hash__(self):
+        return self.__hash
+
+    def __eq__(self, other):
+        return isinstance(other, CriteriaQuery) and self.__criteria == other.criteria
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+class CriteriaResults(AbstractScopedCache, metaclass=SingletonABCMeta):
+    """Singleton to get the handles for a query, which will be shared by equal queries while open.
+    See ReuseCriteriaResults. Changes to the document made in that time, that could alter the results of queries,
+    should be followed by a call to mark_dirty, so all queries are searched for again.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__results = None
+        """@type: dict[CriteriaQuery, tuple[vs.Handle]]"""
+
+    def get(self, query: CriteriaQuery) -> tuple:
+        """:rtype: tuple[vs.Handle]"""
+        if self.__results is None:
+            return self.__search(query)
+        handles = self.__results.get(query)
+        if handles is None:
+            handles = self.__results[query] = self.__search(query)
+        return handles
+
+    @staticmethod
+    def __search(query: CriteriaQuery) -> tuple:
+        handles = []
+        vs.ForEachObject(lambda h: handles.append(h), query.criteria_string)
+        return tuple(handles)
+
+    def _start_scope(self):
+        self.__results = dict()
+
+    def _end_scope(self):
+        self.__results = None
+
+    def mark_dirty(self):
+        """Forget all results, as the document has changed in a way that could alter them."""
+        if self.__results is not None:
+            self.__results.clear()
+
+
+class ReuseCriteriaResults(AbstractScopedCacheDecorator):
+    """Decorator and context manager to share the results of equal queries during the decorated function.
+
+    Use it on reset handlers or other code that does the same queries many times, so that VW only has to search once
+    for each of them. Call CriteriaResults().mark_dirty() after changing the document in a way that alters results.
+    """
+
+    @property
+    def _cache(self) -> CriteriaResults:
+        return CriteriaResults()
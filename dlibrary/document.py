@@ -1,12 +1,20 @@
 """Used for all document related stuff, like units, layers, resources, ....
 """
+import functools
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 
 import vs
-from dlibrary.object_base import ObjectRepository, AbstractKeyedObject, ObjectTypeEnum
-from dlibrary.utility import SingletonMeta, ObservableList, SingletonABCMeta, Convert
-from dlibrary.vectorworks import CorrectVsFilepath
+from dlibrary.object_base import ObjectRepository, AbstractKeyedObject, ObjectTypeEnum, RecordSchemaRepository, \
+    RecordFieldSchema
+from dlibrary.utility import ObservableList, SingletonABCMeta, Convert, AbstractScopedCache, \
+    AbstractScopedCacheDecorator
+from dlibrary.vectorworks import CorrectVsFilepath, Vectorworks
 
 
 class DataFieldTypeEnum(object):
@@ -50,55 +58,81 @@ class RecordField(object):
     """
 
     def __init__(self, record_handle: vs.Handle, index: int, record_name: str, object_handle: vs.Handle,
-                 parametric: bool):
+                 parametric: bool, schema: RecordFieldSchema=None):
+        """
+        :param schema: The field's metadata, so it doesn't have to be asked from VW, see RecordSchemaRepository.
+        """
         self.__record_handle = record_handle
         self.__index = index
         self.__record_name = record_name
         self.__object_handle = object_handle
         self.__parametric = parametric
+        self.__schema = schema
 
     @property
     def name(self) -> str:
-        return vs.GetFldName(self.__record_handle, self.__index)
+        return self.__schema.name if self.__schema else vs.GetFldName(self.__record_handle, self.__index)
 
     @property
     def type(self) -> int:
         """:rtype: DataFieldTypeEnum | PioFieldTypeEnum"""
-        return vs.GetFldType(self.__record_handle, self.__index)
+        return self.__schema.type if self.__schema else vs.GetFldType(self.__record_handle, self.__index)
 
     @property
     def value(self):
         """:rtype: str | int | bool | float"""
-        return {
-            True: {
-                PioFieldTypeEnum.INTEGER: self.__to_int,
-                PioFieldTypeEnum.BOOLEAN: self.__to_bool,
-                PioFieldTypeEnum.REAL: self.__to_float,
-                PioFieldTypeEnum.REAL_DIMENSION: self.__to_float,
-                PioFieldTypeEnum.REAL_X_COORDINATE: self.__to_float,
-                PioFieldTypeEnum.REAL_Y_COORDINATE: self.__to_float
-            },
-            False: {
-                DataFieldTypeEnum.INTEGER: self.__to_int,
-                DataFieldTypeEnum.BOOLEAN: self.__to_bool,
-                DataFieldTypeEnum.NUMBER_GENERAL: self.__to_float,
-                DataFieldTypeEnum.NUMBER_DECIMAL: self.__to_float,
-                DataFieldTypeEnum.NUMBER_PERCENTAGE: self.__to_float,
-                DataFieldTypeEnum.NUMBER_SCIENTIFIC: self.__to_float,
-                DataFieldTypeEnum.NUMBER_FRACTIONAL: self.__to_float,
-                DataFieldTypeEnum.NUMBER_DIMENSION: self.__to_float,
-                DataFieldTypeEnum.NUMBER_DIMENSION_AREA: self.__to_float_from_area,
-                DataFieldTypeEnum.NUMBER_DIMENSION_VOLUME: self.__to_float_from_volume,
-                DataFieldTypeEnum.NUMBER_ANGLE: self.__to_float_from_angle
-            }
-        }.get(self.__parametric).get(self.type, self.__to_str)(
-            vs.GetRField(self.__object_handle, self.__record_name, self.name))
+        converter = self.__schema.converter if self.__schema else self.get_converter(self.type, self.__parametric)
+        return converter(vs.GetRField(self.__object_handle, self.__record_name, self.name))
 
     @value.setter
     def value(self, value: str):
         """:type value: str"""
         vs.SetRField(self.__object_handle, self.__record_name, self.name, value)
 
+    __converters = None
+
+    @staticmethod
+    def get_converter(field_type: int, parametric: bool) -> callable:
+        """Get the function to convert the string value VW gives for a field of the type to a Python value.
+        :type field_type: DataFieldTypeEnum | PioFieldTypeEnum
+        :rtype: (str) -> str | int | bool | float
+        """
+        if RecordField.__converters is None:
+            RecordField.__converters = {
+                True: {
+                    PioFieldTypeEnum.INTEGER: RecordField.__to_int,
+                    PioFieldTypeEnum.BOOLEAN: RecordField.__to_bool,
+                    PioFieldTypeEnum.REAL: RecordField.__to_float,
+                    PioFieldTypeEnum.REAL_DIMENSION: RecordField.__to_float,
+                    PioFieldTypeEnum.REAL_X_COORDINATE: RecordField.__to_float,
+                    PioFieldTypeEnum.REAL_Y_COORDINATE: RecordField.__to_float
+                },
+                False: {
+                    DataFieldTypeEnum.INTEGER: RecordField.__to_int,
+                    DataFieldTypeEnum.BOOLEAN: RecordField.__to_bool,
+                    DataFieldTypeEnum.NUMBER_GENERAL: RecordField.__to_float,
+                    DataFieldTypeEnum.NUMBER_DECIMAL: RecordField.__to_float,
+                    DataFieldTypeEnum.NUMBER_PERCENTAGE: RecordField.__to_float,
+                    DataFieldTypeEnum.NUMBER_SCIENTIFIC: RecordField.__to_float,
+                    DataFieldTypeEnum.NUMBER_FRACTIONAL: RecordField.__to_float,
+                    DataFieldTypeEnum.NUMBER_DIMENSION: RecordField.__to_float,
+                    DataFieldTypeEnum.NUMBER_DIMENSION_AREA: RecordField.__to_float_from_area,
+                    DataFieldTypeEnum.NUMBER_DIMENSION_VOLUME: RecordField.__to_float_from_volume,
+                    DataFieldTypeEnum.NUMBER_ANGLE: RecordField.__to_float_from_angle
+                }
+            }
+        return RecordField.__converters[bool(parametric)].get(field_type, RecordField.__to_str)
+
+    @staticmethod
+    def get_value_type(field_type: int, parametric: bool) -> type:
+        """Get the Python type of the values for a field of the type, as given by the converter.
+        :type field_type: DataFieldTypeEnum | PioFieldTypeEnum
+        :rtype: type(str) | type(int) | type(bool) | type(float)
+        """
+        converter = RecordField.get_converter(field_type, parametric)
+        return int if converter is RecordField.__to_int else bool if converter is RecordField.__to_bool else \
+            str if converter is RecordField.__to_str else float
+
     @staticmethod
     def __to_str(value: str) -> str:
         return value
@@ -143,15 +177,23 @@ class Record(AbstractKeyedObject):
     @property
     def fields(self) -> OrderedDict:
         """:rtype: OrderedDict[str, RecordField]"""
-        fields = OrderedDict()
-        for index in range(1, vs.NumFields(self.handle) + 1):
-            field = self.get_field(index)
-            fields[field.name] = field
-        return fields
+        name = self.name
+        schema = RecordSchemaRepository().get(name)
+        if schema is None:
+            fields = (self.get_field(index) for index in range(1, vs.NumFields(self.handle) + 1))
+        else:
+            parametric = schema.parametric
+            fields = (RecordField(self.handle, field.index, name, self.__object_handle, parametric, field)
+                      for field in schema.fields)
+        return OrderedDict((field.name, field) for field in fields)
 
     def get_field(self, index: int) -> RecordField:
         """Get the field based on it's index, 1-n based."""
-        return RecordField(self.handle, index, self.name, self.__object_handle, self.parametric)
+        schema = RecordSchemaRepository().get(self.name)
+        if schema is None:
+            return RecordField(self.handle, index, self.name, self.__object_handle, self.parametric)
+        return RecordField(self.handle, index, schema.name, self.__object_handle, schema.parametric,
+                           schema.get_field_by_index(index))
 
 
 class IRecords(object, metaclass=ABCMeta):
@@ -171,6 +213,108 @@ class IRecords(object, metaclass=ABCMeta):
             for index in range(1, vs.NumRecords(self._handle) + 1))}
 
 
+class RecordTable(object):
+    """Reads or writes the values of a record for many objects at once, as rows or columns.
+    The field names, types and converters are taken from the schema once, instead of for each value and object.
+    All objects should have the record attached, as VW gives empty values for objects without it.
+    """
+
+    def __init__(self, definition):
+        """
+        :type definition: RecordDefinition
+        """
+        schema = RecordSchemaRepository().get(definition.name)
+        if schema is None:
+            raise ValueError('No record definition named: %s' % definition.name)
+        self.__record_name = schema.name
+        self.__field_names = schema.field_names
+        self.__field_types = tuple(field.type for field in schema.fields)
+        self.__converters = {field.name: field.converter for field in schema.fields}
+
+    @property
+    def record_name(self) -> str:
+        return self.__record_name
+
+    @property
+    def field_names(self) -> tuple:
+        """:rtype: tuple[str]"""
+        return self.__field_names
+
+    @property
+    def field_types(self) -> tuple:
+        """:rtype: tuple[DataFieldTypeEnum | PioFieldTypeEnum]"""
+        return self.__field_types
+
+    def check_field_names(self, field_names=None) -> tuple:
+        """Get the given field names, or those of all fields if none are given.
+        :type field_names: collections.Iterable[str]
+        :raises ValueError: If the record has no field with one of the names.
+        :rtype: tuple[str]
+        """
+        field_names = tuple(field_names or self.__field_names)
+        for name in field_names:
+            if name not in self.__converters:
+                raise ValueError('Record %s has no field named: %s' % (self.__record_name, name))
+        return field_names
+
+    def __get_fields(self, field_names) -> tuple:
+        """:rtype: tuple[(str, callable)]"""
+        return tuple((name, self.__converters[name]) for name in self.check_field_names(field_names))
+
+    def read_rows(self, objects, field_names=None, convert: bool=True):
+        """Get the values for each object, one tuple per object, in the order of the fields.
+        :type objects: collections.Iterable[AbstractKeyedObject | vs.Handle]
+        :param field_names: Only get these fields, in this order, instead of all of them.
+        :type field_names: collections.Iterable[str]
+        :param convert: Give the values as VW gives them, as strings, instead of converting them to Python values.
+        :rtype: collections.Iterator[tuple]
+        """
+        record_name, fields = self.__record_name, self.__get_fields(field_names)
+        for keyed_object in objects:
+            handle = keyed_object.handle if isinstance(keyed_object, AbstractKeyedObject) else keyed_object
+            if convert:
+                yield tuple(converter(vs.GetRField(handle, record_name, name)) for name, converter in fields)
+            else:
+                yield tuple(vs.GetRField(handle, record_name, name) for name, _ in fields)
+
+    def read_columns(self, objects, field_names=None, convert: bool=True) -> OrderedDict:
+        """Get the values for all objects, one list per field, in the order of the objects.
+        :type objects: collections.Iterable[AbstractKeyedObject | vs.Handle]
+        :type field_names: collections.Iterable[str]
+        :rtype: OrderedDict[str, list]
+        """
+        names = tuple(name for name, _ in self.__get_fields(field_names))
+        columns = OrderedDict((name, []) for name in names)
+        appends = tuple(columns[name].append for name in names)
+        for row in self.read_rows(objects, names, convert):
+            for append, value in zip(appends, row):
+                append(value)
+        return columns
+
+    def write_rows(self, objects, rows, field_names=None):
+        """Set the values for each object, one row per object, in the order of the fields. None values are skipped.
+        :type objects: collections.Iterable[AbstractKeyedObject | vs.Handle]
+        :type rows: collections.Iterable[collections.Sequence]
+        :type field_names: collections.Iterable[str]
+        """
+        record_name, names = self.__record_name, tuple(name for name, _ in self.__get_fields(field_names))
+        for keyed_object, row in zip(objects, rows):
+            handle = keyed_object.handle if isinstance(keyed_object, AbstractKeyedObject) else keyed_object
+            for name, value in zip(names, row):
+                if value is not None:
+                    # VW doesn't know about the exponent notation, which str gives for very small or large floats.
+                    vs.SetRField(handle, record_name, name, value if isinstance(value, str) else
+                                 vs.Num2Str(-2, value) if isinstance(value, float) else str(value))
+
+    def write_columns(self, objects, columns: dict):
+        """Set the values for all objects, one sequence per field, in the order of the objects. None values are skipped.
+        :type objects: collections.Iterable[AbstractKeyedObject | vs.Handle]
+        :type columns: dict[str, collections.Sequence]
+        """
+        names = tuple(columns.keys())
+        self.write_rows(objects, zip(*(columns[name] for name in names)), names)
+
+
 class PatternFillEnum(object):
     """Holds the most important pattern fill indices in a human readable name.
     These are No fill, background color fill and foreground color fill. It is recommended to not use any other fills
@@ -376,6 +520,11 @@ class Layer(object):
 
     @staticmethod
     def get(layer_handle):
+        """While the layer registry is open, see ReuseLayers, the same wrapper is returned for the same layer."""
+        return LayerRegistry().get_by_handle(layer_handle) or Layer.create(layer_handle)
+
+    @staticmethod
+    def create(layer_handle):
         return {1: DesignLayer, 2: SheetLayer}.get(vs.GetObjectVariableInt(layer_handle, 154))(layer_handle)
 
     def __init__(self, handle: vs.Handle):
@@ -421,6 +570,113 @@ class SheetLayer(Layer):
         return vs.GetObjectVariableString(self._handle, 159)
 
 
+class LayerRegistry(AbstractScopedCache, metaclass=SingletonABCMeta):
+    """Singleton to get the layers of the active document, by name, stacking order or type, without walking them all.
+
+    While the registry is open, see ReuseLayers, the layers are only walked once, and the same wrappers are returned.
+    It's checked against the number of layers and the first layer on each use, so added or deleted layers, or another
+    active document, are mostly noticed. Renamed or reordered layers aren't noticed, so call invalidate after doing so.
+    When it isn't open, the layers are walked on each use.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__layers = None
+        """@type: tuple[Layer]"""
+        self.__check = None
+        self.__by_handle = None
+        """@type: dict[str, Layer]"""
+        self.__by_name = None
+        """@type: dict[str, Layer]"""
+        self.__stacking_indexes = None
+        """@type: dict[str, int]"""
+
+    def _start_scope(self):
+        self.invalidate()  # Layers walked while not open could be from another run, or another document.
+
+    def _end_scope(self):
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget all layers, needed after renaming or reordering layers while the registry is open."""
+        self.__layers = None
+        self.__check = None
+        self.__by_handle = None
+        self.__by_name = None
+        self.__stacking_indexes = None
+
+    @staticmethod
+    def __get_check() -> tuple:
+        # The Handle class isn't hashable, so we'll use the string representation instead.
+        return vs.NumLayers(), str(vs.FLayer())
+
+    def __load(self):
+        if not self.is_open or self.__layers is None or self.__check != self.__get_check():
+            self.__check = self.__get_check()
+            handles = []
+            for count in range(self.__check[0]):
+                handles.append(vs.FLayer() if count == 0 else vs.NextLayer(handles[count - 1]))
+            by_handle = self.__by_handle if self.is_open and self.__by_handle else dict()
+            self.__layers = tuple(by_handle.get(str(handle)) or Layer.create(handle) for handle in handles)
+            self.__by_handle = {str(layer._handle): layer for layer in self.__layers}
+            self.__by_name = None
+            self.__stacking_indexes = None
+
+    @property
+    def layers(self) -> tuple:
+        """All layers, in stacking order, from bottom to top.
+        :rtype: tuple[Layer]
+        """
+        self.__load()
+        return self.__layers
+
+    @property
+    def design_layers(self) -> tuple:
+        """:rtype: tuple[DesignLayer]"""
+        return tuple(layer for layer in self.layers if isinstance(layer, DesignLayer))
+
+    @property
+    def sheet_layers(self) -> tuple:
+        """:rtype: tuple[SheetLayer]"""
+        return tuple(layer for layer in self.layers if isinstance(layer, SheetLayer))
+
+    def get(self, name: str) -> Layer:
+        """Get the layer by name, which is the number for sheet layers.
+        :returns: None if there is no layer with that name.
+        """
+        self.__load()
+        if self.__by_name is None:
+            self.__by_name = {layer.name: layer for layer in self.__layers}
+        return self.__by_name.get(name)
+
+    def get_stacking_index(self, layer: Layer) -> int:
+        """Get the 0-n based index of the layer in the stacking order, from bottom to top.
+        :returns: -1 if the layer isn't in the document.
+        """
+        self.__load()
+        if self.__stacking_indexes is None:
+            self.__stacking_indexes = {str(stacked._handle): index for index, stacked in enumerate(self.__layers)}
+        return self.__stacking_indexes.get(str(layer._handle), -1)
+
+    def get_by_handle(self, layer_handle: vs.Handle) -> Layer:
+        """Get the layer wrapper, while the registry is open and the layer is already known to it, None otherwise."""
+        if self.__by_handle is None or not self.is_open:
+            return None
+        return self.__by_handle.get(str(layer_handle))
+
+
+class ReuseLayers(AbstractScopedCacheDecorator):
+    """Decorator and context manager to walk the layers of the document only once during the decorated function.
+
+    Use it around code that looks up layers many times, like titleblock or sheet numbering scripts, so that Document
+    and LayerRegistry don't need to ask VW for all layers each time, and return the same wrappers.
+    """
+
+    @property
+    def _cache(self) -> LayerRegistry:
+        return LayerRegistry()
+
+
 class IDocumentAttributes(IAttributes, metaclass=ABCMeta):
     """Interface for handling document attributes.
     """
@@ -494,24 +750,25 @@ class Document(IDocumentAttributes, metaclass=SingletonABCMeta):
         """
         :rtype: set(Layer)
         """
-        layer_handles = []
-        for count in range(vs.NumLayers()):
-            layer_handles.append(vs.FLayer() if count == 0 else vs.NextLayer(layer_handles[count - 1]))
-        return {Layer.get(layer_handle) for layer_handle in layer_handles}
+        return set(LayerRegistry().layers)
 
     @property
     def design_layers(self) -> set:
         """
         :rtype: set(DesignLayer)
         """
-        return {layer for layer in self.layers if isinstance(layer, DesignLayer)}
+        return set(LayerRegistry().design_layers)
 
     @property
     def sheet_layers(self) -> set:
         """
         :rtype: set(SheetLayer)
         """
-        return {layer for layer in self.layers if isinstance(layer, SheetLayer)}
+        return set(LayerRegistry().sheet_layers)
+
+    def get_layer(self, name: str) -> Layer:
+        """Get the layer by name, which is the number for sheet layers, or None if there is no such layer."""
+        return LayerRegistry().get(name)
 
     @property
     def text_size(self) -> float:
@@ -524,22 +781,70 @@ class Document(IDocumentAttributes, metaclass=SingletonABCMeta):
         vs.SetPrefReal(57, value * 42.42424)
 
 
-class Units(object, metaclass=SingletonMeta):
+class Units(AbstractScopedCache, metaclass=SingletonABCMeta):
+    """Conversions between inches, the internal unit of VW, and the document units, as set by the user.
+
+    Each conversion needs the unit preferences of the document. While open, see ReuseUnitPreferences, a snapshot of
+    them is used, so they are only read once from VW, instead of on each conversion. Call refresh after changing the
+    unit preferences while open.
+    """
 
     # TODO: Add utility methods to convert to commonly used units, like m, cm, ...
     # Otherwise, we only have to use inches, and it would make code more readable.
 
+    # Preference indexes: 152 = length units per inch, 162 = length precision, 154 = length unit mark, 176 = area units
+    # per square inch, 179 = area precision, 178 = area unit mark, 180 = volume units per cubic inch, 183 = volume
+    # precision, 182 = volume unit mark.
+    __REAL_PREFERENCES = (152, 176, 180)
+    __LONG_INT_PREFERENCES = (162, 179, 183)
+    __STRING_PREFERENCES = (154, 178, 182)
+
+    def __init__(self):
+        super().__init__()
+        self.__preferences = None
+        """@type: dict[int, float | int | str]"""
+
+    def _start_scope(self):
+        self.__preferences = self.__read_preferences()
+
+    def _end_scope(self):
+        self.__preferences = None
+
+    def refresh(self):
+        """Read the unit preferences again, if open. Needed when they are changed while open."""
+        if self.__preferences is not None:
+            self.__preferences = self.__read_preferences()
+
+    @staticmethod
+    def __read_preferences() -> dict:
+        """:rtype: dict[int, float | int | str]"""
+        preferences = {index: vs.GetPrefReal(index) for index in Units.__REAL_PREFERENCES}
+        preferences.update((index, vs.GetPrefLongInt(index)) for index in Units.__LONG_INT_PREFERENCES)
+        preferences.update((index, vs.GetPrefString(index)) for index in Units.__STRING_PREFERENCES)
+        return preferences
+
+    def __get_preference(self, index: int):
+        """:rtype: float | int | str"""
+        if self.__preferences is not None:
+            return self.__preferences[index]
+        elif index in self.__REAL_PREFERENCES:
+            return vs.GetPrefReal(index)
+        elif index in self.__LONG_INT_PREFERENCES:
+            return vs.GetPrefLongInt(index)
+        else:
+            return vs.GetPrefString(index)
+
     @staticmethod
     def __get_length_units_per_inch() -> float:
-        return vs.GetPrefReal(152)
+        return Units().__get_preference(152)
 
     @staticmethod
     def __get_area_units_per_square_inch() -> float:
-        return vs.GetPrefReal(176)
+        return Units().__get_preference(176)
 
     @staticmethod
     def __get_volume_units_per_cubic_inch() -> float:
-        return vs.GetPrefReal(180)
+        return Units().__get_preference(180)
 
     @staticmethod
     def __validate_length_str_to_inches(length: str) -> float:
@@ -547,14 +852,58 @@ class Units(object, metaclass=SingletonMeta):
 
     @staticmethod
     def __validate_length_str_to_length_units(length: str) -> float:
-        ok, num = vs.ValidNumStr(length)
+        parsed = Units.__parse_length_str(length)
+        if parsed is None:
+            ok, num = vs.ValidNumStr(length)
+        else:
+            number, inches_per_unit = parsed
+            num = number if inches_per_unit is None else number * inches_per_unit * Units.__get_length_units_per_inch()
         # VW has rounding errors: vs.ValidNumStr('4605mm') gives 460.5000000000001!
         # So we'll round the length off by the document unit length precision, which is set by the user.
         return round(num, Units().length_precision)
 
+    __NUMBER = r'\d+(?:\.\d*)?|\.\d+'
+    __LENGTH = re.compile(r'''^\s*(?P<sign>[-+]?)\s*(?P<number>%s)\s*(?P<unit>mm|cm|m|in|"|ft|')?\s*$''' % __NUMBER)
+    __FEET_INCHES = re.compile(
+        r'''^\s*(?P<sign>[-+]?)\s*(?:(?P<feet>%s)\s*(?:'|ft)\s*-?)?\s*''' % __NUMBER +
+        r'''(?:(?:(?P<inches>%s)|(?:(?P<whole>\d+)(?:\s+|\s*-\s*))?(?P<numerator>\d+)\s*/\s*(?P<denominator>\d+))'''
+        % __NUMBER + r'''\s*(?P<inch_mark>"|in)?)?\s*$''')
+    __INCHES_PER_UNIT = {'mm': 1 / 25.4, 'cm': 1 / 2.54, 'm': 1 / 0.0254, 'in': 1.0, '"': 1.0, 'ft': 12.0, "'": 12.0}
+
     @staticmethod
-    def __to_str(units: float, precision: int, with_unit_mark: bool, unit_mark: str) -> str:
-        return '%%.%sf%%s' % precision % (units, unit_mark if with_unit_mark else '')
+    @functools.lru_cache(maxsize=1024)
+    def __parse_length_str(length: str) -> tuple:
+        """Parse the length string like VW does, without asking VW, for the most common notations: a number with an
+        optional metric, inch or feet unit mark, and feet-inches with an optional inch fraction, like 1'6 1/2".
+        Parsing doesn't depend on the document units, so results are cached, as the same strings are used over and over.
+
+        :returns: The number and the inches per unit, which is None for numbers in document units, or None if the
+                  notation isn't known to us, so VW should parse it.
+        :rtype: (float, float)
+        """
+        match = Units.__LENGTH.match(length)
+        if match is not None:
+            number = float(match.group('number'))
+            unit = match.group('unit')
+            return -number if match.group('sign') == '-' else number, Units.__INCHES_PER_UNIT[unit] if unit else None
+        match = Units.__FEET_INCHES.match(length)
+        if match is None:
+            return None
+        feet, inches, whole, numerator, denominator = match.group(
+            'feet', 'inches', 'whole', 'numerator', 'denominator')
+        if numerator is not None and int(denominator) == 0:
+            return None
+        if feet is None and (not match.group('inch_mark') or inches is None and numerator is None):
+            return None  # Without feet, inches need their mark, otherwise it's not known what unit is meant.
+        number = float(feet or 0) * 12 + float(inches or whole or 0) + (
+            int(numerator) / int(denominator) if numerator is not None else 0)
+        return -number if match.group('sign') == '-' else number, 1.0
+
+    @staticmethod
+    def __to_str(units: float, precision_index: int, with_unit_mark: bool, unit_mark_index: int) -> str:
+        units_instance = Units()
+        return '%%.%sf%%s' % units_instance.__get_preference(precision_index) % (
+            units, units_instance.__get_preference(unit_mark_index) if with_unit_mark else '')
 
     @staticmethod
     def resolve_length_units(dimension):
@@ -595,7 +944,7 @@ class Units(object, metaclass=SingletonMeta):
 
     @staticmethod
     def to_length_string(length_in_length_units: float, with_unit_mark: bool=False) -> str:
-        return Units.__to_str(length_in_length_units, vs.GetPrefLongInt(162), with_unit_mark, vs.GetPrefString(154))
+        return Units.__to_str(length_in_length_units, 162, with_unit_mark, 154)
 
     @staticmethod
     def to_square_inches(area_in_area_units: float) -> float:
@@ -607,7 +956,7 @@ class Units(object, metaclass=SingletonMeta):
 
     @staticmethod
     def to_area_string(araa_in_area_units: float, with_unit_mark: bool=False) -> str:
-        return Units.__to_str(araa_in_area_units, vs.GetPrefLongInt(179), with_unit_mark, vs.GetPrefString(178))
+        return Units.__to_str(araa_in_area_units, 179, with_unit_mark, 178)
 
     @staticmethod
     def to_cubic_inches(volume_in_volume_units: float) -> float:
@@ -619,11 +968,23 @@ class Units(object, metaclass=SingletonMeta):
 
     @staticmethod
     def to_volume_string(volume_in_volume_units: float, with_unit_mark: bool=False) -> str:
-        return Units.__to_str(volume_in_volume_units, vs.GetPrefLongInt(183), with_unit_mark, vs.GetPrefString(182))
+        return Units.__to_str(volume_in_volume_units, 183, with_unit_mark, 182)
 
     @property
     def length_precision(self) -> int:
-        return vs.GetPrefLongInt(162)
+        return self.__get_preference(162)
+
+
+class ReuseUnitPreferences(AbstractScopedCacheDecorator):
+    """Decorator and context manager to read the unit preferences only once during the decorated function.
+
+    Use it around code that converts many lengths, areas or volumes, like creating objects with many vertices, so that
+    Units doesn't need to ask VW for the preferences on each conversion.
+    """
+
+    @property
+    def _cache(self) -> Units:
+        return Units()
 
 
 class HatchVectorFill(AbstractVectorFill):
@@ -686,7 +1047,213 @@ class ResourceFolder(object):
     DEFAULTS = 14
 
 
+class ResourceConflict(object):
+    """"Constants for what to do when importing a resource of which the name is already used in the document."""
+
+    SKIP = 0     # Don't import the resource.
+    REPLACE = 1  # Replace the resource in the document.
+    RENAME = 2   # Import the resource under another name.
+
+
+class ResourceCatalogueCache(AbstractScopedCache, metaclass=SingletonABCMeta):
+    """Singleton to keep the names in lists of application resources between script runs, and even VW sessions.
+
+    Building a resource list makes VW scan the application folders, and getting the names takes a vs call for each.
+    So the names are saved to a file, together with the path, size and modification time of all files in the folders,
+    and are reused until files are added, removed or changed. Only lists of ResourceLocation.APP are cached, as
+    resources in the document can change at any time. Call invalidate if the cache is out of date anyhow.
+
+    Checking the files of large folders, and reading the cache file, can take a while on network drives. Call prefetch
+    when the plug-in starts, to let that be done on a worker thread, while the plug-in goes on, like showing a dialog.
+    Prefetching is only done while open, see PrefetchResourceCatalogues, as files can change between script runs, so
+    results that weren't used are forgotten at the end of the run that started them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__path = os.path.join(tempfile.gettempdir(), 'dlibrary_resource_catalogues.json')
+        self.__catalogues = None
+        """@type: dict[str, dict]"""
+        self.__fingerprints = dict()
+        """@type: dict[str, list]"""
+        self.__executor = None
+        """@type: ThreadPoolExecutor"""
+        self.__prefetched_content = None
+        """@type: concurrent.futures.Future"""
+        self.__prefetched_fingerprints = dict()
+        """@type: dict[tuple[str], concurrent.futures.Future]"""
+
+    @property
+    def path(self) -> str:
+        """The file the catalogues are saved to, in the temp directory by default."""
+        return self.__path
+
+    @path.setter
+    def path(self, value: str):
+        self.__path = value
+        self.__catalogues = None
+        self.__prefetched_content = None
+
+    @staticmethod
+    def get_key(resource_type: int, location: int, folder: int, path: str) -> str:
+        return '%s|%s|%s|%s' % (resource_type, location, folder, path)
+
+    @staticmethod
+    def get_folder_paths(folder: int, path: str) -> tuple:
+        """Get the application and user folders that are scanned for the resources.
+        :type folder: ResourceFolder
+        :rtype: tuple[str]
+        """
+        folder_paths = (ResourceCatalogueCache.__get_folder_path(folder),
+                        ResourceCatalogueCache.__get_folder_path(-folder))  # Negative for the user folder.
+        return tuple(os.path.join(folder_path, path) for folder_path in folder_paths if folder_path)
+
+    @staticmethod
+    @CorrectVsFilepath()
+    def __get_folder_path(folder: int) -> str:
+        return vs.GetFolderPath(folder)
+
+    @staticmethod
+    def get_fingerprint(folder_paths: tuple) -> list:
+        """Get the path, size and modification time of all files in the folders, without any vs calls.
+        :type folder_paths: tuple[str]
+        :rtype: list[list]
+        """
+        fingerprint = list()
+        for folder_path in folder_paths:
+            for directory, directory_names, file_names in os.walk(folder_path):
+                directory_names.sort()
+                for file_name in sorted(file_names):
+                    file_path = os.path.join(directory, file_name)
+                    try:
+                        stat = os.stat(file_path)
+                    except OSError:
+                        continue  # Removed while walking, so it won't be in the resource list either.
+                    fingerprint.append([file_path, stat.st_size, stat.st_mtime_ns])
+        return fingerprint
+
+    def get(self, resource_type: int, location: int, folder: int, path: str) -> tuple:
+        """Get the names of the resource list, as VW gives them, and the indexes of the hidden ones.
+        :type location: ResourceLocation
+        :type folder: ResourceFolder
+        :returns: None if not cached, or out of date.
+        :rtype: (tuple[str], tuple[int])
+        """
+        folder_paths = self.get_folder_paths(folder, path) if location == ResourceLocation.APP else ()
+        if not folder_paths:  # Without folders, there is nothing to check whether the names are still up to date.
+            return None
+        key = self.get_key(resource_type, location, folder, path)
+        prefetched_fingerprint = self.__prefetched_fingerprints.pop(folder_paths, None)
+        fingerprint = self.__fingerprints[key] = (
+            prefetched_fingerprint.result() if prefetched_fingerprint else self.get_fingerprint(folder_paths))
+        catalogue = self.__load().get(key)
+        if catalogue is None or catalogue['fingerprint'] != fingerprint:
+            return None
+        return tuple(catalogue['names']), tuple(catalogue['hidden'])
+
+    def put(self, resource_type: int, location: int, folder: int, path: str, names: tuple, hidden: tuple):
+        """Save the names of the resource list, as VW gives them, and the indexes of the hidden ones.
+        :type location: ResourceLocation
+        :type folder: ResourceFolder
+        :type names: tuple[str]
+        :type hidden: tuple[int]
+        """
+        key = self.get_key(resource_type, location, folder, path)
+        fingerprint = self.__fingerprints.pop(key, None)
+        if fingerprint is None:
+            folder_paths = self.get_folder_paths(folder, path) if location == ResourceLocation.APP else ()
+            if not folder_paths:
+                return
+            fingerprint = self.get_fingerprint(folder_paths)
+        self.__load()[key] = {'fingerprint': fingerprint, 'names': list(names), 'hidden': list(hidden)}
+        self.__save()
+
+    def invalidate(self, resource_type: int=None, location: int=None, folder: int=None, path: str=None):
+        """Forget the names of the given resource list, or of all resource lists if none is given."""
+        if resource_type is None:
+            self.__catalogues = dict()
+            self.__prefetched_content = None
+        else:
+            self.__load().pop(self.get_key(resource_type, location, folder, path), None)
+        self.__save()
+
+    def _start_scope(self):
+        pass
+
+    def _end_scope(self):
+        # The worker could still be running, but results from now on could be out of date, so they aren't waited for.
+        self.__prefetched_content = None
+        self.__prefetched_fingerprints.clear()
+
+    def prefetch(self, folder: int=ResourceFolder.DEFAULTS, path: str=''):
+        """Start checking the files of the application and user folders, and reading the cache file, on a worker
+        thread. Only the folder paths are asked from VW, as vs calls can only be done on the main thread. The results
+        are used by the next get for the folder while still open, which waits for the worker if it isn't done yet.
+        Nothing is done when not open, as there is no run to use the results in.
+
+        :type folder: ResourceFolder
+        """
+        if not self.is_open:
+            return
+        folder_paths = self.get_folder_paths(folder, path)
+        if not folder_paths:
+            return
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(max_workers=1)
+        if self.__catalogues is None and self.__prefetched_content is None:
+            self.__prefetched_content = self.__executor.submit(self.__read, self.__path)
+        self.__prefetched_fingerprints[folder_paths] = self.__executor.submit(self.get_fingerprint, folder_paths)
+
+    @staticmethod
+    def __read(path: str) -> dict:
+        try:
+            with open(path, 'r', encoding='UTF-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def __load(self) -> dict:
+        if self.__catalogues is None:
+            if self.__prefetched_content is not None:
+                content = self.__prefetched_content.result()
+                self.__prefetched_content = None
+            else:
+                content = self.__read(self.__path)
+            # Another VW version can give other names, for example for its own hidden resources.
+            valid = isinstance(content, dict) and content.get('version') == Vectorworks().version
+            self.__catalogues = content['catalogues'] if valid else dict()
+        return self.__catalogues
+
+    def __save(self):
+        # Not being able to save the cache shouldn't stop the script, it will just be slower the next time.
+        try:
+            with open(self.__path + '.tmp', 'w', encoding='UTF-8') as file:
+                json.dump({'version': Vectorworks().version, 'catalogues': self.__catalogues}, file)
+            os.replace(self.__path + '.tmp', self.__path)  # So other VW sessions never read a half written file.
+        except OSError:
+            pass
+
+
+class PrefetchResourceCatalogues(AbstractScopedCacheDecorator):
+    """Decorator and context manager to use the results of ResourceCatalogueCache.prefetch during the decorated
+    function. Use it on the main function of your plug-in, and call prefetch on the cache it gives at the start.
+    """
+
+    @property
+    def _cache(self) -> ResourceCatalogueCache:
+        return ResourceCatalogueCache()
+
+
 class AbstractResourceList(object, metaclass=ABCMeta):
+    """A list of resources, from the document and/or application folders, by their names.
+
+    The list is only filled when it's first used, and only the names are asked from VW, except for record definitions,
+    for which the handle is needed to leave out those of plug-in objects. Handles are only asked for when needed. The
+    index of each name is kept, so looking up resources by their name doesn't need to search through all names.
+
+    For application resources, the names come from the ResourceCatalogueCache when they are still up to date, in
+    which case the list is only build in VW once it's id or one of its resources is needed.
+    """
 
     def __init__(self, resource_type: int, abstract_resource: callable, location: int=0, folder: int=0, path: str= ''):
         """
@@ -695,22 +1262,84 @@ class AbstractResourceList(object, metaclass=ABCMeta):
         """
         self.__resource_type = resource_type
         self.__abstract_resource = abstract_resource
+        self.__location = location
+        self.__folder = folder
+        self.__path = path
         self.__resource_names = ObservableList()
-        self.__resource_list_id, count = vs.BuildResourceList(resource_type, folder * location, path)
-        resources_to_delete = list()
+        self.__resource_indexes = None
+        """@type: dict[str, int]"""
+        self.__resource_list_id = None
+        self.__catalogue = None
+        """@type: (tuple[str], tuple[int])"""
+
+    def __load(self):
+        if self.__resource_indexes is not None:
+            return
+        self.__catalogue = ResourceCatalogueCache().get(
+            self.__resource_type, self.__location, self.__folder, self.__path)
+        if self.__catalogue is None:
+            self.__build()
+        else:
+            self.__set_names()
+
+    def __build(self):
+        if self.__resource_list_id is not None:
+            return
+        self.__resource_list_id, count = vs.BuildResourceList(
+            self.__resource_type, self.__folder * self.__location, self.__path)
+        if self.__catalogue is None or len(self.__catalogue[0]) != count:  # Not cached, or out of date after all.
+            self.__catalogue = self.__scan(count)
+            ResourceCatalogueCache().put(self.__resource_type, self.__location, self.__folder, self.__path,
+                                         *self.__catalogue)
+            self.__set_names()
+        # Deleting shifts all later resources, so we'll start at the end, to keep the other indexes right.
+        for index in reversed(self.__catalogue[1]):
+            self.__remove_resource(index)
+
+    def __scan(self, count: int) -> tuple:
+        """:rtype: (tuple[str], tuple[int])"""
+        names = list()
+        hidden_indexes = list()
         for index in range(count):
-            handle = self.__get_resource(index)
             name = self.__get_resource_name(index)
+            names.append(name)
             # '__' Indicates a 'hidden' record, mostly __NNA...
-            if name.startswith('__') or (handle is not None and vs.IsPluginFormat(handle)):
-                resources_to_delete.append(index)
-            else:
-                self.__resource_names.append(name)
-        for index in resources_to_delete:
-            self.__remove_resource(index)
+            if name.startswith('__') or (self.__resource_type == ObjectTypeEnum.RECORD_DEFINITION and
+                                         self.__is_plugin_format(index)):
+                hidden_indexes.append(index)
+        return tuple(names), tuple(hidden_indexes)
+
+    def __set_names(self):
+        all_names, hidden_indexes = self.__catalogue
+        hidden_indexes = set(hidden_indexes)
+        names = [name for index, name in enumerate(all_names) if index not in hidden_indexes]
+        if self.__resource_names:  # From an out of date catalogue, so replace them, with only one change event.
+            self.__resource_names.suspend_events()
+            self.__resource_names.clear()
+            self.__resource_names.extend(names)
+            self.__resource_names.resume_events()
+        else:
+            self.__resource_names.extend(names)
+        self.__index_names()
+
+    def __index_names(self, start: int=0):
+        if start == 0:
+            self.__resource_indexes = dict()
+        else:
+            self.__resource_indexes = {name: index for name, index in self.__resource_indexes.items() if index < start}
+        for index in range(start, len(self.__resource_names)):
+            self.__resource_indexes.setdefault(self.__resource_names[index], index)  # First one wins, like list.index.
+
+    def __index(self, name: str, build: bool=False) -> int:
+        self.__load()
+        if build:
+            self.__build()  # Could replace the names, if the catalogue was out of date after all.
+        return self.__resource_indexes.get(name, -1)
 
     @property
     def id(self) -> int:
+        self.__load()
+        self.__build()  # Hidden resources are removed from the VW list, after which the indexes match our names.
         return self.__resource_list_id
 
     @property
@@ -719,29 +1348,58 @@ class AbstractResourceList(object, metaclass=ABCMeta):
 
     @property
     def names(self) -> ObservableList:
+        self.__load()
         return self.__resource_names
 
     def is_resource_in_list(self, name: str) -> bool:
-        index = self.__resource_names.index(name)
-        return index != -1 and (self.__get_resource_name(index) != '-')  # A separator is '-'.
+        index = self.__index(name)
+        return index != -1 and (self.__resource_names[index] != '-')  # A separator is '-'.
 
     def is_resource_in_document(self, name: str) -> bool:
-        index = self.__resource_names.index(name)
-        return index != -1 and self.__get_resource(index)
+        index = self.__index(name, build=True)
+        return index != -1 and self.__get_resource(index) is not None
 
     def get_resource(self, name: str) -> AbstractResource:
-        index = self.__resource_names.index(name)
+        index = self.__index(name, build=True)
         if index == -1:
             return None
         else:
             handle = self.__get_resource(index) or self.__import_resource(index)
-            name = self.__resource_names[index]  # Name could be changed due to import!
             return self.__abstract_resource(handle)
 
+    def import_resources(self, names, conflict: int=ResourceConflict.REPLACE) -> OrderedDict:
+        """Get the resources with the given names, importing all that aren't in the document yet in one pass.
+        Names changed by the import are updated with only one change event, instead of one for each resource.
+
+        :type names: collections.Iterable[str]
+        :param conflict: What to do with resources of which the name is already used in the document.
+        :type conflict: ResourceConflict
+        :returns: The resources by the given names, None for those not in the list or skipped.
+        :rtype: OrderedDict[str, AbstractResource]
+        """
+        self.__load()
+        self.__build()
+        resources = OrderedDict()
+        renamed = dict()
+        for name in names:
+            index = self.__resource_indexes.get(name, -1)
+            if index == -1:
+                resources[name] = None
+                continue
+            handle = self.__get_resource(index)
+            if handle is None:
+                handle = self.__import_resource_only(index, conflict)
+                renamed.update(self.__get_renamed(index))
+            resources[name] = self.__abstract_resource(handle) if handle else None
+        self.__rename_resources(renamed)
+        return resources
+
     def remove_resource(self, name: str):
-        if name in self.names:
-            self.__remove_resource(self.names.index(name))
-            self.names.remove(name)
+        index = self.__index(name, build=True)
+        if index != -1:
+            self.__remove_resource(index)
+            del self.__resource_names[index]
+            self.__index_names(index)
 
     def __get_resource(self, index) -> vs.Handle:
         resource_handle = vs.GetResourceFromList(self.__resource_list_id, index + 1)
@@ -750,11 +1408,37 @@ class AbstractResourceList(object, metaclass=ABCMeta):
     def __get_resource_name(self, index) -> str:
         return vs.GetNameFromResourceList(self.__resource_list_id, index + 1)
 
-    def __import_resource(self, index) -> vs.Handle:
-        handle = vs.ImportResToCurFileN(self.__resource_list_id, index + 1, lambda s: 1)  # 1 >> Replace if needed!
-        self.__resource_names[index] = vs.GetActualNameFromResourceList(self.__resource_list_id, index + 1)
+    def __is_plugin_format(self, index) -> bool:
+        handle = self.__get_resource(index)
+        return handle is not None and vs.IsPluginFormat(handle)
+
+    def __import_resource(self, index, conflict: int=ResourceConflict.REPLACE) -> vs.Handle:
+        """
+        :type conflict: ResourceConflict
+        """
+        handle = self.__import_resource_only(index, conflict)
+        self.__rename_resources(self.__get_renamed(index))  # Name could be changed due to import!
         return handle
 
+    def __import_resource_only(self, index, conflict: int) -> vs.Handle:
+        return vs.ImportResToCurFileN(self.__resource_list_id, index + 1, lambda s: conflict)
+
+    def __get_renamed(self, index) -> dict:
+        """:rtype: dict[int, str]"""
+        name = vs.GetActualNameFromResourceList(self.__resource_list_id, index + 1)
+        return {index: name} if name != self.__resource_names[index] else {}
+
+    def __rename_resources(self, names: dict):
+        """Rename the resources, with only one change event for all of them.
+        :type names: dict[int, str]
+        """
+        for index, name in names.items():
+            old_name = self.__resource_names[index]
+            if self.__resource_indexes.get(old_name) == index:
+                del self.__resource_indexes[old_name]
+            self.__resource_indexes.setdefault(name, index)
+        self.__resource_names.set_items(names)
+
     def __remove_resource(self, index):
         vs.DeleteResourceFromList(self.__resource_list_id, index + 1)
 
@@ -812,6 +1496,7 @@ class RecordDefinition(AbstractResource):
         if vs.GetObject(name) is None:
             vs.NewField(name, 'placeholder', '', 4, 0)
             vs.SetObjectVariableBoolean(vs.GetObject(name), 900, False)
+            RecordSchemaRepository().invalidate(name)
         return RecordDefinition(vs.GetObject(name))
 
     def __init__(self, handle_or_name):
@@ -819,11 +1504,14 @@ class RecordDefinition(AbstractResource):
         :type handle_or_name: vs.Handle | str
         """
         super().__init__(handle_or_name)
-        self.__fields = ObservableList(vs.GetFldName(self.handle, index)
-                                       for index in range(1, vs.NumFields(self.handle) + 1))
+        self.__fields = None
 
     @property
     def fields(self) -> ObservableList:
+        """The field names, which are only gathered when asked for, from the schema, see RecordSchemaRepository."""
+        if self.__fields is None:
+            schema = RecordSchemaRepository().get(self.name) if self.handle is not None else None
+            self.__fields = ObservableList(schema.field_names if schema is not None else ())
         return self.__fields
 
 
@@ -0,0 +1,154 @@
+"""Module for exporting document data, like record values, to files for use outside of VW.
+"""
+import csv
+import itertools
+import json
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+
+from dlibrary.criteria import Criteria
+from dlibrary.document import RecordDefinition, RecordTable, RecordField
+from dlibrary.object_base import RecordSchemaRepository
+
+
+class RecordExporter(object):
+    """Streams the values of a record, for many objects, to a CSV or a columnar file, with typed columns.
+
+    The values are converted like RecordField does, so numbers will be numbers and booleans will be booleans. Objects
+    are read and written in chunks, so memory use doesn't grow with the number of objects.
+
+    The columnar file starts with a magic line, followed by a JSON header line with the fields and their types. Then
+    the chunks follow, each starting with their row count as unsigned 32-bit integer, followed by their columns in
+    field order. Integers are 64-bit, floats are doubles, booleans are bytes. Text columns are the byte length of
+    their UTF-8 encoded values as unsigned 32-bit integers, followed by the values themselves. All numbers are
+    little-endian, whatever the platform, so files can be read anywhere.
+    """
+
+    COLUMNAR_MAGIC = b'DLIBRARY-COLUMNS-1\n'
+
+    __TYPE_NAMES = {int: 'int', float: 'float', bool: 'bool', str: 'str'}
+    __TYPE_CODES = {'int': 'q', 'float': 'd', 'bool': 'b'}
+    __CHUNK_HEADER = struct.Struct('<I')
+    # Not an array for the text lengths, as the size of its unsigned integers depends on the platform.
+    __TEXT_LENGTHS = '<%sI'
+    # Arrays use the byte order of the platform, which has to be swapped for ours on big-endian ones.
+    __SWAP = sys.byteorder != 'little'
+
+    def __init__(self, definition: RecordDefinition, field_names=None, chunk_size: int=1000):
+        """
+        :param field_names: Only export these fields, in this order, instead of all of them.
+        :type field_names: collections.Iterable[str]
+        :raises ValueError: If there is no such record definition, or it has no field with one of the names.
+        """
+        self.__definition = definition
+        self.__table = RecordTable(definition)
+        self.__field_names = self.__table.check_field_names(field_names)
+        schema = RecordSchemaRepository().get(definition.name)
+        self.__field_types = tuple(self.__TYPE_NAMES[RecordField.get_value_type(
+            schema.get_field(name).type, schema.parametric)] for name in self.__field_names)
+        self.__chunk_size = chunk_size
+
+    @property
+    def field_names(self) -> tuple:
+        """:rtype: tuple[str]"""
+        return self.__field_names
+
+    @property
+    def field_types(self) -> tuple:
+        """:returns: The type name of the values for each field, 'int', 'float', 'bool' or 'str'.
+        :rtype: tuple[str]
+        """
+        return self.__field_types
+
+    def __get_chunks(self, objects):
+        """
+        :type objects: Criteria | collections.Iterable[AbstractKeyedObject | vs.Handle]
+        :rtype: collections.Iterator[list[tuple]]
+        """
+        if objects is None:
+            objects = Criteria().has_record(self.__definition)
+        if isinstance(objects, Criteria):
+            objects = objects.compile().get_handles()  # No need for wrappers, handles will do.
+        rows = self.__table.read_rows(objects, self.__field_names)
+        chunk = list(itertools.islice(rows, self.__chunk_size))
+        while chunk:
+            yield chunk
+            chunk = list(itertools.islice(rows, self.__chunk_size))
+
+    def write_csv(self, path: str, objects=None) -> int:
+        """Export the values, with the field names as first row.
+        :param objects: The objects to export, defaults to all objects with the record.
+        :type objects: Criteria | collections.Iterable[AbstractKeyedObject | vs.Handle]
+        :returns: The number of exported objects.
+        """
+        count = 0
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(self.__field_names)
+            for chunk in self.__get_chunks(objects):
+                writer.writerows(chunk)
+                count += len(chunk)
+        return count
+
+    def write_columnar(self, path: str, objects=None) -> int:
+        """Export the values in our columnar file format, see the class documentation.
+        :param objects: The objects to export, defaults to all objects with the record.
+        :type objects: Criteria | collections.Iterable[AbstractKeyedObject | vs.Handle]
+        :returns: The number of exported objects.
+        """
+        count = 0
+        with open(path, 'wb') as file:
+            file.write(self.COLUMNAR_MAGIC)
+            file.write(json.dumps({'fields': [OrderedDict((('name', name), ('type', field_type)))
+                                              for name, field_type in zip(self.__field_names, self.__field_types)]
+                                   }).encode('utf-8') + b'\n')
+            for chunk in self.__get_chunks(objects):
+                file.write(self.__CHUNK_HEADER.pack(len(chunk)))
+                for column, field_type in zip(zip(*chunk), self.__field_types):
+                    if field_type == 'str':
+                        values = [value.encode('utf-8') for value in column]
+                        file.write(struct.pack(self.__TEXT_LENGTHS % len(values), *(len(value) for value in values)))
+                        file.write(b''.join(values))
+                    else:
+                        file.write(self.__to_bytes(array(self.__TYPE_CODES[field_type], column)))
+                count += len(chunk)
+        return count
+
+    @staticmethod
+    def __to_bytes(values: array) -> bytes:
+        if RecordExporter.__SWAP:
+            values.byteswap()
+        return values.tobytes()
+
+    @staticmethod
+    def read_columnar(path: str):
+        """Read a file written by write_columnar, chunk by chunk, to keep memory use as low as when writing.
+        :returns: The columns of each chunk, by field name.
+        :rtype: collections.Iterator[OrderedDict[str, list]]
+        """
+        type_codes, chunk_header = RecordExporter.__TYPE_CODES, RecordExporter.__CHUNK_HEADER
+        with open(path, 'rb') as file:
+            if file.readline() != RecordExporter.COLUMNAR_MAGIC:
+                raise ValueError('Not a dlibrary columnar file: %s' % path)
+            header = json.loads(file.readline().decode('utf-8'))
+            while True:
+                data = file.read(chunk_header.size)
+                if len(data) < chunk_header.size:
+                    break
+                row_count = chunk_header.unpack(data)[0]
+                columns = OrderedDict()
+                for field in header['fields']:
+                    if field['type'] == 'str':
+                        lengths = struct.Struct(RecordExporter.__TEXT_LENGTHS % row_count)
+                        columns[field['name']] = [file.read(length).decode('utf-8')
+                                                  for length in lengths.unpack(file.read(lengths.size))]
+                    else:
+                        values = array(type_codes[field['type']])
+                        values.frombytes(file.read(row_count * values.itemsize))
+                        if RecordExporter.__SWAP:
+                            values.byteswap()
+                        columns[field['name']] = [value != 0 for value in values] if field['type'] == 'bool' \
+                            else values.tolist()
+                yield columns
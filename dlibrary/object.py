@@ -1,12 +1,15 @@
 """Used for all object related stuff, except for plug-in objects.
 """
+import itertools
+import numbers
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 
 from dlibrary.document import Layer, Units, Clazz, IAttributes, AbstractVectorFill, SymbolDefinition, \
-    DataFieldTypeEnum, PioFieldTypeEnum, IRecords
+    DataFieldTypeEnum, PioFieldTypeEnum, IRecords, ReuseUnitPreferences
 from dlibrary.object_base import AbstractKeyedObject, ObjectRepository
-from dlibrary.utility import VSException, Convert
+from dlibrary.utility import VSException, Convert, Event, SingletonABCMeta, AbstractScopedCache, \
+    AbstractScopedCacheDecorator
 import vs
 
 
@@ -80,13 +83,28 @@ class IObjectOrder(IObjectHandle, metaclass=ABCMeta):
         self.__move_backward(True)
 
     def __move_forward(self, to_front: bool, count: int=1):
-        for i in range(0, count):
+        to_front = to_front or self.__has_less_than(vs.NextObj, count)
+        for i in range(0, 1 if to_front else count):
             vs.HMoveForward(self._object_handle, to_front)
 
     def __move_backward(self, to_back: bool, count: int=1):
-        for i in range(0, count):
+        to_back = to_back or self.__has_less_than(vs.PrevObj, count)
+        for i in range(0, 1 if to_back else count):
             vs.HMoveBackward(self._object_handle, to_back)
 
+    def __has_less_than(self, get_neighbour: callable, count: int) -> bool:
+        """Whether there are less than count objects in the direction, so one move to the front or back is enough.
+        Walking over the objects is cheaper than moving, which changes the document each time.
+        """
+        if count <= 1:
+            return False
+        handle = self._object_handle
+        for i in range(0, count):
+            handle = get_neighbour(handle)
+            if handle is None:
+                return True
+        return False
+
 
 class Attributes(AbstractKeyedObject):
     """We will use the object handle to get/set the attributes for it.
@@ -120,22 +138,268 @@ class Attributes(AbstractKeyedObject):
 
     def __set_not_by_clazz(self):
         """We'll just 'undo' by class by setting the attributes it had from the class."""
-        vs.SetLSN(self.handle, vs.GetLSN(self.handle))
-        vs.SetLW(self.handle, vs.GetLW(self.handle))
-        vs.SetPenFore(self.handle, vs.GetPenFore(self.handle))
-        vs.SetPenBack(self.handle, vs.GetPenBack(self.handle))
-        vs.SetFillFore(self.handle, vs.GetFillFore(self.handle))
-        vs.SetFillBack(self.handle, vs.GetFillBack(self.handle))
-        vs.SetFPat(self.handle, vs.GetFPat(self.handle))
-        vs.SetOpacity(self.handle, vs.GetOpacity(self.handle))
-        ok, style, angle, size, width, thickness_basis, thickness, visibility = vs.GetObjBeginningMarker(self.handle)
-        vs.SetObjBeginningMarker(self.handle, style, angle, size, width, thickness_basis, thickness, visibility)
-        ok, style, angle, size, width, thickness_basis, thickness, visibility = vs.GetObjEndMarker(self.handle)
-        vs.SetObjEndMarker(self.handle, style, angle, size, width, thickness_basis, thickness, visibility)
+        AttributesSnapshot.read(self.handle, with_by_clazz=False).write(self.handle)
+
+    def snapshot(self):
+        """Get all attributes at once, to compare them or to apply them to other objects.
+        :rtype: AttributesSnapshot
+        """
+        return AttributesSnapshot.read(self.handle)
+
+    def apply(self, snapshot):
+        """Makes the attributes the same as those of the snapshot, only changing those that differ.
+        :type snapshot: AttributesSnapshot
+        """
+        snapshot.apply_to((self,))
+
+
+class AttributesSnapshot(object):
+    """All attributes of an object, read at once, to compare them or to apply them to other objects.
+    """
+
+    __slots__ = ('__values', '__by_clazz')
+
+    # Getters and setters for the values, in the same order. Lambdas, so vs is only looked up when called.
+    __ACCESSORS = (
+        (lambda h: vs.GetLSN(h), lambda h, v: vs.SetLSN(h, v)),
+        (lambda h: vs.GetLW(h), lambda h, v: vs.SetLW(h, v)),
+        (lambda h: vs.GetPenFore(h), lambda h, v: vs.SetPenFore(h, v)),
+        (lambda h: vs.GetPenBack(h), lambda h, v: vs.SetPenBack(h, v)),
+        (lambda h: vs.GetFillFore(h), lambda h, v: vs.SetFillFore(h, v)),
+        (lambda h: vs.GetFillBack(h), lambda h, v: vs.SetFillBack(h, v)),
+        (lambda h: vs.GetFPat(h), lambda h, v: vs.SetFPat(h, v)),
+        (lambda h: vs.GetOpacity(h), lambda h, v: vs.SetOpacity(h, v)),
+        (lambda h: tuple(vs.GetObjBeginningMarker(h)[1:]), lambda h, v: vs.SetObjBeginningMarker(h, *v)),
+        (lambda h: tuple(vs.GetObjEndMarker(h)[1:]), lambda h, v: vs.SetObjEndMarker(h, *v)))
+
+    @staticmethod
+    def read(handle: vs.Handle, with_by_clazz: bool=True):
+        """
+        :param with_by_clazz: Leave out whether the attributes are by class, which takes seven vs calls.
+        :rtype: AttributesSnapshot
+        """
+        return AttributesSnapshot(tuple(get(handle) for get, _ in AttributesSnapshot.__ACCESSORS),
+                                  Attributes(handle).by_clazz if with_by_clazz else False)
+
+    def __init__(self, values: tuple, by_clazz: bool):
+        """
+        :param values: Line style, line weight, pen fore and back color, fill fore and back color, fill pattern,
+                       opacity, beginning marker and end marker, as VW gives them.
+        """
+        self.__values = tuple(values)
+        self.__by_clazz = bool(by_clazz)
+
+    @property
+    def values(self) -> tuple:
+        return self.__values
+
+    @property
+    def by_clazz(self) -> bool:
+        return self.__by_clazz
+
+    @property
+    def line_style(self) -> int:
+        return self.__values[0]
+
+    @property
+    def line_weight(self) -> int:
+        return self.__values[1]
+
+    @property
+    def pen_fore(self) -> tuple:
+        return self.__values[2]
+
+    @property
+    def pen_back(self) -> tuple:
+        return self.__values[3]
+
+    @property
+    def fill_fore(self) -> tuple:
+        return self.__values[4]
+
+    @property
+    def fill_back(self) -> tuple:
+        return self.__values[5]
+
+    @property
+    def fill_pattern(self) -> int:
+        return self.__values[6]
+
+    @property
+    def opacity(self) -> int:
+        return self.__values[7]
+
+    @property
+    def beginning_marker(self) -> tuple:
+        """:returns: style, angle, size, width, thickness basis, thickness and visibility."""
+        return self.__values[8]
+
+    @property
+    def end_marker(self) -> tuple:
+        """:returns: style, angle, size, width, thickness basis, thickness and visibility."""
+        return self.__values[9]
+
+    def diff(self, other) -> tuple:
+        """Get the indexes of the values that differ from the other snapshot.
+        :type other: AttributesSnapshot
+        :rtype: tuple[int]
+        """
+        return tuple(i for i, (mine, theirs) in enumerate(zip(self.__values, other.values)) if mine != theirs)
+
+    def write(self, handle: vs.Handle, indexes=None):
+        """Write the values, or only those with the given indexes, which also makes them no longer by class.
+        :type indexes: collections.Iterable[int]
+        """
+        for index in range(len(self.__values)) if indexes is None else indexes:
+            self.__ACCESSORS[index][1](handle, self.__values[index])
+
+    def apply_to(self, objects) -> int:
+        """Makes the attributes of all objects the same as those of the snapshot, only changing those that differ.
+        Objects that have only some of their attributes by class can keep those by class if the values are the same.
+        :type objects: collections.Iterable[AbstractKeyedObject]
+        :returns: The number of objects that were changed.
+        """
+        changed = 0
+        for keyed_object in objects:
+            handle = keyed_object.handle
+            if self.__by_clazz:
+                attributes = Attributes(handle)
+                if not attributes.by_clazz:
+                    attributes.by_clazz = True
+                    changed += 1
+            else:
+                current = AttributesSnapshot.read(handle)
+                indexes = None if current.by_clazz else self.diff(current)
+                if indexes is None or indexes:
+                    self.write(handle, indexes)
+                    changed += 1
+        return changed
+
+    def __eq__(self, other):
+        return isinstance(other, AttributesSnapshot) and self.__by_clazz == other.by_clazz and \
+            self.__values == other.values
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.__values, self.__by_clazz))
+
+
+class BoundingBox(object):
+    """The bounding box of an object, as VW gives it at once, so all sides can be read without asking VW again.
+    """
+
+    __slots__ = ('__top', '__left', '__right', '__bottom')
+
+    def __init__(self, top_left: tuple, bottom_right: tuple):
+        """
+        :type top_left: (float, float)
+        :type bottom_right: (float, float)
+        """
+        self.__left, self.__top = top_left
+        self.__right, self.__bottom = bottom_right
+
+    @property
+    def top(self) -> float:
+        return self.__top
+
+    @property
+    def left(self) -> float:
+        return self.__left
+
+    @property
+    def right(self) -> float:
+        return self.__right
+
+    @property
+    def bottom(self) -> float:
+        return self.__bottom
+
+    @property
+    def width(self) -> float:
+        return self.__right - self.__left
+
+    @property
+    def height(self) -> float:
+        return self.__top - self.__bottom
+
+    @property
+    def top_left(self) -> tuple:
+        """:rtype: (float, float)"""
+        return self.__left, self.__top
+
+    @property
+    def bottom_right(self) -> tuple:
+        """:rtype: (float, float)"""
+        return self.__right, self.__bottom
+
+    def __eq__(self, other):
+        return isinstance(other, BoundingBox) and self.top_left == other.top_left and \
+            self.bottom_right == other.bottom_right
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.top_left, self.bottom_right))
+
+
+class ResetQueue(AbstractScopedCache, metaclass=SingletonABCMeta):
+    """Singleton to collect the objects that need a reset while resets are deferred, see DeferredReset.
+    The resets are done when the scope ends, so at the last close.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__objects = None
+        """@type: OrderedDict[AbstractObject, (bool, bool)]"""
+
+    def add(self, drawn_object, bbox_only: bool) -> bool:
+        """Remember the object for a reset later on, which is only possible while resets are deferred.
+        :type drawn_object: AbstractObject
+        :returns: False if resets aren't deferred, so the reset has to be done now.
+        """
+        if self.__objects is None:
+            return False
+        bbox, full = self.__objects.get(drawn_object, (False, False))
+        self.__objects[drawn_object] = (bbox or bbox_only, full or not bbox_only)
+        return True
+
+    def _start_scope(self):
+        self.__objects = OrderedDict()
+
+    def _end_scope(self):
+        objects, self.__objects = self.__objects, None
+        for drawn_object, (bbox, full) in objects.items():
+            drawn_object._reset_now(bbox, full)
+
+
+class DeferredReset(AbstractScopedCacheDecorator):
+    """Decorator and context manager to reset changed objects only once, when leaving the decorated function.
+
+    Setters that need a reset, like those for the scale of a symbol, will otherwise do one each time, while resetting
+    parametric objects is one of the most expensive things VW does. Be aware that until the reset, VW doesn't reflect
+    the changes yet, so the bounding box, for example, isn't up to date.
+    """
+
+    @property
+    def _cache(self) -> ResetQueue:
+        return ResetQueue()
 
 
 class AbstractObject(AbstractKeyedObject, IObjectAttributes, IRecords, IObjectOrder, metaclass=ABCMeta):
 
+    bounds_changed_event = Event()
+    """Raised with the object after it's moved, rotated, resized or reset through these wrappers, for all objects."""
+
+    def __init__(self, handle_or_name):
+        """
+        :type handle_or_name: vs.Handle | str
+        """
+        super().__init__(handle_or_name)
+        self.__bbox = None
+
     @property
     def layer(self) -> Layer:
         return Layer.get(vs.GetLayer(self.handle))
@@ -152,31 +416,38 @@ class AbstractObject(AbstractKeyedObject, IObjectAttributes, IRecords, IObjectOr
     def attributes(self):
         return Attributes(self.handle)
 
+    @property
+    def bbox(self) -> BoundingBox:
+        """The bounding box is kept until the object is changed through this wrapper, see _bounds_changed.
+        Changes done through other wrappers, or directly through vs calls, aren't noticed by this one!
+        """
+        if self.__bbox is None:
+            self.__bbox = BoundingBox(*vs.GetBBox(self.handle))
+        return self.__bbox
+
     @property
     def bb_top(self) -> float:
-        return vs.GetBBox(self.handle)[0][1]
+        return self.bbox.top
 
     @property
     def bb_left(self) -> float:
-        return vs.GetBBox(self.handle)[0][0]
+        return self.bbox.left
 
     @property
     def bb_right(self) -> float:
-        return vs.GetBBox(self.handle)[1][0]
+        return self.bbox.right
 
     @property
     def bb_bottom(self) -> float:
-        return vs.GetBBox(self.handle)[1][1]
+        return self.bbox.bottom
 
     @property
     def bb_width(self) -> float:
-        top_left, bottom_right = vs.GetBBox(self.handle)
-        return bottom_right[0] - top_left[0]
+        return self.bbox.width
 
     @property
     def bb_height(self) -> float:
-        top_left, bottom_right = vs.GetBBox(self.handle)
-        return top_left[1] - bottom_right[1]
+        return self.bbox.height
 
     @property
     def _object_handle(self) -> vs.Handle:
@@ -184,21 +455,101 @@ class AbstractObject(AbstractKeyedObject, IObjectAttributes, IRecords, IObjectOr
 
     def move(self, delta_x: float, delta_y: float):
         vs.HMove(self.handle, delta_x, delta_y)
+        self._bounds_changed()
 
     def rotate(self, angle: float, origin: tuple=None):
         """Will rotate the object around it's own center point, relative to the drawing, not the plug-in!
         :type origin: (float, float)
         """
         vs.HRotate(self.handle, origin or vs.Get2DPt(self.handle, 0), angle)
+        self._bounds_changed()
+
+    def _bounds_changed(self):
+        self.__bbox = None
+        AbstractObject.bounds_changed_event.raise_event(self)
 
     def reset(self):
-        vs.ResetObject(self.handle)
+        """Will be done when leaving the outermost DeferredReset block, if in one."""
+        self._reset()
+
+    def _reset(self, bbox_only: bool=False):
+        """Resets the object, or only it's bounding box, unless resets are deferred, see DeferredReset."""
+        if not ResetQueue().add(self, bbox_only):
+            self._reset_now(bbox_only, not bbox_only)
+
+    def _reset_now(self, bbox: bool, full: bool):
+        if bbox:
+            vs.ResetBBox(self.handle)
+        if full:
+            vs.ResetObject(self.handle)
+        self._bounds_changed()
 
     @property
     def _handle(self) -> vs.Handle:
         return self.handle
 
 
+class BatchTransform(object):
+    """Transforms many objects in one pass, like after calculating a new layout for all of them.
+    Values can be given as a sequence with one value per object, like the arrays of GeometryArrays, or as one value for
+    all objects. Transforms that do nothing are skipped, and objects that are given more than once are only transformed
+    once, by their combined values, where this gives the same result.
+    """
+
+    @staticmethod
+    def __get_values(values, count: int):
+        return itertools.repeat(values, count) if isinstance(values, numbers.Number) else values
+
+    @staticmethod
+    def move(objects, deltas_x, deltas_y):
+        """
+        :type objects: collections.Sequence[AbstractObject]
+        :type deltas_x: float | collections.Sequence[float]
+        :type deltas_y: float | collections.Sequence[float]
+        """
+        deltas = OrderedDict()
+        for drawn_object, delta_x, delta_y in zip(objects, BatchTransform.__get_values(deltas_x, len(objects)),
+                                                  BatchTransform.__get_values(deltas_y, len(objects))):
+            total_x, total_y = deltas.get(drawn_object, (0, 0))
+            deltas[drawn_object] = (total_x + delta_x, total_y + delta_y)
+        for drawn_object, (delta_x, delta_y) in deltas.items():
+            if delta_x != 0 or delta_y != 0:
+                drawn_object.move(delta_x, delta_y)
+
+    @staticmethod
+    def rotate(objects, angles, origins=None):
+        """Rotations around different points don't add up, so all are done, in order, except full turns.
+        :type objects: collections.Sequence[AbstractObject]
+        :type angles: float | collections.Sequence[float]
+        :param origins: The points to rotate around, per object, defaults to the object's own center point.
+        :type origins: collections.Sequence[(float, float)]
+        """
+        for drawn_object, angle, origin in zip(objects, BatchTransform.__get_values(angles, len(objects)),
+                                               origins or itertools.repeat(None, len(objects))):
+            if angle % 360 != 0:
+                drawn_object.rotate(angle, origin)
+
+    @staticmethod
+    def move_in_stacking_order(objects, counts):
+        """
+        :type objects: collections.Sequence[IObjectOrder]
+        :param counts: Positive to move forward, negative to move backward.
+        :type counts: int | collections.Sequence[int]
+        """
+        # The order of moves of different objects matters, so only repeated moves of the same object are combined.
+        totals = []
+        for drawn_object, count in zip(objects, BatchTransform.__get_values(counts, len(objects))):
+            if totals and totals[-1][0] == drawn_object:
+                totals[-1][1] += int(count)
+            else:
+                totals.append([drawn_object, int(count)])
+        for drawn_object, count in totals:
+            if count > 0:
+                drawn_object.move_forward(count)
+            elif count < 0:
+                drawn_object.move_backward(-count)
+
+
 class PluginObject(AbstractObject):
     """Wrapper for custom plugin objects."""
 
@@ -291,6 +642,7 @@ class Text(AbstractObject):
     def horizontal_alignment(self, value: int):
         """:type value: TextHorizontalAlignmentEnum"""
         vs.SetTextJustN(self.handle, value)
+        self._bounds_changed()
 
     @property
     def vertical_alignment(self) -> int:
@@ -301,6 +653,7 @@ class Text(AbstractObject):
     def vertical_alignment(self, value: int):
         """:type value: TextVerticalAlignmentEnum"""
         vs.SetTextVertAlignN(self.handle, value)
+        self._bounds_changed()
 
     @property
     def font_size(self) -> int:
@@ -309,6 +662,7 @@ class Text(AbstractObject):
     @font_size.setter
     def font_size(self, value: int):
         vs.SetTextSize(self.handle, 0, vs.GetTextLength(self.handle), value)
+        self._bounds_changed()
 
 
 class Line(AbstractObject):
@@ -377,7 +731,7 @@ class Rectangle(AbstractObject):
     def width(self, value):
         """:type value: float | str"""
         vs.SetWidth(self.handle, Units.resolve_length_units(value))
-        vs.ResetBBox(self.handle)  # Needed, or the object doesn't reflect the change!
+        self._reset(bbox_only=True)  # Needed, or the object doesn't reflect the change!
 
     @property
     def height(self) -> float:
@@ -387,7 +741,7 @@ class Rectangle(AbstractObject):
     def height(self, value):
         """:type value: float | str"""
         vs.SetHeight(self.handle, Units.resolve_length_units(value))
-        vs.ResetBBox(self.handle)  # Needed, or the object doesn't reflect the change!
+        self._reset(bbox_only=True)  # Needed, or the object doesn't reflect the change!
 
     @property
     def center(self) -> tuple:
@@ -403,7 +757,8 @@ class Polygon(AbstractObject):
         :type vertices: tuple[tuple[x: float|str, y: float|str]]
         """
         vs.ClosePoly() if closed else vs.OpenPoly()
-        vs.Poly(*[Units.to_length_units(c) if isinstance(c, str) else c for vertex in vertices for c in vertex])
+        with ReuseUnitPreferences():  # Many vertices would otherwise read the same unit preferences over and over.
+            vs.Poly(*[Units.to_length_units(c) if isinstance(c, str) else c for vertex in vertices for c in vertex])
         return Polygon(vs.LNewObj())
 
     def __init__(self, handle: vs.Handle):
@@ -465,6 +820,7 @@ class Symbol(AbstractObject):
     def scaling(self, value: int):
         """:type value: SymbolScalingEnum"""
         vs.SetObjectVariableInt(self.handle, 101, value)
+        self._bounds_changed()  # Switching between symmetric and asymmetric scaling changes the size.
 
     @property
     def __asymmetric_scaling(self) -> bool:
@@ -477,7 +833,7 @@ class Symbol(AbstractObject):
     @scale_x.setter
     def scale_x(self, value: float):
         vs.SetObjectVariableReal(self.handle, 102, value)
-        vs.ResetObject(self.handle)
+        self._reset()
 
     @property
     def scale_y(self) -> float:
@@ -487,7 +843,7 @@ class Symbol(AbstractObject):
     def scale_y(self, value: float):
         if self.__asymmetric_scaling:
             vs.SetObjectVariableReal(self.handle, 103, value)
-            vs.ResetObject(self.handle)
+            self._reset()
         else:
             self.scale_x = value
 
@@ -499,7 +855,7 @@ class Symbol(AbstractObject):
     def scale_z(self, value: float):
         if self.__asymmetric_scaling:
             vs.SetObjectVariableReal(self.handle, 104, value)
-            vs.ResetObject(self.handle)
+            self._reset()
         else:
             self.scale_x = value
 
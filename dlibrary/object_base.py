@@ -1,7 +1,7 @@
 """Used for all base stuff concerning objects, which are also resources, class definitions, etc....
 """
 from abc import ABCMeta
-from dlibrary.utility import SingletonMeta
+from dlibrary.utility import SingletonMeta, SingletonABCMeta, AbstractScopedCache, AbstractScopedCacheDecorator
 import vs
 
 
@@ -47,6 +47,9 @@ class AbstractKeyedObject(object, metaclass=ABCMeta):
         # The name can be changed during script execution, the handle can't!
         # So we only save the handle, gotten by the parameter, or found by it's name!
         self.__handle = handle_or_name if not isinstance(handle_or_name, str) else vs.GetObject(handle_or_name)
+        # As the handle can't change, neither can the hash, so we only have to calculate it once.
+        # The Handle class isn't hashable, so we'll use the string representation instead.
+        self.__hash = hash(str(self.__handle))
 
     @property
     def handle(self) -> vs.Handle:
@@ -59,9 +62,8 @@ class AbstractKeyedObject(object, metaclass=ABCMeta):
 
     def __hash__(self):
         """We need to override this, as we have custom object equality implemented!
-        The Handle class isn't hashable, so we'll use the string representation instead.
         """
-        return hash(str(self.handle))
+        return self.__hash
 
     def __eq__(self, other):
         """Two objects are the same if they are from the same type and both have the same handle.
@@ -73,14 +75,22 @@ class AbstractKeyedObject(object, metaclass=ABCMeta):
         return not self.__eq__(other)
 
 
-class ObjectRepository(object, metaclass=SingletonMeta):
+class ObjectRepository(AbstractScopedCache, metaclass=SingletonABCMeta):
     """Singleton to get our objects (wrappers) based on the handle or name, which are identifiers for VW.
     To work more easily with all objects in VW, we have specialized classes as kind of wrappers for the vs calls that
     can be done about the object. For easy retrieval, we have this factory, as we don't always know the type.
+
+    While open, see ReuseObjectWrappers, an identity map returns the same wrapper for the same handle, without asking
+    VW for the type again.
     """
 
+    __MISSING = object()
+
     def __init__(self):
+        super().__init__()
         self.__constructors = dict()
+        self.__identity_map = None
+        """@type: dict[str, AbstractKeyedObject]"""
 
     def register(self, object_type: int, constructor):
         """Register an object constructor method, so it can be created and returned in the get method.
@@ -97,6 +107,182 @@ class ObjectRepository(object, metaclass=SingletonMeta):
         :type handle_or_name: vs.Handle | str
         :rtype: T <= AbstractKeyedObject
         """
+        if self.__identity_map is None:
+            return self.__create(handle_or_name)
+        handle = vs.GetObject(handle_or_name) if isinstance(handle_or_name, str) else handle_or_name
+        if handle is None:
+            return None
+        # The Handle class isn't hashable, so we'll use the string representation instead.
+        key = str(handle)
+        wrapper = self.__identity_map.get(key, self.__MISSING)
+        if wrapper is self.__MISSING:
+            wrapper = self.__identity_map[key] = self.__create(handle)
+        return wrapper
+
+    def __create(self, handle_or_name):
         return self.__constructors.get(ObjectTypeEnum.get(handle_or_name), lambda h_o_n: None)(handle_or_name)
 
+    def _start_scope(self):
+        self.__identity_map = dict()
+
+    def _end_scope(self):
+        self.__identity_map = None
+
+    def invalidate(self, handle_or_name=None):
+        """Forget the wrapper for the given handle or name, or all wrappers if none is given.
+        Needed when objects are deleted, or another document becomes active, while the identity map is open.
+
+        :type handle_or_name: vs.Handle | str
+        """
+        if self.__identity_map is not None:
+            if handle_or_name is None:
+                self.__identity_map.clear()
+            else:
+                handle = vs.GetObject(handle_or_name) if isinstance(handle_or_name, str) else handle_or_name
+                if handle is not None:
+                    self.__identity_map.pop(str(handle), None)
+
+
+class ReuseObjectWrappers(AbstractScopedCacheDecorator):
+    """Decorator and context manager to reuse the same wrapper for the same handle during the decorated function.
+
+    Use it on the main function of your plug-in, or around code that resolves the same objects or resources many
+    times, so that ObjectRepository doesn't need to ask VW for the type and create a new wrapper on each lookup.
+    """
+
+    @property
+    def _cache(self) -> ObjectRepository:
+        return ObjectRepository()
+
+
+class RecordFieldSchema(object):
+    """The metadata of a record field, which doesn't change while scripts run.
+    """
+
+    __slots__ = ('__index', '__name', '__type', '__converter')
+
+    def __init__(self, index: int, name: str, field_type: int, converter: callable):
+        self.__index = index
+        self.__name = name
+        self.__type = field_type
+        self.__converter = converter
+
+    @property
+    def index(self) -> int:
+        """1-n based, just like VW."""
+        return self.__index
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def type(self) -> int:
+        """:rtype: DataFieldTypeEnum | PioFieldTypeEnum"""
+        return self.__type
+
+    @property
+    def converter(self) -> callable:
+        """Converts the string value VW gives for the field to a Python value, see RecordField.get_converter.
+        :rtype: (str) -> str | int | bool | float
+        """
+        return self.__converter
+
+
+class RecordSchema(object):
+    """The metadata of all fields of a record definition, see RecordSchemaRepository.
+    """
+
+    def __init__(self, name: str, handle: vs.Handle, parametric: bool, fields: tuple):
+        """
+        :type fields: tuple[RecordFieldSchema]
+        """
+        self.__name = name
+        self.__handle_key = str(handle)
+        self.__parametric = parametric
+        self.__fields = fields
+        self.__fields_by_name = {field.name: field for field in fields}
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def parametric(self) -> bool:
+        """Whether it's the record of a plug-in object, which has other field types, see PioFieldTypeEnum."""
+        return self.__parametric
+
+    @property
+    def fields(self) -> tuple:
+        """:rtype: tuple[RecordFieldSchema]"""
+        return self.__fields
+
+    @property
+    def field_names(self) -> tuple:
+        """:rtype: tuple[str]"""
+        return tuple(field.name for field in self.__fields)
+
+    def get_field(self, name: str) -> RecordFieldSchema:
+        """:returns: None if there is no field with that name."""
+        return self.__fields_by_name.get(name)
+
+    def get_field_by_index(self, index: int) -> RecordFieldSchema:
+        """Get the field based on it's index, 1-n based."""
+        return self.__fields[index - 1]
+
+    def is_for(self, handle: vs.Handle, field_count: int) -> bool:
+        return self.__handle_key == str(handle) and len(self.__fields) == field_count
+
+
+class RecordSchemaRepository(object, metaclass=SingletonMeta):
+    """Singleton to get the field metadata of record definitions, which is gathered only once per definition.
+
+    As this singleton lives for the whole VW session, the schema is checked against the definition each time, by
+    handle and number of fields, so other documents and added fields are noticed. Renaming fields or changing their
+    types isn't noticed, so call invalidate after doing so. The converters for the field values are registered in the
+    __init__ file of dlibrary, as they are part of the document module.
+    """
+
+    def __init__(self):
+        self.__schemas = dict()
+        """@type: dict[str, RecordSchema]"""
+        self.__converter_factory = lambda field_type, parametric: (lambda value: value)
+
+    def register_converter_factory(self, converter_factory):
+        """
+        :type converter_factory: (int, bool) -> ((str) -> str | int | bool | float)
+        """
+        self.__converter_factory = converter_factory
+        self.__schemas.clear()
+
+    def get(self, name: str) -> RecordSchema:
+        """Get the schema for the record definition with the given name.
+        :returns: None if there is no record definition with that name.
+        """
+        handle = vs.GetObject(name)
+        if handle is None:
+            return None
+        field_count = vs.NumFields(handle)
+        schema = self.__schemas.get(name)
+        if schema is None or not schema.is_for(handle, field_count):
+            schema = self.__schemas[name] = self.__create(name, handle, field_count)
+        return schema
+
+    def __create(self, name: str, handle: vs.Handle, field_count: int) -> RecordSchema:
+        parametric = bool(vs.IsPluginFormat(handle))
+        fields = []
+        for index in range(1, field_count + 1):
+            field_type = vs.GetFldType(handle, index)
+            fields.append(RecordFieldSchema(index, vs.GetFldName(handle, index), field_type,
+                                            self.__converter_factory(field_type, parametric)))
+        return RecordSchema(name, handle, parametric, tuple(fields))
+
+    def invalidate(self, name: str=None):
+        """Forget the schema for the record definition with the given name, or all schemas if none is given."""
+        if name is None:
+            self.__schemas.clear()
+        else:
+            self.__schemas.pop(name, None)
+
+
 # TODO: create abstract record and field classes for use in the different record types (parameteric, ifc, normal)!?
@@ -0,0 +1,299 @@
+"""Module for spatial stuff, like finding drawing objects by their location, without asking VW for all of them.
+"""
+import itertools
+import math
+import statistics
+from array import array
+import vs
+from dlibrary.criteria import Criteria
+from dlibrary.object import AbstractObject
+from dlibrary.object_base import ObjectTypeEnum
+
+try:  # NumPy isn't shipped with VW, so it's optional, arrays from the standard library are used without it.
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class SpatialIndex(object):
+    """Grid index over the bounding boxes of drawing objects, to find objects in a region or near a point.
+
+    Objects are put in every grid cell their bounding box overlaps, so a query only has to look at the objects in the
+    cells it touches, instead of getting the bounding box of all objects from VW. Objects that are moved, rotated,
+    resized or reset through our wrappers are updated in the index, see AbstractObject.bounds_changed_event. Changes
+    done directly through vs calls aren't noticed, call update for those.
+
+    Objects that would be in more than MAX_OBJECT_CELLS cells, like a sheet border, are kept apart as oversized
+    objects, which every query checks, so one large object doesn't fill the whole grid.
+
+    Subscribing to the event keeps the index alive, so always close it when done, or use it as a context manager.
+    """
+
+    MAX_OBJECT_CELLS = 64
+
+    def __init__(self, objects, cell_size: float=None):
+        """
+        :type objects: Criteria | collections.Iterable[AbstractObject]
+        :param cell_size: The size of the grid cells, defaults to the median size of the objects.
+        """
+        objects = [o for o in (objects.iter() if isinstance(objects, Criteria) else objects)
+                   if isinstance(o, AbstractObject)]
+        self.__bounds = {o: vs.GetBBox(o.handle) for o in objects}
+        """@type: dict[AbstractObject, ((float, float), (float, float))]"""
+        self.__cell_size = cell_size or self.__get_median_size(self.__bounds.values())
+        self.__cells = dict()
+        """@type: dict[(int, int), set[AbstractObject]]"""
+        self.__oversized = set()
+        """@type: set[AbstractObject]"""
+        self.__cells_reach = None  # Left, bottom, right and top cell ever used, so searches know when to stop.
+        for spatial_object, bounds in self.__bounds.items():
+            self.__add_to_cells(spatial_object, bounds)
+        AbstractObject.bounds_changed_event.subscribe(self.__on_bounds_changed)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Stop updating the index for objects changed through our wrappers."""
+        AbstractObject.bounds_changed_event.unsubscribe(self.__on_bounds_changed)
+
+    def __len__(self):
+        return len(self.__bounds)
+
+    def __contains__(self, spatial_object):
+        return spatial_object in self.__bounds
+
+    @staticmethod
+    def __get_median_size(all_bounds) -> float:
+        # Not the mean, as a few large objects, like a sheet border, would make the cells too big for all others.
+        sizes = [max(bottom_right[0] - top_left[0], top_left[1] - bottom_right[1])
+                 for top_left, bottom_right in all_bounds]
+        sizes = [size for size in sizes if size > 0]
+        return statistics.median(sizes) if sizes else 1.0
+
+    def __get_cell_range(self, top_left: tuple, bottom_right: tuple) -> tuple:
+        """:rtype: (range, range)"""
+        return (range(math.floor(top_left[0] / self.__cell_size), math.floor(bottom_right[0] / self.__cell_size) + 1),
+                range(math.floor(bottom_right[1] / self.__cell_size), math.floor(top_left[1] / self.__cell_size) + 1))
+
+    def __add_to_cells(self, spatial_object: AbstractObject, bounds: tuple):
+        x_range, y_range = self.__get_cell_range(*bounds)
+        if len(x_range) * len(y_range) > self.MAX_OBJECT_CELLS:
+            self.__oversized.add(spatial_object)
+            return
+        reach = self.__cells_reach or (x_range[0], y_range[0], x_range[-1], y_range[-1])
+        self.__cells_reach = (min(reach[0], x_range[0]), min(reach[1], y_range[0]),
+                              max(reach[2], x_range[-1]), max(reach[3], y_range[-1]))
+        for x in x_range:
+            for y in y_range:
+                self.__cells.setdefault((x, y), set()).add(spatial_object)
+
+    def __remove_from_cells(self, spatial_object: AbstractObject, bounds: tuple):
+        if spatial_object in self.__oversized:
+            self.__oversized.discard(spatial_object)
+            return
+        x_range, y_range = self.__get_cell_range(*bounds)
+        for x in x_range:
+            for y in y_range:
+                cell = self.__cells.get((x, y))
+                if cell is not None:
+                    cell.discard(spatial_object)
+                    if not cell:
+                        del self.__cells[(x, y)]
+
+    def __on_bounds_changed(self, spatial_object: AbstractObject):
+        if spatial_object in self.__bounds:
+            self.update(spatial_object)
+
+    def add(self, spatial_object: AbstractObject):
+        """Add the object to the index, or update it if it's already in there."""
+        self.remove(spatial_object)
+        bounds = self.__bounds[spatial_object] = vs.GetBBox(spatial_object.handle)
+        self.__add_to_cells(spatial_object, bounds)
+
+    def update(self, spatial_object: AbstractObject):
+        """Let the index know the bounding box of the object has changed."""
+        self.add(spatial_object)
+
+    def remove(self, spatial_object: AbstractObject):
+        bounds = self.__bounds.pop(spatial_object, None)
+        if bounds is not None:
+            self.__remove_from_cells(spatial_object, bounds)
+
+    def query_rect(self, top_left: tuple, bottom_right: tuple) -> set:
+        """Get all objects of which the bounding box overlaps the rectangle, touching edges included.
+        :type top_left: (float, float)
+        :type bottom_right: (float, float)
+        :rtype: set[AbstractObject]
+        """
+        (left, top), (right, bottom) = top_left, bottom_right
+        found = set()
+        x_range, y_range = self.__get_cell_range(top_left, bottom_right)
+        if len(x_range) * len(y_range) > len(self.__cells):
+            candidates = (o for cell in self.__cells.values() for o in cell)  # Less cells to visit this way.
+        else:
+            candidates = (o for x in x_range for y in y_range for o in self.__cells.get((x, y), ()))
+        for candidate in itertools.chain(candidates, self.__oversized):
+            if candidate not in found:
+                (bb_left, bb_top), (bb_right, bb_bottom) = self.__bounds[candidate]
+                if bb_left <= right and bb_right >= left and bb_bottom <= top and bb_top >= bottom:
+                    found.add(candidate)
+        return found
+
+    def query_point(self, point: tuple) -> set:
+        """Get all objects of which the bounding box contains the point, edges included.
+        :type point: (float, float)
+        :rtype: set[AbstractObject]
+        """
+        return self.query_rect(point, point)
+
+    def nearest(self, point: tuple):
+        """Get the object of which the bounding box is the nearest to the point, or None if the index is empty.
+        Objects with the point inside their bounding box have a distance of zero.
+        :type point: (float, float)
+        :rtype: AbstractObject
+        """
+        nearest_object, nearest_distance = None, math.inf
+        for candidate in self.__oversized:
+            distance = self.__get_distance(point, self.__bounds[candidate])
+            if distance < nearest_distance:
+                nearest_object, nearest_distance = candidate, distance
+        if not self.__cells:
+            return nearest_object
+        x, y = math.floor(point[0] / self.__cell_size), math.floor(point[1] / self.__cell_size)
+        # The farthest ring of cells around the point's cell that can still hold objects.
+        reach_left, reach_bottom, reach_right, reach_top = self.__cells_reach
+        max_ring = max(x - reach_left, reach_right - x, y - reach_bottom, reach_top - y)
+        # And the nearest one, as there is no use in searching the empty rings before it.
+        min_ring = max(reach_left - x, x - reach_right, reach_bottom - y, y - reach_top, 0)
+        for ring in range(min_ring, max_ring + 1):
+            # Cells in this ring are at least this far from the point, so we can't find anything closer anymore.
+            if nearest_distance <= (ring - 1) * self.__cell_size:
+                break
+            # Far away from the objects, rings get bigger than the amount of cells holding objects.
+            all_cells = 8 * ring > len(self.__cells)
+            for cell in self.__cells if all_cells else self.__get_ring(x, y, ring):
+                for candidate in self.__cells.get(cell, ()):
+                    distance = self.__get_distance(point, self.__bounds[candidate])
+                    if distance < nearest_distance:
+                        nearest_object, nearest_distance = candidate, distance
+            if all_cells:
+                break
+        return nearest_object
+
+    @staticmethod
+    def __get_ring(x: int, y: int, ring: int):
+        """:rtype: collections.Iterator[(int, int)]"""
+        if ring == 0:
+            yield x, y
+            return
+        for ring_x in range(x - ring, x + ring + 1):
+            yield ring_x, y - ring
+            yield ring_x, y + ring
+        for ring_y in range(y - ring + 1, y + ring):
+            yield x - ring, ring_y
+            yield x + ring, ring_y
+
+    @staticmethod
+    def __get_distance(point: tuple, bounds: tuple) -> float:
+        (left, top), (right, bottom) = bounds
+        delta_x = max(left - point[0], 0, point[0] - right)
+        delta_y = max(bottom - point[1], 0, point[1] - top)
+        return math.hypot(delta_x, delta_y)
+
+
+class GeometryArrays(object):
+    """The geometry of many objects, as contiguous arrays of floats, one per property, to do math on all at once.
+    The arrays are NumPy arrays if NumPy is available, array.array('d') otherwise. Index i of each array is about
+    handles[i]. Origins and rotations are those of the insertion point for symbols and plug-in objects, for all other
+    objects, the origin is the center of the bounding box and the rotation is 0.
+    """
+
+    @staticmethod
+    def extract(objects, origins: bool=True):
+        """Get the geometry of all objects, without creating any wrappers for a Criteria.
+        :type objects: Criteria | collections.Iterable[AbstractObject | vs.Handle]
+        :param origins: Leave out the origins and rotations, which takes an extra vs call per object.
+        :rtype: GeometryArrays
+        """
+        if isinstance(objects, Criteria):
+            handles = objects.compile().get_handles()
+        else:
+            handles = tuple(o.handle if isinstance(o, AbstractObject) else o for o in objects)
+        left, top, right, bottom, origin_x, origin_y, rotation = (array('d') for _ in range(7))
+        for handle in handles:
+            (bb_left, bb_top), (bb_right, bb_bottom) = vs.GetBBox(handle)
+            left.append(bb_left)
+            top.append(bb_top)
+            right.append(bb_right)
+            bottom.append(bb_bottom)
+            if origins:
+                if vs.GetTypeN(handle) in (ObjectTypeEnum.SYMBOL, ObjectTypeEnum.PLUGIN_OBJECT):
+                    (x, y), angle = vs.GetSymLoc(handle), vs.GetSymRot(handle)
+                else:
+                    (x, y), angle = ((bb_left + bb_right) / 2, (bb_top + bb_bottom) / 2), 0.0
+                origin_x.append(x)
+                origin_y.append(y)
+                rotation.append(angle)
+        return GeometryArrays(handles, left, top, right, bottom, origin_x, origin_y, rotation)
+
+    def __init__(self, handles: tuple, *arrays):
+        """
+        :type handles: tuple[vs.Handle]
+        :type arrays: array
+        """
+        self.__handles = handles
+        # Without copying, NumPy arrays will share the memory of the standard ones.
+        self.__arrays = tuple(numpy.frombuffer(a, dtype=numpy.float64) if numpy else a for a in arrays)
+
+    def __len__(self):
+        return len(self.__handles)
+
+    @property
+    def handles(self) -> tuple:
+        """:rtype: tuple[vs.Handle]"""
+        return self.__handles
+
+    @property
+    def left(self):
+        """:rtype: numpy.ndarray | array"""
+        return self.__arrays[0]
+
+    @property
+    def top(self):
+        """:rtype: numpy.ndarray | array"""
+        return self.__arrays[1]
+
+    @property
+    def right(self):
+        """:rtype: numpy.ndarray | array"""
+        return self.__arrays[2]
+
+    @property
+    def bottom(self):
+        """:rtype: numpy.ndarray | array"""
+        return self.__arrays[3]
+
+    @property
+    def origin_x(self):
+        """Empty if extracted without origins.
+        :rtype: numpy.ndarray | array
+        """
+        return self.__arrays[4]
+
+    @property
+    def origin_y(self):
+        """Empty if extracted without origins.
+        :rtype: numpy.ndarray | array
+        """
+        return self.__arrays[5]
+
+    @property
+    def rotation(self):
+        """Empty if extracted without origins.
+        :rtype: numpy.ndarray | array
+        """
+        return self.__arrays[6]
@@ -2,6 +2,7 @@
 """
 from abc import ABCMeta, abstractmethod
 from collections import UserList
+from contextlib import ContextDecorator
 from dlibrary.libs import xmltodict as xmltodict
 
 
@@ -38,6 +39,62 @@ class Event(object):
             handler(*args, **kwargs)
 
 
+class AbstractScopedCache(object, metaclass=ABCMeta):
+    """Base for singletons that only keep what they get from VW while they are open.
+
+    Singletons live for the whole VW session, in which documents change and handles of deleted objects get reused, so
+    caching VW data is only safe for a known scope, mostly one script run. Such a scope is opened and closed through
+    an AbstractScopedCacheDecorator. Openings can be nested, the scope starts at the first open and ends at the last
+    close, so the next one, maybe in another document, starts clean.
+    """
+
+    def __init__(self):
+        self.__openings = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.__openings > 0
+
+    def open(self):
+        self.__openings += 1
+        if self.__openings == 1:
+            self._start_scope()
+
+    def close(self):
+        if self.__openings > 0:
+            self.__openings -= 1
+            if self.__openings == 0:
+                self._end_scope()
+
+    @abstractmethod
+    def _start_scope(self):
+        pass
+
+    @abstractmethod
+    def _end_scope(self):
+        pass
+
+
+class AbstractScopedCacheDecorator(ContextDecorator, metaclass=ABCMeta):
+    """Decorator and context manager to open a scoped cache during the decorated function or the with block.
+    The with statement gives the cache itself.
+    """
+
+    @property
+    @abstractmethod
+    def _cache(self) -> AbstractScopedCache:
+        pass
+
+    def __enter__(self):
+        cache = self._cache
+        cache.open()
+        return cache
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._cache.close()
+        return False
+
+
 class XmlDict(object, metaclass=SingletonMeta):
 
     @staticmethod
@@ -357,6 +414,20 @@ class ObservableList(UserList):
         if self.__raise_events:
             self.__list_changed_event.raise_event({i: item for i, item in enumerate(items)}, {})
 
+    def set_items(self, items: dict):
+        """Replace the items at the given indexes, with only one change event for all of them.
+        :type items: dict[int, T]
+        """
+        old_items = {i: self.data[i] for i in items}
+        raise_events, self.__raise_events = self.__raise_events, False
+        try:
+            for i, item in items.items():
+                self[i] = item  # Through __setitem__, so derived lists, like LinkedObservableList, keep up.
+        finally:
+            self.__raise_events = raise_events
+        if self.__raise_events and items:
+            self.__list_changed_event.raise_event(old_items, dict(items))
+
     def index(self, item, *args):
         try:
             return super().index(item, *args)
@@ -1,11 +1,16 @@
 """Module for all Vectorworks related stuff, like settings and active plugin features.
 """
 import functools
+import json
 import os
+import sys
+import tempfile
+import time
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 
 import vs
-from dlibrary.object_base import AbstractKeyedObject, ObjectRepository
+from dlibrary.object_base import AbstractKeyedObject, ObjectRepository, RecordSchemaRepository
 from dlibrary.utility import SingletonMeta, OnErrorDoAndRetry
 
 
@@ -122,6 +127,145 @@ class ClearScriptMessage(object):
         return decorator
 
 
+class VsCallProfiler(object):
+    """Opt-in instrumentation of the vs module, to find out which wrapper calls dominate a slow script.
+
+    While started, every vs function is replaced by a proxy that counts the calls and their cumulative time, both per
+    vs function and per call site, which is the function or method that did the vs call. Keep in mind that the time of
+    calls with callbacks, like vs.ForEachObject, includes the time spent in those callbacks.
+    """
+
+    def __init__(self):
+        self.__originals = dict()
+        self.__functions = dict()
+        """@type: dict[str, list[int, float]]"""
+        self.__sites = dict()
+        """@type: dict[str, dict[str, list[int, float]]]"""
+        self.__site_names = dict()
+
+    @property
+    def active(self) -> bool:
+        return len(self.__originals) > 0
+
+    def start(self):
+        if self.active:
+            return
+        for name in dir(vs):
+            original = getattr(vs, name)
+            if not name.startswith('_') and callable(original) and not isinstance(original, type):
+                self.__originals[name] = original
+                setattr(vs, name, self.__create_proxy(name, original))
+
+    def stop(self):
+        for name, original in self.__originals.items():
+            setattr(vs, name, original)
+        self.__originals.clear()
+
+    def reset(self):
+        self.__functions.clear()
+        self.__sites.clear()
+
+    def __create_proxy(self, name: str, original: callable) -> callable:
+        functions = self.__functions
+        sites = self.__sites
+        get_call_site = self.__get_call_site
+
+        def proxy(*args, **kwargs):
+            site = get_call_site(sys._getframe(1))
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - start
+                site_functions = sites.setdefault(site, {})
+                for stats in (functions.setdefault(name, [0, 0.0]), site_functions.setdefault(name, [0, 0.0])):
+                    stats[0] += 1
+                    stats[1] += seconds
+
+        return proxy
+
+    def __get_call_site(self, frame) -> str:
+        code = frame.f_code
+        site = self.__site_names.get(code)
+        if site is None:
+            name = getattr(code, 'co_qualname', None)  # Only from Python 3.11 on, so we'll fall back on self or cls.
+            if name is None:
+                owner = frame.f_locals.get('self', frame.f_locals.get('cls'))
+                owner = owner if owner is None or isinstance(owner, type) else type(owner)
+                name = code.co_name if owner is None else '%s.%s' % (owner.__name__, code.co_name)
+            site = '%s.%s' % (frame.f_globals.get('__name__', '?'), name)
+            if hasattr(code, 'co_qualname'):
+                self.__site_names[code] = site
+        return site
+
+    def get_report(self) -> OrderedDict:
+        """Returns all stats, sorted on cumulative time, with the most expensive first."""
+        sites = [(site, self.__get_report_part(functions)) for site, functions in self.__sites.items()]
+        sites.sort(key=lambda item: item[1]['seconds'], reverse=True)
+        report = self.__get_report_part(self.__functions)
+        report['sites'] = OrderedDict(sites)
+        return report
+
+    @staticmethod
+    def __get_report_part(functions: dict) -> OrderedDict:
+        """
+        :type functions: dict[str, list[int, float]]
+        """
+        return OrderedDict((
+            ('calls', sum(calls for calls, seconds in functions.values())),
+            ('seconds', sum(seconds for calls, seconds in functions.values())),
+            ('functions', OrderedDict(
+                (name, {'calls': calls, 'seconds': seconds})
+                for name, (calls, seconds) in sorted(functions.items(), key=lambda item: item[1][1], reverse=True)))))
+
+    def get_report_text(self) -> str:
+        report = self.get_report()
+        lines = ['%s vs calls in %.6fs' % (report['calls'], report['seconds']), '', 'PER VS FUNCTION']
+        lines.extend('%10s %12.6fs  %s' % (stats['calls'], stats['seconds'], name)
+                     for name, stats in report['functions'].items())
+        lines.extend(['', 'PER CALL SITE'])
+        for site, site_stats in report['sites'].items():
+            lines.append('%10s %12.6fs  %s' % (site_stats['calls'], site_stats['seconds'], site))
+            lines.extend('%10s %12.6fs      vs.%s' % (stats['calls'], stats['seconds'], name)
+                         for name, stats in site_stats['functions'].items())
+        return '\n'.join(lines)
+
+    def save(self, path: str):
+        """Saves the report as text and as JSON, to '<path>.txt' and '<path>.json'."""
+        with open(path + '.txt', 'w', encoding='UTF-8') as file:
+            file.write(self.get_report_text())
+        with open(path + '.json', 'w', encoding='UTF-8') as file:
+            json.dump(self.get_report(), file, indent=2)
+
+
+class ProfileVsCalls(object):
+    """Decorator to profile all vs calls done during the decorated function, which will mostly be the plug-in's main.
+
+    The report will be saved when the function ends, even on errors, as the Python interpreter keeps on living between
+    script runs in Vectorworks. Use it together with the If decorator to only profile when needed.
+    """
+
+    def __init__(self, path: str=None):
+        """
+        :param path: Path without extension, '.txt' and '.json' will be added. Defaults to the temp directory.
+        """
+        self.__path = path or os.path.join(tempfile.gettempdir(), 'dlibrary_vs_calls')
+
+    def __call__(self, function: callable) -> callable:
+
+        @functools.wraps(function)
+        def decorator(*args, **kwargs):
+            profiler = VsCallProfiler()
+            profiler.start()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.stop()
+                profiler.save(self.__path)
+
+        return decorator
+
+
 class VectorworksSecurity(object):
     """Decorator to secure a function based on the user id and/or VW version running.
 
@@ -588,8 +732,7 @@ class AbstractActivePluginParameters(object, metaclass=ABCMeta):
 
     # noinspection PyUnusedLocal
     def __init_record_and_fields(self, name: str):
-        self.__record = vs.GetParametricRecord(ActivePlugin().handle)
-        self.__fields = [vs.GetFldName(self.__record, index) for index in range(1, vs.NumFields(self.__record) + 1)]
+        self.__schema = RecordSchemaRepository().get(ActivePlugin().name)
 
     @OnErrorDoAndRetry(AttributeError, __init_record_and_fields)
     def __init_parameter(self, name: str):
@@ -599,7 +742,7 @@ class AbstractActivePluginParameters(object, metaclass=ABCMeta):
         For a boolean value, VW return 1 or 0, while we actually want a bool, so we'll convert if needed.
         """
         value = getattr(vs, 'P%s' % name)
-        is_bool = vs.GetFldType(self.__record, self.__fields.index(name) + 1) == 2
+        is_bool = self.__schema.get_field(name).type == 2
         self.__parameters[name] = value == 1 if is_bool else value
 
     @OnErrorDoAndRetry(KeyError, __init_parameter)
@@ -0,0 +1,13 @@
+"""Package for benchmarking the hot paths of DLibrary outside of Vectorworks, on top of the vs mock.
+
+Execute the benchmark_run.py module in order to run all benchmarks, from the folder that holds the dlibrary package:
+
+    python -m dlibrary_benchmark.benchmark_run
+
+Benchmarks are timed at several drawing sizes and compared against the JSON baseline of a previous run, so regressions
+in our wrappers are noticed before our users do. Benchmarks can only be run outside of Vectorworks, as the mock has to
+take the place of the vs module before DLibrary is imported.
+"""
+
+__author__ = 'Dieter Geerts <dieter@dworks.be>'
+__license__ = 'MIT'
@@ -0,0 +1,59 @@
+"""Benchmark module for all benchmarks related to the criteria module.
+"""
+from dlibrary.criteria import Criteria, ReuseCriteriaResults
+from dlibrary.document import RecordDefinition, DataFieldTypeEnum
+from dlibrary_benchmark.benchmarking import Benchmark
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+
+@Benchmark('Criteria.get')
+def criteria_get(mock: VectorworksMock, scale: int) -> callable:
+    mock.create_record_definition('Benchmark', [('Number', DataFieldTypeEnum.INTEGER, '0')])
+    for index in range(scale):  # Only half of the objects will match.
+        mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0)),
+                           records={'Benchmark': {'Number': str(index)}} if index % 2 else None)
+    record = RecordDefinition('Benchmark')
+
+    def timed():
+        Criteria().has_record(record).get()
+
+    return timed
+
+
+@Benchmark('Criteria.first')
+def criteria_first(mock: VectorworksMock, scale: int) -> callable:
+    for index in range(scale):
+        mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0)))
+
+    def timed():
+        Criteria().first()
+
+    return timed
+
+
+@Benchmark('Criteria.any[shared results]')
+def criteria_any_with_shared_results(mock: VectorworksMock, scale: int) -> callable:
+    """The same query is done ten times, like reset handlers of several plug-in objects would do."""
+    mock.create_record_definition('Benchmark', [('Number', DataFieldTypeEnum.INTEGER, '0')])
+    for index in range(scale):  # Only half of the objects will match.
+        mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0)),
+                           records={'Benchmark': {'Number': str(index)}} if index % 2 else None)
+    record = RecordDefinition('Benchmark')
+
+    @ReuseCriteriaResults()
+    def timed():
+        for _ in range(10):
+            Criteria().has_record(record).any()
+
+    return timed
+
+
+@Benchmark('Criteria.count')
+def criteria_count(mock: VectorworksMock, scale: int) -> callable:
+    for index in range(scale):
+        mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0)))
+
+    def timed():
+        Criteria().count()
+
+    return timed
@@ -0,0 +1,60 @@
+"""Benchmark module for all benchmarks related to the dialog_custom module.
+"""
+from dlibrary.dialog_custom import AbstractDataContext, ListBrowser, Column, ControlTypeEnum, DisplayTypeEnum, \
+    TextAlignEnum
+from dlibrary.utility import ObservableList, ObservableField
+from dlibrary_benchmark.benchmarking import Benchmark
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock
+
+
+class BenchmarkItem(object):
+
+    def __init__(self, index: int):
+        self.name = ObservableField('Item %s' % index)
+        self.count = ObservableField(index)
+
+
+class BenchmarkDataContext(object):
+
+    def __init__(self):
+        self.items = ObservableList()
+        self.selected_items = ObservableList()
+
+
+def create_list_browser(mock: VectorworksMock, index: bool) -> BenchmarkDataContext:
+    """Creates a list browser, which is setup like in a running dialog, and returns it's data context."""
+    data_context = BenchmarkDataContext()
+    dialog_id = mock.CreateLayout('Benchmark', False, 'Ok', 'Cancel')
+    list_browser = ListBrowser(
+        dialog_id, 11, '', AbstractDataContext(data_context), '', '', 'items', 'selected_items', index,
+        (Column('Name', 100, ControlTypeEnum.STATIC, DisplayTypeEnum.TEXT_ONLY, TextAlignEnum.LEFT, 'name'),
+         Column('Count', 50, ControlTypeEnum.NUMBER, DisplayTypeEnum.TEXT_ONLY, TextAlignEnum.RIGHT, 'count')),
+        40, 10)
+    list_browser.setup(lambda control_id, event_handler: None)
+    return data_context
+
+
+# Items are added one by one, which is quadratic in the item count, so we don't go up to 100k here.
+@Benchmark('ListBrowser._add_control_item', scales=(1000, 10000))
+def list_browser_add_control_item(mock: VectorworksMock, scale: int) -> callable:
+    data_context = create_list_browser(mock, False)
+    items = [BenchmarkItem(index) for index in range(scale)]
+
+    def timed():
+        for item in items:
+            data_context.items.append(item)
+
+    return timed
+
+
+# With an index column, every added item renumbers all rows, so this is even more quadratic.
+@Benchmark('ListBrowser._add_control_item[index]', scales=(1000,))
+def list_browser_add_control_item_with_index(mock: VectorworksMock, scale: int) -> callable:
+    data_context = create_list_browser(mock, True)
+    items = [BenchmarkItem(index) for index in range(scale)]
+
+    def timed():
+        for item in items:
+            data_context.items.append(item)
+
+    return timed
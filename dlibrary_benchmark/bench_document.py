@@ -0,0 +1,170 @@
+"""Benchmark module for all benchmarks related to the document module.
+"""
+import os
+import shutil
+import tempfile
+
+from dlibrary.document import Document, Units, DataFieldTypeEnum, SymbolDefinitionResourceList, ResourceLocation, \
+    ResourceFolder, RecordTable, RecordDefinition, ReuseUnitPreferences, ResourceCatalogueCache, \
+    ReuseLayers
+from dlibrary.object import DrawnObject
+from dlibrary_benchmark.benchmarking import Benchmark
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+
+@Benchmark('Document.layers')
+def document_layers(mock: VectorworksMock, scale: int) -> callable:
+    for index in range(1, scale):  # There is always one design layer.
+        mock.create_layer('Layer-%s' % index, sheet=index % 4 == 0)
+
+    def timed():
+        Document().layers
+
+    return timed
+
+
+@Benchmark('Document.get_layer[registry]')
+def document_get_layer_with_registry(mock: VectorworksMock, scale: int) -> callable:
+    for index in range(1, 100):  # There is always one design layer.
+        mock.create_layer('Layer-%s' % index, sheet=index % 4 == 0)
+    names = ['Layer-%s' % (index % 99 + 1) for index in range(scale)]
+
+    @ReuseLayers()
+    def timed():
+        for name in names:
+            Document().get_layer(name)
+
+    return timed
+
+
+@Benchmark('Record.fields+RecordField.value')
+def record_field_values(mock: VectorworksMock, scale: int) -> callable:
+    mock.create_record_definition('Benchmark', [
+        ('Name', DataFieldTypeEnum.TEXT, ''),
+        ('Count', DataFieldTypeEnum.INTEGER, '0'),
+        ('Done', DataFieldTypeEnum.BOOLEAN, 'False'),
+        ('Length', DataFieldTypeEnum.NUMBER_DIMENSION, '0mm'),
+        ('Ratio', DataFieldTypeEnum.NUMBER_DECIMAL, '0.5')])
+    objects = [DrawnObject(mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0)),
+                                              records={'Benchmark': {'Name': 'Object %s' % index}}))
+               for index in range(scale)]
+
+    def timed():
+        for drawn_object in objects:
+            for field in drawn_object.records['Benchmark'].fields.values():
+                field.value
+
+    return timed
+
+
+@Benchmark('Units.resolve_length_units')
+def units_resolve_length_units(mock: VectorworksMock, scale: int) -> callable:
+    lengths = ['%smm' % (index % 500) for index in range(scale)]  # Repeated literals, just like in plug-ins.
+
+    def timed():
+        for length in lengths:
+            Units.resolve_length_units(length)
+
+    return timed
+
+
+@Benchmark('Units.to_inches[snapshot]')
+def units_to_inches_with_snapshot(mock: VectorworksMock, scale: int) -> callable:
+    lengths = [float(index) for index in range(scale)]
+
+    @ReuseUnitPreferences()
+    def timed():
+        for length in lengths:
+            Units.to_inches(length)
+
+    return timed
+
+
+@Benchmark('AbstractResourceList.__init__')
+def abstract_resource_list_init(mock: VectorworksMock, scale: int) -> callable:
+    for index in range(scale // 2):
+        mock.create_symbol_definition('Document Symbol-%s' % index)
+    for index in range(scale - scale // 2):
+        mock.add_application_resource(MockObjectTypeEnum.SYMBOL_DEFINITION, 'Application Symbol-%s' % index,
+                                      ResourceFolder.DEFAULTS)
+
+    def timed():
+        SymbolDefinitionResourceList(ResourceLocation.DOC_APP, ResourceFolder.DEFAULTS).names  # It's filled lazily.
+
+    return timed
+
+
+@Benchmark('AbstractResourceList.names[catalogue cache]')
+def abstract_resource_list_names_from_catalogue_cache(mock: VectorworksMock, scale: int) -> callable:
+    folder = tempfile.mkdtemp()
+    for index in range(10):
+        with open(os.path.join(folder, 'Library-%s.vwx' % index), 'w') as file:
+            file.write('Library')
+    mock.set_folder_path(ResourceFolder.DEFAULTS, folder)
+    for index in range(scale):
+        mock.add_application_resource(MockObjectTypeEnum.SYMBOL_DEFINITION, 'Application Symbol-%s' % index,
+                                      ResourceFolder.DEFAULTS)
+    # The cache file is kept out of the resource folder, as it would change the files that are checked otherwise.
+    cache_folder = tempfile.mkdtemp()
+    cache_path = ResourceCatalogueCache().path
+    ResourceCatalogueCache().path = os.path.join(cache_folder, 'catalogues.json')
+    SymbolDefinitionResourceList(ResourceLocation.APP, ResourceFolder.DEFAULTS).names  # Fills the cache.
+
+    def timed():
+        SymbolDefinitionResourceList(ResourceLocation.APP, ResourceFolder.DEFAULTS).names
+
+    def clean_up():
+        ResourceCatalogueCache().path = cache_path
+        shutil.rmtree(folder, ignore_errors=True)
+        shutil.rmtree(cache_folder, ignore_errors=True)
+
+    return timed, clean_up
+
+
+@Benchmark('AbstractResourceList.is_resource_in_list', scales=(1000, 10000))
+def abstract_resource_list_is_resource_in_list(mock: VectorworksMock, scale: int) -> callable:
+    for index in range(scale):
+        mock.add_application_resource(MockObjectTypeEnum.SYMBOL_DEFINITION, 'Application Symbol-%s' % index,
+                                      ResourceFolder.DEFAULTS)
+    resource_list = SymbolDefinitionResourceList(ResourceLocation.APP, ResourceFolder.DEFAULTS)
+    names = list(resource_list.names)
+
+    def timed():
+        for name in names:
+            resource_list.is_resource_in_list(name)
+
+    return timed
+
+
+@Benchmark('AbstractResourceList.import_resources', scales=(1000, 10000))
+def abstract_resource_list_import_resources(mock: VectorworksMock, scale: int) -> callable:
+    for index in range(scale):
+        mock.add_application_resource(MockObjectTypeEnum.SYMBOL_DEFINITION, 'Application Symbol-%s' % index,
+                                      ResourceFolder.DEFAULTS)
+    resource_list = SymbolDefinitionResourceList(ResourceLocation.APP, ResourceFolder.DEFAULTS)
+    names = list(resource_list.names)
+
+    def timed():
+        resource_list.import_resources(names)
+
+    return timed
+
+
+@Benchmark('RecordTable.read_rows')
+def record_table_read_rows(mock: VectorworksMock, scale: int) -> callable:
+    """The same record as for Record.fields+RecordField.value, to compare with."""
+    mock.create_record_definition('Benchmark', [
+        ('Name', DataFieldTypeEnum.TEXT, ''),
+        ('Count', DataFieldTypeEnum.INTEGER, '0'),
+        ('Done', DataFieldTypeEnum.BOOLEAN, 'False'),
+        ('Length', DataFieldTypeEnum.NUMBER_DIMENSION, '0mm'),
+        ('Ratio', DataFieldTypeEnum.NUMBER_DECIMAL, '0.5')])
+    handles = [mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0)),
+                                  records={'Benchmark': {'Name': 'Object %s' % index}})
+               for index in range(scale)]
+
+    def timed():
+        for _ in RecordTable(RecordDefinition('Benchmark')).read_rows(handles):
+            pass
+
+    return timed
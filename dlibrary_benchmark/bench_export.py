@@ -0,0 +1,43 @@
+"""Benchmark module for all benchmarks related to the export module.
+"""
+import os
+import tempfile
+
+from dlibrary.document import RecordDefinition, DataFieldTypeEnum
+from dlibrary.export import RecordExporter
+from dlibrary_benchmark.benchmarking import Benchmark
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+
+def create_exporter(mock: VectorworksMock, scale: int) -> RecordExporter:
+    mock.create_record_definition('Benchmark', [
+        ('Name', DataFieldTypeEnum.TEXT, ''),
+        ('Count', DataFieldTypeEnum.INTEGER, '0'),
+        ('Done', DataFieldTypeEnum.BOOLEAN, 'False'),
+        ('Ratio', DataFieldTypeEnum.NUMBER_DECIMAL, '0.5')])
+    for index in range(scale):
+        mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0)),
+                           records={'Benchmark': {'Name': 'Object %s' % index, 'Count': str(index)}})
+    return RecordExporter(RecordDefinition('Benchmark'))
+
+
+@Benchmark('RecordExporter.write_csv')
+def record_exporter_write_csv(mock: VectorworksMock, scale: int) -> callable:
+    exporter = create_exporter(mock, scale)
+    path = os.path.join(tempfile.gettempdir(), 'dlibrary_benchmark.csv')
+
+    def timed():
+        exporter.write_csv(path)
+
+    return timed
+
+
+@Benchmark('RecordExporter.write_columnar')
+def record_exporter_write_columnar(mock: VectorworksMock, scale: int) -> callable:
+    exporter = create_exporter(mock, scale)
+    path = os.path.join(tempfile.gettempdir(), 'dlibrary_benchmark.columns')
+
+    def timed():
+        exporter.write_columnar(path)
+
+    return timed
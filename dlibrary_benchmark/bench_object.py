@@ -0,0 +1,46 @@
+"""Benchmark module for all benchmarks related to the object module.
+"""
+from dlibrary.object import Rectangle, BatchTransform, Attributes
+from dlibrary_benchmark.benchmarking import Benchmark
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+
+@Benchmark('AbstractObject.bb_*')
+def abstract_object_bb(mock: VectorworksMock, scale: int) -> callable:
+    """All sides of the bounding box are read for every object, like layout code does."""
+    objects = [Rectangle(mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0))))
+               for index in range(scale)]
+
+    def timed():
+        for drawn_object in objects:
+            drawn_object.bb_top, drawn_object.bb_left, drawn_object.bb_right, drawn_object.bb_bottom
+
+    return timed
+
+
+@Benchmark('BatchTransform.move')
+def batch_transform_move(mock: VectorworksMock, scale: int) -> callable:
+    """Half of the objects stay where they are, like after re-arranging a layout."""
+    objects = [Rectangle(mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0))))
+               for index in range(scale)]
+    deltas = [float(index % 2) for index in range(scale)]
+
+    def timed():
+        BatchTransform.move(objects, deltas, 0.0)
+
+    return timed
+
+
+@Benchmark('AttributesSnapshot.apply_to')
+def attributes_snapshot_apply_to(mock: VectorworksMock, scale: int) -> callable:
+    """Half of the objects already have the style, like when matching attributes on a drawing a second time."""
+    objects = [Rectangle(mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0))))
+               for index in range(scale)]
+    for drawn_object in objects[::2]:
+        mock.SetLW(drawn_object.handle, 7)
+    snapshot = Attributes(objects[0].handle).snapshot()
+
+    def timed():
+        snapshot.apply_to(objects)
+
+    return timed
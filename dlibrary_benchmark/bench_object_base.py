@@ -0,0 +1,44 @@
+"""Benchmark module for all benchmarks related to the object_base module.
+"""
+from dlibrary.object_base import ObjectRepository, ReuseObjectWrappers
+from dlibrary_benchmark.benchmarking import Benchmark
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+
+@Benchmark('ObjectRepository.get')
+def object_repository_get(mock: VectorworksMock, scale: int) -> callable:
+    handles = [mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0)))
+               for index in range(scale)]
+
+    def timed():
+        for handle in handles:
+            ObjectRepository().get(handle)
+
+    return timed
+
+
+@Benchmark('ObjectRepository.get[identity map]')
+def object_repository_get_with_identity_map(mock: VectorworksMock, scale: int) -> callable:
+    """Every object is looked up twice, like resources that are resolved over and over during a script run."""
+    handles = [mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0)))
+               for index in range(scale)]
+
+    @ReuseObjectWrappers()
+    def timed():
+        for handle in handles + handles:
+            ObjectRepository().get(handle)
+
+    return timed
+
+
+@Benchmark('AbstractKeyedObject.__hash__')
+def abstract_keyed_object_hash(mock: VectorworksMock, scale: int) -> callable:
+    """Wrappers are put in sets and dicts several times, like when combining criteria results."""
+    wrappers = [ObjectRepository().get(mock.create_object(
+        MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0)))) for index in range(scale)]
+
+    def timed():
+        for _ in range(3):
+            set(wrappers)
+
+    return timed
@@ -0,0 +1,33 @@
+"""Benchmark module for all benchmarks related to the spatial module.
+"""
+from dlibrary.criteria import Criteria
+from dlibrary.spatial import SpatialIndex, GeometryArrays
+from dlibrary_benchmark.benchmarking import Benchmark
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+
+@Benchmark('SpatialIndex.query_rect')
+def spatial_index_query_rect(mock: VectorworksMock, scale: int) -> callable:
+    """Collision detection, every object is checked against all others, like layout plug-ins do."""
+    for index in range(scale):  # A square of objects, which overlap with their neighbours.
+        x, y = index % 1000 * 10.0, index // 1000 * 10.0
+        mock.create_object(MockObjectTypeEnum.RECTANGLE, ((x, y + 12.0), (x + 12.0, y)))
+    bounds = [(o, mock.GetBBox(o.handle)) for o in Criteria().iter()]
+
+    def timed():
+        with SpatialIndex(o for o, _ in bounds) as spatial_index:
+            for _, (top_left, bottom_right) in bounds:
+                spatial_index.query_rect(top_left, bottom_right)
+
+    return timed
+
+
+@Benchmark('GeometryArrays.extract')
+def geometry_arrays_extract(mock: VectorworksMock, scale: int) -> callable:
+    for index in range(scale):
+        mock.create_object(MockObjectTypeEnum.RECTANGLE, ((index, 1.0), (index + 1, 0.0)))
+
+    def timed():
+        GeometryArrays.extract(Criteria())
+
+    return timed
@@ -0,0 +1,23 @@
+"""Benchmark module for all benchmarks related to the utility module.
+"""
+from dlibrary.utility import ObservableList
+from dlibrary_benchmark.benchmarking import Benchmark
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock
+
+
+@Benchmark('ObservableList.mutations')
+def observable_list_mutations(mock: VectorworksMock, scale: int) -> callable:
+    """Appends, replaces and removes items on a list with ten subscribers, like a dialog with several controls."""
+    observable_list = ObservableList()
+    for index in range(10):
+        observable_list.list_changed_event.subscribe(lambda removed, added, i=index: None)
+
+    def timed():
+        for index in range(scale):
+            observable_list.append(index)
+        for index in range(scale):
+            observable_list[index] = -index
+        for index in range(scale):
+            observable_list.pop()
+
+    return timed
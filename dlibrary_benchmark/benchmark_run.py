@@ -0,0 +1,45 @@
+"""Executable module to run all benchmarks and compare them against the baseline.
+
+The vs mock is installed before any benchmark module is loaded, as they import DLibrary, which imports vs.
+Exits with 1 if any benchmark got slower than the threshold allows, compared to the baseline.
+"""
+import argparse
+import importlib
+import os
+import pkgutil
+import sys
+
+from dlibrary_benchmark.benchmarking import BenchmarkRunner, BenchmarkBaseline
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock
+
+
+def run(arguments: list=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the DLibrary hot paths on top of the vs mock.')
+    parser.add_argument('--baseline', default=os.path.join(os.path.dirname(__file__), 'baseline.json'),
+                        help='JSON file with the timings to compare against.')
+    parser.add_argument('--save', action='store_true', help='Save the timings of this run as the new baseline.')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Maximum allowed ratio against the baseline, 1.25 allows to be 25%% slower.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs per benchmark, the best one counts.')
+    parser.add_argument('--max-scale', type=int, default=None, help='Skip all scales above this one.')
+    parser.add_argument('--filter', default='', help='Only run benchmarks with this text in their name.')
+    arguments = parser.parse_args(arguments)
+
+    mock = VectorworksMock().install()
+    for module in pkgutil.iter_modules([os.path.dirname(__file__)]):
+        if module.name.startswith('bench_'):
+            importlib.import_module('dlibrary_benchmark.%s' % module.name)
+
+    baseline = BenchmarkBaseline(arguments.baseline)
+    results = BenchmarkRunner(mock, arguments.repeat, arguments.max_scale, arguments.filter).run(baseline.load())
+    regressions = [result for result in results if result.is_regression(arguments.threshold)]
+    for result in regressions:
+        print('REGRESSION: %s is %.2fx slower than the baseline.' % (result.key, result.ratio))
+    if arguments.save:
+        baseline.save(results)
+        print('Baseline saved to %s' % baseline.path)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(run())
@@ -0,0 +1,154 @@
+"""Module for everything needed to define, time and compare benchmarks.
+
+This module doesn't import DLibrary, as the vs mock has to be installed first, which is done by the benchmark run.
+"""
+import json
+import os
+import platform
+import time
+from collections import OrderedDict
+
+
+class Benchmark(object):
+    """Decorator to register a benchmark, which will be timed for each of the given scales.
+
+    The decorated function does the setup, which isn't timed, and returns the function that will be timed. It gets the
+    vs mock, which is reset before each setup, and the scale, which is the number of objects, resources, items, ....
+    Setups that change more than the mock, like files or singletons, return a tuple of the timed function and a clean
+    up function, which will always be called after timing, and isn't timed either.
+    """
+
+    __benchmarks = OrderedDict()
+
+    def __init__(self, name: str, scales: tuple=(1000, 10000, 100000)):
+        self.__name = name
+        self.__scales = scales
+
+    def __call__(self, function: callable) -> callable:
+        """
+        :type function: (VectorworksMock, int) -> (() -> None) | (() -> None, () -> None)
+        """
+        Benchmark.__benchmarks[self.__name] = (self.__scales, function)
+        return function
+
+    @staticmethod
+    def get_benchmarks() -> OrderedDict:
+        """:rtype: OrderedDict[str, (tuple, callable)]"""
+        return Benchmark.__benchmarks
+
+
+class BenchmarkResult(object):
+
+    def __init__(self, name: str, scale: int, seconds: float, baseline: float=None):
+        self.__name = name
+        self.__scale = scale
+        self.__seconds = seconds
+        self.__baseline = baseline
+
+    @staticmethod
+    def get_key(name: str, scale: int) -> str:
+        return '%s@%s' % (name, scale)
+
+    @property
+    def key(self) -> str:
+        return BenchmarkResult.get_key(self.__name, self.__scale)
+
+    @property
+    def seconds(self) -> float:
+        return self.__seconds
+
+    @property
+    def baseline(self) -> float:
+        return self.__baseline
+
+    @property
+    def ratio(self) -> float:
+        """How much slower (> 1) or faster (< 1) we are compared to the baseline, None if there is no baseline."""
+        return self.__seconds / self.__baseline if self.__baseline else None
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio is not None and self.ratio > threshold
+
+    def __str__(self):
+        return '%-50s %12.6fs %s' % (
+            self.key, self.__seconds,
+            '%12.6fs %6.2fx' % (self.__baseline, self.ratio) if self.ratio is not None else '%12s %7s' % ('-', '-'))
+
+
+class BenchmarkBaseline(object):
+    """A JSON file holding the timings of a previous run, to compare against."""
+
+    def __init__(self, path: str):
+        self.__path = path
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def load(self) -> dict:
+        """:rtype: dict[str, float]"""
+        try:
+            with open(self.__path, encoding='UTF-8') as file:
+                return json.load(file).get('results', {})
+        except FileNotFoundError:
+            return {}
+
+    def save(self, results: list):
+        """
+        :type results: list[BenchmarkResult]
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.__path)), exist_ok=True)
+        with open(self.__path, 'w', encoding='UTF-8') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'results': OrderedDict((result.key, result.seconds) for result in results)
+            }, file, indent=2)
+
+
+class BenchmarkRunner(object):
+    """Runs the registered benchmarks, keeping the best time of a number of repeats to filter out noise."""
+
+    def __init__(self, mock, repeat: int=3, max_scale: int=None, name_filter: str=''):
+        """
+        :type mock: VectorworksMock
+        """
+        self.__mock = mock
+        self.__repeat = repeat
+        self.__max_scale = max_scale
+        self.__name_filter = name_filter
+
+    def run(self, baseline: dict, report: callable=print) -> list:
+        """
+        :type baseline: dict[str, float]
+        :type report: (str) -> None
+        :rtype: list[BenchmarkResult]
+        """
+        results = list()
+        for name, (scales, function) in Benchmark.get_benchmarks().items():
+            if self.__name_filter not in name:
+                continue
+            for scale in scales:
+                if self.__max_scale is not None and scale > self.__max_scale:
+                    continue
+                seconds = self.__time(function, scale)
+                result = BenchmarkResult(name, scale, seconds, baseline.get(BenchmarkResult.get_key(name, scale)))
+                results.append(result)
+                report(str(result))
+        return results
+
+    def __time(self, function: callable, scale: int) -> float:
+        best = None
+        for repeat in range(self.__repeat):
+            timed = function(self.__mock.reset(), scale)
+            timed, clean_up = timed if isinstance(timed, tuple) else (timed, None)
+            try:
+                start = time.perf_counter()
+                timed()
+                seconds = time.perf_counter() - start
+            finally:
+                if clean_up is not None:
+                    clean_up()
+            best = seconds if best is None else min(best, seconds)
+        return best
@@ -1,2 +1,110 @@
 """Test module for all test related to the criteria module.
 """
+from unittest import TestCase
+
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+mock = VectorworksMock.get_installed()
+
+import vs
+from dlibrary.criteria import Criteria, CriteriaResults, ReuseCriteriaResults
+from dlibrary.document import Layer, RecordDefinition, Clazz, DataFieldTypeEnum
+from dlibrary.object_base import ObjectTypeEnum
+
+
+class CriteriaTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+
+    def test_no_record_layer_or_class_adds_no_criterion(self):
+        """Falsy arguments used to add 'None' criteria, which gave broken queries."""
+        mock.create_object(MockObjectTypeEnum.RECTANGLE)
+        mock.create_object(MockObjectTypeEnum.LINE)
+        criteria = Criteria().has_record(None).on_layer(None).in_clazz(None)
+        self.assertEqual(criteria.compile().criteria_string, '')
+        self.assertEqual(criteria.is_type(MockObjectTypeEnum.RECTANGLE).count(), 1)
+
+    def test_record_and_layer_criteria(self):
+        mock.create_record_definition('Record', [('Field', 4, '')])
+        layer = mock.create_layer('Layer-2')
+        mock.create_object(MockObjectTypeEnum.RECTANGLE, layer=layer, records={'Record': {}})
+        mock.create_object(MockObjectTypeEnum.RECTANGLE, layer=layer)
+        mock.create_object(MockObjectTypeEnum.RECTANGLE, records={'Record': {}})
+        self.assertEqual(Criteria().has_record(RecordDefinition('Record')).on_layer(Layer.get(layer)).count(), 1)
+
+    def test_equal_criteria_compile_to_equal_queries(self):
+        query = Criteria().is_type(MockObjectTypeEnum.RECTANGLE).in_clazz(Clazz('None')).compile()
+        other = Criteria().in_clazz(Clazz('None')).is_type(MockObjectTypeEnum.RECTANGLE).compile()
+        self.assertEqual(query, other)
+        self.assertEqual(hash(query), hash(other))
+        self.assertEqual(query.criteria_string, other.criteria_string)
+        self.assertNotEqual(query, Criteria().is_type(MockObjectTypeEnum.RECTANGLE).compile())
+
+    def __create_records(self) -> RecordDefinition:
+        mock.create_record_definition('Part', [('Size', DataFieldTypeEnum.NUMBER_GENERAL, '0'),
+                                               ('Label', DataFieldTypeEnum.TEXT, ''),
+                                               ('Done', DataFieldTypeEnum.BOOLEAN, 'False')])
+        for size, label, done in ((1.5, 'A', 'True'), (2.5, 'B', 'False'), (4.0, 'It\'s', 'True')):
+            mock.create_object(MockObjectTypeEnum.RECTANGLE, name=label,
+                               records={'Part': {'Size': str(size), 'Label': label, 'Done': done}})
+        mock.create_object(MockObjectTypeEnum.RECTANGLE, name='No record')
+        return RecordDefinition('Part')
+
+    @staticmethod
+    def __get_names(criteria: Criteria) -> set:
+        return {drawn_object.name for drawn_object in criteria.get()}
+
+    def test_has_field_value(self):
+        record = self.__create_records()
+        self.assertEqual(self.__get_names(Criteria().has_field_value(record, 'Size', 2.5)), {'B'})
+        self.assertEqual(self.__get_names(Criteria().has_field_value(record, 'Size', 2, '>')), {'B', 'It\'s'})
+        self.assertEqual(self.__get_names(Criteria().has_field_value(record, 'Done', True)), {'A', 'It\'s'})
+        self.assertEqual(self.__get_names(Criteria().has_field_value(record, 'Label', 'A', '<>')), {'B', 'It\'s'})
+        self.assertEqual(Criteria().has_field_value(None, 'Size', 1).compile().criteria_string, '')
+        with self.assertRaisesRegex(ValueError, '=>'):
+            Criteria().has_field_value(record, 'Size', 1, '=>')
+
+    def test_quotes_are_escaped(self):
+        record = self.__create_records()
+        criteria = Criteria().has_field_value(record, 'Label', 'It\'s')
+        self.assertEqual(criteria.compile().criteria_string, "('Part'.'Label'='It''s')")
+        self.assertEqual(self.__get_names(criteria), {'It\'s'})
+
+    def test_any_of_and_excluding(self):
+        record = self.__create_records()
+        small = Criteria().has_field_value(record, 'Size', 2, '<')
+        done = Criteria().has_field_value(record, 'Done', True)
+        self.assertEqual(self.__get_names(Criteria().any_of(small, Criteria().has_field_value(record, 'Size', 2.5))),
+                         {'A', 'B'})
+        self.assertEqual(self.__get_names(Criteria().has_record(record).excluding(done)), {'B'})
+        self.assertEqual(self.__get_names(Criteria().has_record(record).any_of(small, done).excluding(small)),
+                         {'It\'s'})
+        self.assertEqual(Criteria().any_of(small, Criteria()).compile().criteria_string, '')
+        self.assertEqual(Criteria().any_of().compile().criteria_string, '')
+        self.assertEqual(Criteria().is_type(MockObjectTypeEnum.RECTANGLE).excluding(Criteria()).count(), 0)
+
+    def test_is_selected_and_is_visible(self):
+        for name in ('Selected', 'Hidden', 'Other'):
+            mock.create_object(MockObjectTypeEnum.RECTANGLE, name=name)
+        vs.GetObject('Selected').object.selected = True
+        vs.GetObject('Hidden').object.visible = False
+        self.assertEqual(self.__get_names(Criteria().is_selected()), {'Selected'})
+        self.assertEqual(self.__get_names(Criteria().is_selected(False)), {'Hidden', 'Other'})
+        self.assertEqual(self.__get_names(Criteria().is_visible(False)), {'Hidden'})
+        self.assertEqual(self.__get_names(Criteria().is_visible().is_selected()), {'Selected'})
+
+    def test_resource_types_are_refused(self):
+        for object_type in (ObjectTypeEnum.RECORD_DEFINITION, ObjectTypeEnum.SYMBOL_DEFINITION):
+            with self.assertRaises(ValueError):
+                Criteria().is_type(object_type)
+
+    def test_results_are_shared_until_marked_dirty(self):
+        mock.create_object(MockObjectTypeEnum.RECTANGLE)
+        with ReuseCriteriaResults():
+            handles = Criteria().is_type(MockObjectTypeEnum.RECTANGLE).compile().get_handles()
+            mock.create_object(MockObjectTypeEnum.RECTANGLE)
+            self.assertIs(Criteria().is_type(MockObjectTypeEnum.RECTANGLE).compile().get_handles(), handles)
+            CriteriaResults().mark_dirty()
+            self.assertEqual(len(Criteria().is_type(MockObjectTypeEnum.RECTANGLE).compile().get_handles()), 2)
+        self.assertFalse(CriteriaResults().is_open)
@@ -1,2 +1,318 @@
 """Test module for all test related to the document module.
 """
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+mock = VectorworksMock.get_installed()
+
+import vs
+from dlibrary.document import SymbolDefinitionResourceList, RecordDefinitionResourceList, ResourceLocation, \
+    ResourceFolder, Units, ResourceCatalogueCache, PrefetchResourceCatalogues, RecordTable, RecordDefinition, \
+    DataFieldTypeEnum, ResourceConflict, LayerRegistry, ReuseLayers, Document, DesignLayer, SheetLayer, \
+    ReuseUnitPreferences
+from dlibrary.object import DrawnObject
+
+
+class RecordTableTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        vs.SetPrefLongInt(162, 3)  # Length precision, as numbers are rounded by it.
+        mock.create_record_definition('Table', [('Count', DataFieldTypeEnum.INTEGER, '0'),
+                                                ('Length', DataFieldTypeEnum.NUMBER_GENERAL, '0'),
+                                                ('Done', DataFieldTypeEnum.BOOLEAN, 'False'),
+                                                ('Label', DataFieldTypeEnum.TEXT, 'None')])
+        self.__handles = [mock.create_object(MockObjectTypeEnum.RECTANGLE, records={'Table': {
+            'Count': str(index), 'Length': '%s.5' % index, 'Done': 'True' if index else 'False'}})
+            for index in range(3)]
+        self.__table = RecordTable(RecordDefinition('Table'))
+
+    def test_read_rows(self):
+        self.assertEqual(self.__table.field_names, ('Count', 'Length', 'Done', 'Label'))
+        self.assertEqual(list(self.__table.read_rows(self.__handles)), [
+            (0, 0.5, False, 'None'), (1, 1.5, True, 'None'), (2, 2.5, True, 'None')])
+        self.assertEqual(list(self.__table.read_rows(self.__handles[:1], ['Label', 'Count'], convert=False)),
+                         [('None', '0')])
+
+    def test_read_rows_of_wrappers(self):
+        wrappers = [DrawnObject(handle) for handle in self.__handles]
+        self.assertEqual([row[0] for row in self.__table.read_rows(wrappers)], [0, 1, 2])
+
+    def test_read_columns(self):
+        columns = self.__table.read_columns(self.__handles, ['Length', 'Count'])
+        self.assertEqual(list(columns.keys()), ['Length', 'Count'])
+        self.assertEqual(columns['Length'], [0.5, 1.5, 2.5])
+        self.assertEqual(columns['Count'], [0, 1, 2])
+
+    def test_write_rows_skips_none(self):
+        self.__table.write_rows(self.__handles[:2], [(7, None, None, 'First'), (None, 3.25, False, None)])
+        self.assertEqual(list(self.__table.read_rows(self.__handles)), [
+            (7, 0.5, False, 'First'), (1, 3.25, False, 'None'), (2, 2.5, True, 'None')])
+
+    def test_write_columns(self):
+        self.__table.write_columns(self.__handles, {'Label': ['A', 'B', 'C'], 'Count': [3, None, 5]})
+        self.assertEqual(self.__table.read_columns(self.__handles, ['Count', 'Label']),
+                         {'Count': [3, 1, 5], 'Label': ['A', 'B', 'C']})
+
+    def test_write_floats_without_exponent(self):
+        self.__table.write_rows(self.__handles[:2], [(None, 1e-07), (None, 1e+20)], ['Count', 'Length'])
+        self.assertEqual(list(self.__table.read_rows(self.__handles[:2], ['Length'], convert=False)),
+                         [('0.0000001',), ('100000000000000000000',)])
+
+    def test_unknown_field_is_named(self):
+        for call in (lambda: list(self.__table.read_rows(self.__handles, ['Count', 'Unknown'])),
+                     lambda: self.__table.read_columns(self.__handles, ['Unknown']),
+                     lambda: self.__table.write_rows(self.__handles, [(1,)], ['Unknown'])):
+            with self.assertRaisesRegex(ValueError, 'Table has no field named: Unknown'):
+                call()
+
+
+class LayerRegistryTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        mock.create_layer('Design Layer-2')
+        mock.create_layer('1', sheet=True)
+
+    def test_same_wrappers_inside_registry(self):
+        with ReuseLayers() as registry:
+            layers = registry.layers
+            self.assertEqual([layer.name for layer in layers], ['Design Layer-1', 'Design Layer-2', '1'])
+            self.assertEqual([type(layer) for layer in layers], [DesignLayer, DesignLayer, SheetLayer])
+            with patch.object(vs, 'NextLayer', wraps=vs.NextLayer) as next_layer:
+                self.assertIs(registry.get('Design Layer-2'), layers[1])
+                self.assertIs(Document().get_layer('1'), layers[2])
+                self.assertEqual(set(registry.sheet_layers), {layers[2]})
+                self.assertFalse(next_layer.called)
+        self.assertFalse(LayerRegistry().is_open)
+        self.assertIsNot(LayerRegistry().get('Design Layer-2'), layers[1])
+
+    def test_get_layer_and_stacking_index(self):
+        self.assertEqual(Document().get_layer('Design Layer-2').name, 'Design Layer-2')
+        self.assertIsNone(Document().get_layer('Unknown'))
+        with ReuseLayers() as registry:
+            self.assertEqual([registry.get_stacking_index(layer) for layer in registry.layers], [0, 1, 2])
+        self.assertEqual(LayerRegistry().get_stacking_index(LayerRegistry().get('1')), 2)
+
+    def test_added_layer_is_noticed(self):
+        with ReuseLayers() as registry:
+            layer = registry.get('Design Layer-2')
+            mock.create_layer('Design Layer-3')
+            self.assertEqual(registry.get('Design Layer-3').name, 'Design Layer-3')
+            self.assertIs(registry.get('Design Layer-2'), layer)
+            self.assertEqual(len(registry.layers), 4)
+
+    def test_invalidate(self):
+        with ReuseLayers() as registry:
+            layer = registry.get('Design Layer-2')
+            registry.invalidate()
+            self.assertIsNot(registry.get('Design Layer-2'), layer)
+            self.assertEqual(registry.get('Design Layer-2').name, 'Design Layer-2')
+
+
+class UnitsTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        vs.SetPrefLongInt(162, 3)  # Length precision, the document units are mm.
+
+    def test_resolve_length_units_without_vw(self):
+        with patch.object(vs, 'ValidNumStr', wraps=vs.ValidNumStr) as valid_num_str:
+            self.assertEqual(Units.resolve_length_units('4605mm'), 4605.0)
+            self.assertEqual(Units.resolve_length_units('1\'6 1/2"'), 469.9)
+            self.assertEqual(Units.resolve_length_units('2m'), 2000.0)
+            self.assertEqual(Units.resolve_length_units('-1.5cm'), -15.0)
+            self.assertEqual(Units.resolve_length_units('3/4"'), 19.05)
+            self.assertEqual(Units.resolve_length_units('12'), 12.0)
+            self.assertEqual(Units.resolve_length_units(('10mm', 5.0)), (10.0, 5.0))
+            self.assertFalse(valid_num_str.called)
+
+    def test_resolve_length_units_like_vw(self):
+        for length in ('4605mm', '1\'6"', '2.5\'', '0.5m', '7in'):
+            self.assertEqual(Units.resolve_length_units(length), round(vs.ValidNumStr(length)[1], 3), length)
+
+    def test_unknown_notations_fall_back_to_vw(self):
+        for length in ('1 1/2', '3yd', '1/0"'):
+            with patch.object(vs, 'ValidNumStr', return_value=(True, 42.0)) as valid_num_str:
+                self.assertEqual(Units.resolve_length_units(length), 42.0)
+                valid_num_str.assert_called_once_with(length)
+
+
+    def test_preferences_are_read_once_while_open(self):
+        with patch.object(vs, 'GetPrefReal', wraps=vs.GetPrefReal) as get_pref_real, \
+                patch.object(vs, 'GetPrefLongInt', wraps=vs.GetPrefLongInt) as get_pref_long_int:
+            with ReuseUnitPreferences():
+                for _ in range(3):
+                    self.assertEqual(Units.to_length_units(2.0), 50.8)
+                    self.assertEqual(Units.to_inches('50.8mm'), 2.0)
+                    self.assertEqual(Units.to_length_string(12.3456), '12.346')
+                self.assertEqual([call[0][0] for call in get_pref_real.call_args_list], [152, 176, 180])
+                self.assertEqual([call[0][0] for call in get_pref_long_int.call_args_list], [162, 179, 183])
+            self.assertFalse(Units().is_open)
+            Units.to_length_units(2.0)
+            self.assertEqual(get_pref_real.call_count, 4)
+
+    def test_refresh(self):
+        with ReuseUnitPreferences():
+            self.assertEqual(Units.to_length_units(1.0), 25.4)
+            vs.SetPrefReal(152, 1.0)  # Inches.
+            self.assertEqual(Units.to_length_units(1.0), 25.4)
+            Units().refresh()
+            self.assertEqual(Units.to_length_units(1.0), 1.0)
+
+
+class AbstractResourceListTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+
+    def test_hidden_resources_are_left_out(self):
+        """Hidden resources used to be deleted from the VW list by ascending index, which deleted the wrong ones."""
+        for name in ('A', '__NNA1', '__NNA2', 'B', 'Plug-in', 'C'):
+            mock.create_record_definition(name, [], plugin_format=name == 'Plug-in')
+        resource_list = RecordDefinitionResourceList()
+        self.assertEqual(list(resource_list.names), ['A', 'B', 'C'])
+        for name in ('A', 'B', 'C'):
+            self.assertEqual(resource_list.get_resource(name).name, name)
+        self.assertFalse(resource_list.is_resource_in_list('__NNA1'))
+        self.assertIsNone(resource_list.get_resource('Plug-in'))
+
+    def test_duplicate_names_resolve_to_the_first(self):
+        mock.create_symbol_definition('Symbol')
+        mock.add_application_resource(MockObjectTypeEnum.SYMBOL_DEFINITION, 'Symbol', ResourceFolder.DEFAULTS)
+        mock.add_application_resource(MockObjectTypeEnum.SYMBOL_DEFINITION, 'Other', ResourceFolder.DEFAULTS)
+        resource_list = SymbolDefinitionResourceList(ResourceLocation.DOC_APP, ResourceFolder.DEFAULTS)
+        self.assertEqual(list(resource_list.names), ['Symbol', 'Symbol', 'Other'])
+        self.assertTrue(resource_list.is_resource_in_document('Symbol'))
+        self.assertFalse(resource_list.is_resource_in_document('Other'))
+
+    def test_remove_resource_keeps_later_names_indexed(self):
+        for name in ('A', 'B', 'C'):
+            mock.create_symbol_definition(name)
+        resource_list = SymbolDefinitionResourceList()
+        resource_list.remove_resource('A')
+        self.assertEqual(list(resource_list.names), ['B', 'C'])
+        self.assertFalse(resource_list.is_resource_in_list('A'))
+        self.assertIsNone(resource_list.get_resource('A'))
+        self.assertEqual(resource_list.get_resource('C').name, 'C')
+        resource_list.remove_resource('Unknown')
+        self.assertEqual(list(resource_list.names), ['B', 'C'])
+
+    def __create_import_list(self) -> SymbolDefinitionResourceList:
+        for name in ('A', 'C'):
+            mock.create_symbol_definition(name)
+        for name in ('A', 'B', 'C'):
+            mock.add_application_resource(MockObjectTypeEnum.SYMBOL_DEFINITION, name, ResourceFolder.DEFAULTS)
+        return SymbolDefinitionResourceList(ResourceLocation.APP, ResourceFolder.DEFAULTS)
+
+    def test_import_resources_skip(self):
+        resource_list = self.__create_import_list()
+        resources = resource_list.import_resources(['A', 'B', 'C'], ResourceConflict.SKIP)
+        self.assertEqual(list(resources.keys()), ['A', 'B', 'C'])
+        self.assertIsNone(resources['A'])
+        self.assertEqual(resources['B'].name, 'B')
+        self.assertIsNone(resources['C'])
+        self.assertEqual(list(resource_list.names), ['A', 'B', 'C'])
+
+    def test_import_resources_replace(self):
+        resource_list = self.__create_import_list()
+        existing = vs.GetObject('A')
+        resources = resource_list.import_resources(['A'], ResourceConflict.REPLACE)
+        self.assertEqual(resources['A'].name, 'A')
+        self.assertNotEqual(resources['A'].handle, existing)
+        self.assertEqual(list(resource_list.names), ['A', 'B', 'C'])
+
+    def test_import_resources_rename_with_one_event(self):
+        resource_list = self.__create_import_list()
+        events = []
+        resource_list.names.list_changed_event.subscribe(lambda removed, added: events.append((removed, added)))
+        resources = resource_list.import_resources(['A', 'B', 'C'], ResourceConflict.RENAME)
+        self.assertEqual([resource.name for resource in resources.values()], ['A-1', 'B', 'C-1'])
+        self.assertEqual(list(resource_list.names), ['A-1', 'B', 'C-1'])
+        self.assertEqual(events, [({0: 'A', 2: 'C'}, {0: 'A-1', 2: 'C-1'})])
+        self.assertEqual(resource_list.get_resource('C-1').name, 'C-1')
+
+    def test_import_resources_not_in_list(self):
+        resource_list = self.__create_import_list()
+        resources = resource_list.import_resources(['Unknown', 'B'])
+        self.assertEqual(list(resources.keys()), ['Unknown', 'B'])
+        self.assertIsNone(resources['Unknown'])
+        self.assertEqual(resources['B'].name, 'B')
+
+
+class ResourceCatalogueCacheTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.__folder = folder.name
+        with open(os.path.join(self.__folder, 'Library.vwx'), 'w') as file:
+            file.write('Library')
+        mock.set_folder_path(ResourceFolder.DEFAULTS, self.__folder)
+        for name in ('Symbol-1', '__Hidden', 'Symbol-2'):
+            mock.add_application_resource(MockObjectTypeEnum.SYMBOL_DEFINITION, name, ResourceFolder.DEFAULTS)
+        # The cache file is kept out of the resource folder, as it would change the files that are checked otherwise.
+        cache_folder = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_folder.cleanup)
+        self.addCleanup(setattr, ResourceCatalogueCache(), 'path', ResourceCatalogueCache().path)
+        ResourceCatalogueCache().path = os.path.join(cache_folder.name, 'catalogues.json')
+
+    @staticmethod
+    def __create_list() -> SymbolDefinitionResourceList:
+        return SymbolDefinitionResourceList(ResourceLocation.APP, ResourceFolder.DEFAULTS)
+
+    def test_names_come_from_the_cache_until_the_list_is_needed(self):
+        self.assertEqual(list(self.__create_list().names), ['Symbol-1', 'Symbol-2'])
+        with patch.object(vs, 'BuildResourceList', wraps=vs.BuildResourceList) as build_resource_list:
+            resource_list = self.__create_list()
+            self.assertEqual(list(resource_list.names), ['Symbol-1', 'Symbol-2'])
+            self.assertTrue(resource_list.is_resource_in_list('Symbol-2'))
+            self.assertFalse(build_resource_list.called)
+            self.assertEqual(resource_list.get_resource('Symbol-2').name, 'Symbol-2')
+            self.assertEqual(build_resource_list.call_count, 1)
+        self.assertEqual(list(resource_list.names), ['Symbol-1', 'Symbol-2'])
+
+    def test_changed_files_make_the_cache_out_of_date(self):
+        self.__create_list().names
+        self.__add_library('Symbol-3', 'Other Library.vwx')
+        self.assertEqual(list(self.__create_list().names), ['Symbol-1', 'Symbol-2', 'Symbol-3'])
+
+    def test_out_of_date_names_are_replaced_when_build(self):
+        self.__create_list().names
+        mock.add_application_resource(MockObjectTypeEnum.SYMBOL_DEFINITION, 'Symbol-3', ResourceFolder.DEFAULTS)
+        resource_list = self.__create_list()
+        self.assertEqual(list(resource_list.names), ['Symbol-1', 'Symbol-2'])
+        self.assertEqual(resource_list.get_resource('Symbol-3').name, 'Symbol-3')
+        self.assertEqual(list(resource_list.names), ['Symbol-1', 'Symbol-2', 'Symbol-3'])
+
+    def __add_library(self, resource_name: str, file_name: str):
+        mock.add_application_resource(MockObjectTypeEnum.SYMBOL_DEFINITION, resource_name, ResourceFolder.DEFAULTS)
+        with open(os.path.join(self.__folder, file_name), 'w') as file:
+            file.write('Library')
+
+    def test_prefetched_files_are_used_in_the_same_run(self):
+        self.__create_list().names
+        with patch.object(ResourceCatalogueCache, 'get_fingerprint',
+                          wraps=ResourceCatalogueCache.get_fingerprint) as get_fingerprint:
+            with PrefetchResourceCatalogues() as cache:
+                cache.prefetch()
+                self.assertEqual(list(self.__create_list().names), ['Symbol-1', 'Symbol-2'])
+            self.assertEqual(get_fingerprint.call_count, 1)  # Only on the worker, not again for the list.
+
+    def test_prefetched_files_are_forgotten_after_the_run(self):
+        self.__create_list().names
+        with PrefetchResourceCatalogues() as cache:
+            cache.prefetch()
+        self.__add_library('Symbol-3', 'Other Library.vwx')
+        self.assertEqual(list(self.__create_list().names), ['Symbol-1', 'Symbol-2', 'Symbol-3'])
+
+    def test_nothing_is_prefetched_outside_a_run(self):
+        self.__create_list().names
+        ResourceCatalogueCache().prefetch()
+        self.__add_library('Symbol-3', 'Other Library.vwx')
+        self.assertEqual(list(self.__create_list().names), ['Symbol-1', 'Symbol-2', 'Symbol-3'])
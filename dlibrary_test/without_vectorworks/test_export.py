@@ -0,0 +1,77 @@
+"""Test module for all test related to the export module.
+"""
+import csv
+import os
+import tempfile
+from unittest import TestCase
+
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+mock = VectorworksMock.get_installed()
+
+import vs
+from dlibrary.document import RecordDefinition, DataFieldTypeEnum
+from dlibrary.export import RecordExporter
+
+
+class RecordExporterTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        vs.SetPrefLongInt(162, 3)  # Length precision, as numbers are rounded by it.
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.__folder = folder.name
+        mock.create_record_definition('Export', [('Count', DataFieldTypeEnum.INTEGER, '0'),
+                                                 ('Length', DataFieldTypeEnum.NUMBER_GENERAL, '0'),
+                                                 ('Done', DataFieldTypeEnum.BOOLEAN, 'False'),
+                                                 ('Label', DataFieldTypeEnum.TEXT, '')])
+        for index in range(5):
+            mock.create_object(MockObjectTypeEnum.RECTANGLE, records={'Export': {
+                'Count': str(index), 'Length': str(index * 1.5), 'Done': 'True' if index % 2 else 'False',
+                'Label': 'Lïne %s' % index}})
+
+    def test_columnar_round_trip(self):
+        path = os.path.join(self.__folder, 'export.columns')
+        exporter = RecordExporter(RecordDefinition('Export'), chunk_size=2)
+        self.assertEqual(exporter.field_types, ('int', 'float', 'bool', 'str'))
+        self.assertEqual(exporter.write_columnar(path), 5)
+        chunks = list(RecordExporter.read_columnar(path))
+        self.assertEqual([len(chunk['Count']) for chunk in chunks], [2, 2, 1])
+        self.assertEqual([value for chunk in chunks for value in chunk['Count']], [0, 1, 2, 3, 4])
+        self.assertEqual([value for chunk in chunks for value in chunk['Length']], [0.0, 1.5, 3.0, 4.5, 6.0])
+        self.assertEqual([value for chunk in chunks for value in chunk['Done']], [False, True, False, True, False])
+        self.assertEqual([value for chunk in chunks for value in chunk['Label']], ['Lïne %s' % i for i in range(5)])
+
+    def test_columnar_file_is_little_endian(self):
+        path = os.path.join(self.__folder, 'export.columns')
+        RecordExporter(RecordDefinition('Export'), ['Count']).write_columnar(path)
+        with open(path, 'rb') as file:
+            file.readline()
+            file.readline()
+            self.assertEqual(file.read(), (5).to_bytes(4, 'little') + b''.join(
+                index.to_bytes(8, 'little') for index in range(5)))
+
+    def test_csv(self):
+        path = os.path.join(self.__folder, 'export.csv')
+        self.assertEqual(RecordExporter(RecordDefinition('Export'), ['Label', 'Count']).write_csv(path), 5)
+        with open(path, newline='', encoding='utf-8') as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[0], ['Label', 'Count'])
+        self.assertEqual(rows[1:], [['Lïne %s' % i, str(i)] for i in range(5)])
+
+    def test_unknown_field_is_named(self):
+        with self.assertRaisesRegex(ValueError, 'Export has no field named: Unknown'):
+            RecordExporter(RecordDefinition('Export'), ['Count', 'Unknown'])
+
+    def test_text_lengths_are_32_bit(self):
+        path = os.path.join(self.__folder, 'export.columns')
+        RecordExporter(RecordDefinition('Export'), ['Label'], chunk_size=2).write_columnar(path)
+        with open(path, 'rb') as file:
+            file.readline()
+            file.readline()
+            labels = ['Lïne %s' % index for index in range(2)]
+            self.assertEqual(file.read(4 + 2 * 4), (2).to_bytes(4, 'little') + b''.join(
+                len(label.encode('utf-8')).to_bytes(4, 'little') for label in labels))
+            self.assertEqual(file.read(sum(len(label.encode('utf-8')) for label in labels)),
+                             ''.join(labels).encode('utf-8'))
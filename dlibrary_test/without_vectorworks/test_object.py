@@ -1,2 +1,206 @@
 """Test module for all test related to the object module.
 """
+from unittest import TestCase
+from unittest.mock import patch
+
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+mock = VectorworksMock.get_installed()
+
+import vs
+from dlibrary.document import SymbolDefinition
+from dlibrary.object import Attributes, AttributesSnapshot, Rectangle, Symbol, SymbolScalingEnum, DeferredReset, \
+    ResetQueue, BatchTransform, DrawnObject
+
+
+class AttributesSnapshotTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        self.__source, self.__target = (DrawnObject(mock.create_object(MockObjectTypeEnum.RECTANGLE)) for _ in range(2))
+
+    def test_diff(self):
+        vs.SetLW(self.__source.handle, 20)
+        vs.SetFillFore(self.__source.handle, (1, 2, 3))
+        snapshot = AttributesSnapshot.read(self.__source.handle)
+        self.assertEqual(snapshot.diff(AttributesSnapshot.read(self.__target.handle)), (1, 4))
+        self.assertEqual(snapshot.diff(snapshot), ())
+        self.assertEqual((snapshot.line_weight, snapshot.fill_fore), (20, (1, 2, 3)))
+        self.assertFalse(snapshot.by_clazz)
+
+    def test_apply_to_only_writes_changed_values(self):
+        vs.SetLW(self.__source.handle, 20)
+        snapshot = AttributesSnapshot.read(self.__source.handle)
+        with patch.object(vs, 'SetLW', wraps=vs.SetLW) as set_lw, \
+                patch.object(vs, 'SetLSN', wraps=vs.SetLSN) as set_lsn:
+            self.assertEqual(snapshot.apply_to((self.__source, self.__target)), 1)
+            set_lw.assert_called_once_with(self.__target.handle, 20)
+            self.assertFalse(set_lsn.called)
+            self.assertEqual(snapshot.apply_to((self.__target,)), 0)
+        self.assertEqual(AttributesSnapshot.read(self.__target.handle), snapshot)
+
+    def test_apply_to_writes_all_values_of_object_by_class(self):
+        Attributes(self.__target.handle).by_clazz = True
+        snapshot = AttributesSnapshot.read(self.__source.handle)
+        self.assertEqual(snapshot.apply_to((self.__target,)), 1)
+        self.assertFalse(Attributes(self.__target.handle).by_clazz)
+        self.assertEqual(AttributesSnapshot.read(self.__target.handle), snapshot)
+
+    def test_apply_by_class_only_reads_by_class(self):
+        Attributes(self.__source.handle).by_clazz = True
+        snapshot = AttributesSnapshot.read(self.__source.handle)
+        with patch.object(vs, 'GetLW', wraps=vs.GetLW) as get_lw:
+            self.assertEqual(snapshot.apply_to((self.__target, self.__source)), 1)
+            self.assertFalse(get_lw.called)
+        self.assertTrue(Attributes(self.__target.handle).by_clazz)
+
+
+class IObjectOrderTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        self.__objects = [DrawnObject(mock.create_object(MockObjectTypeEnum.RECTANGLE)) for _ in range(4)]
+
+    def __get_order(self) -> list:
+        handle = self.__objects[0].handle
+        while vs.PrevObj(handle) is not None:
+            handle = vs.PrevObj(handle)
+        order = []
+        while handle is not None:
+            order.append(self.__objects.index(DrawnObject(handle)))
+            handle = vs.NextObj(handle)
+        return order
+
+    def test_move_forward_collapses_to_front(self):
+        with patch.object(vs, 'HMoveForward', wraps=vs.HMoveForward) as move_forward:
+            self.__objects[1].move_forward(5)
+            move_forward.assert_called_once_with(self.__objects[1].handle, True)
+        self.assertEqual(self.__get_order(), [0, 2, 3, 1])
+
+    def test_move_forward_by_steps(self):
+        with patch.object(vs, 'HMoveForward', wraps=vs.HMoveForward) as move_forward:
+            self.__objects[0].move_forward(2)
+            self.assertEqual(move_forward.call_count, 2)
+            self.assertFalse(any(call[0][1] for call in move_forward.call_args_list))
+        self.assertEqual(self.__get_order(), [1, 2, 0, 3])
+
+    def test_move_backward_collapses_to_back(self):
+        with patch.object(vs, 'HMoveBackward', wraps=vs.HMoveBackward) as move_backward:
+            self.__objects[2].move_backward(3)
+            move_backward.assert_called_once_with(self.__objects[2].handle, True)
+        self.assertEqual(self.__get_order(), [2, 0, 1, 3])
+
+
+class AbstractObjectTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        vs.SetPrefLongInt(162, 3)  # Length precision, as numbers are rounded by it.
+        self.__rectangle = Rectangle(mock.create_object(MockObjectTypeEnum.RECTANGLE, bbox=((0.0, 2.0), (4.0, 0.0))))
+
+    def test_bbox_is_fetched_once(self):
+        with patch.object(vs, 'GetBBox', wraps=vs.GetBBox) as get_bbox:
+            self.assertEqual((self.__rectangle.bb_left, self.__rectangle.bb_top), (0.0, 2.0))
+            self.assertEqual((self.__rectangle.bb_width, self.__rectangle.bb_height), (4.0, 2.0))
+            self.assertEqual(get_bbox.call_count, 1)
+
+    def test_bbox_is_cleared_by_changes(self):
+        changes = (lambda: self.__rectangle.move(1.0, 1.0), lambda: self.__rectangle.rotate(90.0),
+                   lambda: self.__rectangle.reset(), lambda: setattr(self.__rectangle, 'width', 6.0))
+        for change in changes:
+            self.__rectangle.bbox
+            with patch.object(vs, 'GetBBox', wraps=vs.GetBBox) as get_bbox:
+                change()
+                self.assertEqual(self.__rectangle.bbox, self.__rectangle.bbox)
+                self.assertEqual(get_bbox.call_count, 1)
+        self.assertEqual(self.__rectangle.bb_width, 6.0)
+
+    def test_symbol_scaling_clears_bbox_without_reset(self):
+        mock.create_symbol_definition('Symbol', 2.0, 2.0)
+        symbol = Symbol.create(SymbolDefinition('Symbol'), (0.0, 0.0), 0.0)
+        symbol.bbox
+        with patch.object(vs, 'GetBBox', wraps=vs.GetBBox) as get_bbox, \
+                patch.object(vs, 'ResetObject', wraps=vs.ResetObject) as reset_object:
+            symbol.scaling = SymbolScalingEnum.ASYMMETRIC
+            symbol.bbox
+            self.assertEqual(get_bbox.call_count, 1)
+            self.assertFalse(reset_object.called)
+
+
+class DeferredResetTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        vs.SetPrefLongInt(162, 3)  # Length precision, as numbers are rounded by it.
+        mock.create_symbol_definition('Symbol', 2.0, 2.0)
+        self.__symbol = Symbol.create(SymbolDefinition('Symbol'), (0.0, 0.0), 0.0)
+        self.__symbol.scaling = SymbolScalingEnum.ASYMMETRIC
+
+    def test_symbol_is_reset_once(self):
+        with patch.object(vs, 'ResetObject', wraps=vs.ResetObject) as reset_object:
+            with DeferredReset():
+                self.__symbol.scale_x = 2.0
+                self.__symbol.scale_y = 3.0
+                self.__symbol.scale_z = 4.0
+                self.assertFalse(reset_object.called)
+            reset_object.assert_called_once_with(self.__symbol.handle)
+        self.assertEqual((self.__symbol.scale_x, self.__symbol.scale_y, self.__symbol.scale_z), (2.0, 3.0, 4.0))
+
+    def test_nested_blocks_reset_at_outermost_exit(self):
+        with patch.object(vs, 'ResetObject', wraps=vs.ResetObject) as reset_object:
+            with DeferredReset():
+                with DeferredReset():
+                    self.__symbol.scale_x = 2.0
+                self.assertFalse(reset_object.called)
+                self.assertTrue(ResetQueue().is_open)
+                self.__symbol.reset()
+            self.assertEqual(reset_object.call_count, 1)
+            self.assertFalse(ResetQueue().is_open)
+            self.__symbol.scale_x = 3.0
+            self.assertEqual(reset_object.call_count, 2)
+
+    def test_rectangle_width_only_resets_bbox(self):
+        rectangle = Rectangle(mock.create_object(MockObjectTypeEnum.RECTANGLE))
+        with patch.object(vs, 'ResetObject', wraps=vs.ResetObject) as reset_object, \
+                patch.object(vs, 'ResetBBox', wraps=vs.ResetBBox) as reset_bbox:
+            with DeferredReset():
+                rectangle.width = 2.0
+                rectangle.height = 3.0
+            reset_bbox.assert_called_once_with(rectangle.handle)
+            self.assertFalse(reset_object.called)
+
+
+class BatchTransformTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        self.__objects = [DrawnObject(mock.create_object(MockObjectTypeEnum.RECTANGLE)) for _ in range(3)]
+
+    def test_move_adds_up_duplicates_and_skips_zero_moves(self):
+        first, second, third = self.__objects
+        with patch.object(vs, 'HMove', wraps=vs.HMove) as move:
+            BatchTransform.move([first, second, first, third], [1.0, 0.0, 2.0, 0.0], [0.0, 0.0, 1.0, 0.5])
+            self.assertEqual(move.call_args_list, [((first.handle, 3.0, 1.0),), ((third.handle, 0.0, 0.5),)])
+        self.assertEqual(first.bbox.top_left, (3.0, 2.0))
+
+    def test_move_repeats_one_number(self):
+        with patch.object(vs, 'HMove', wraps=vs.HMove) as move:
+            BatchTransform.move(self.__objects, 2.0, [0.0, 1.0, 2.0])
+            self.assertEqual(move.call_args_list, [((o.handle, 2.0, float(i)),) for i, o in enumerate(self.__objects)])
+
+    def test_rotate_skips_full_turns(self):
+        with patch.object(vs, 'HRotate', wraps=vs.HRotate) as rotate:
+            BatchTransform.rotate(self.__objects, [0.0, 360.0, 90.0], [(0.0, 0.0)] * 3)
+            rotate.assert_called_once_with(self.__objects[2].handle, (0.0, 0.0), 90.0)
+            BatchTransform.rotate(self.__objects, -720.0)
+            self.assertEqual(rotate.call_count, 1)
+
+    def test_move_in_stacking_order_combines_repeated_moves(self):
+        first, second, third = self.__objects
+        with patch.object(vs, 'HMoveForward', wraps=vs.HMoveForward) as move_forward, \
+                patch.object(vs, 'HMoveBackward', wraps=vs.HMoveBackward) as move_backward:
+            BatchTransform.move_in_stacking_order([first, first, second, second], [2, 1, 1, -1])
+            move_forward.assert_called_once_with(first.handle, True)  # Less than three objects ahead.
+            self.assertFalse(move_backward.called)
+            BatchTransform.move_in_stacking_order([third, second], -1)
+            self.assertEqual(move_backward.call_count, 2)
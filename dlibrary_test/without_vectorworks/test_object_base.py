@@ -1,2 +1,94 @@
 """Test module for all test related to the object_base module.
 """
+from unittest import TestCase
+from unittest.mock import patch
+
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+mock = VectorworksMock.get_installed()
+
+import vs
+from dlibrary.object_base import ObjectRepository, ReuseObjectWrappers, RecordSchemaRepository
+
+
+class ObjectRepositoryTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        self.__handle = mock.create_object(MockObjectTypeEnum.RECTANGLE, name='Rectangle')
+
+    def test_new_wrapper_outside_identity_map(self):
+        self.assertFalse(ObjectRepository().is_open)
+        self.assertIsNot(ObjectRepository().get(self.__handle), ObjectRepository().get(self.__handle))
+        self.assertEqual(ObjectRepository().get(self.__handle), ObjectRepository().get(self.__handle))
+
+    def test_same_wrapper_inside_identity_map(self):
+        with ReuseObjectWrappers() as repository:
+            wrapper = repository.get(self.__handle)
+            self.assertIs(repository.get(self.__handle), wrapper)
+            self.assertIs(repository.get('Rectangle'), wrapper)
+            with ReuseObjectWrappers():
+                self.assertIs(repository.get(self.__handle), wrapper)
+            self.assertIs(repository.get(self.__handle), wrapper)
+            self.assertIsNone(repository.get('Unknown'))
+        self.assertFalse(ObjectRepository().is_open)
+        self.assertIsNot(ObjectRepository().get(self.__handle), wrapper)
+
+    def test_same_wrapper_in_decorated_function(self):
+
+        @ReuseObjectWrappers()
+        def get_twice():
+            return ObjectRepository().get(self.__handle), ObjectRepository().get(self.__handle)
+
+        first, second = get_twice()
+        self.assertIs(first, second)
+        self.assertIsNot(get_twice()[0], first)
+
+    def test_invalidate(self):
+        other_handle = mock.create_object(MockObjectTypeEnum.RECTANGLE)
+        with ReuseObjectWrappers() as repository:
+            wrapper, other_wrapper = repository.get(self.__handle), repository.get(other_handle)
+            repository.invalidate(self.__handle)
+            self.assertIsNot(repository.get(self.__handle), wrapper)
+            self.assertIs(repository.get(other_handle), other_wrapper)
+            wrapper = repository.get(self.__handle)
+            repository.invalidate('Rectangle')
+            self.assertIsNot(repository.get(self.__handle), wrapper)
+            repository.invalidate()
+            self.assertIsNot(repository.get(other_handle), other_wrapper)
+
+
+class RecordSchemaRepositoryTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        mock.create_record_definition('Record', [('Count', 1, '0'), ('Label', 4, '')])
+        RecordSchemaRepository().invalidate()
+
+    def test_schema_is_created_once(self):
+        with patch.object(vs, 'GetFldName', wraps=vs.GetFldName) as get_field_name:
+            schema = RecordSchemaRepository().get('Record')
+            self.assertEqual(schema.field_names, ('Count', 'Label'))
+            self.assertEqual(schema.get_field('Count').converter('3'), 3)
+            self.assertIs(RecordSchemaRepository().get('Record'), schema)
+            self.assertEqual(get_field_name.call_count, 2)
+        self.assertIsNone(RecordSchemaRepository().get('Unknown'))
+
+    def test_schema_is_created_again_for_other_definition(self):
+        schema = RecordSchemaRepository().get('Record')
+        vs.NewField('Record', 'Done', 'False', 2, 0)
+        other = RecordSchemaRepository().get('Record')
+        self.assertIsNot(other, schema)
+        self.assertEqual(other.field_names, ('Count', 'Label', 'Done'))
+        mock.reset()  # Another document, with a definition of the same name and number of fields.
+        mock.create_record_definition('Record', [('Size', 3, '0'), ('Name', 4, ''), ('Done', 2, 'False')])
+        self.assertEqual(RecordSchemaRepository().get('Record').field_names, ('Size', 'Name', 'Done'))
+
+    def test_invalidate(self):
+        mock.create_record_definition('Other', [('Count', 1, '0')])
+        schema, other = RecordSchemaRepository().get('Record'), RecordSchemaRepository().get('Other')
+        RecordSchemaRepository().invalidate('Record')
+        self.assertIsNot(RecordSchemaRepository().get('Record'), schema)
+        self.assertIs(RecordSchemaRepository().get('Other'), other)
+        RecordSchemaRepository().invalidate()
+        self.assertIsNot(RecordSchemaRepository().get('Other'), other)
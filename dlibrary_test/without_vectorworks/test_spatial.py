@@ -0,0 +1,92 @@
+"""Test module for all test related to the spatial module.
+"""
+import math
+import random
+from unittest import TestCase
+
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock, MockObjectTypeEnum
+
+mock = VectorworksMock.get_installed()
+
+import vs
+from dlibrary.object import DrawnObject
+from dlibrary.spatial import SpatialIndex
+
+
+class SpatialIndexTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        generator = random.Random(42)
+        self.__objects = []
+        for _ in range(200):
+            x, y = generator.uniform(-100.0, 100.0), generator.uniform(-100.0, 100.0)
+            width, height = generator.uniform(0.5, 8.0), generator.uniform(0.5, 8.0)
+            self.__objects.append(DrawnObject(mock.create_object(MockObjectTypeEnum.RECTANGLE,
+                                                                 bbox=((x, y + height), (x + width, y)))))
+        self.__points = [(generator.uniform(-150.0, 150.0), generator.uniform(-150.0, 150.0)) for _ in range(50)]
+
+    def __scan_rect(self, top_left: tuple, bottom_right: tuple) -> set:
+        (left, top), (right, bottom) = top_left, bottom_right
+        found = set()
+        for spatial_object in self.__objects:
+            (bb_left, bb_top), (bb_right, bb_bottom) = vs.GetBBox(spatial_object.handle)
+            if bb_left <= right and bb_right >= left and bb_bottom <= top and bb_top >= bottom:
+                found.add(spatial_object)
+        return found
+
+    @staticmethod
+    def __get_distance(point: tuple, spatial_object: DrawnObject) -> float:
+        (left, top), (right, bottom) = vs.GetBBox(spatial_object.handle)
+        return math.hypot(max(left - point[0], 0, point[0] - right), max(bottom - point[1], 0, point[1] - top))
+
+    def __assert_like_scan(self, index: SpatialIndex):
+        for x, y in self.__points:
+            top_left, bottom_right = (x, y + 20.0), (x + 30.0, y)
+            self.assertEqual(index.query_rect(top_left, bottom_right), self.__scan_rect(top_left, bottom_right))
+            self.assertEqual(index.query_point((x, y)), self.__scan_rect((x, y), (x, y)))
+            # Objects can be equally near, so only the distance has to be the same.
+            nearest = min(self.__get_distance((x, y), o) for o in self.__objects)
+            self.assertEqual(self.__get_distance((x, y), index.nearest((x, y))), nearest)
+
+    def test_queries_like_scan(self):
+        with SpatialIndex(self.__objects) as index:
+            self.assertEqual(len(index), 200)
+            self.__assert_like_scan(index)
+        with SpatialIndex(self.__objects, cell_size=0.5) as index:
+            self.__assert_like_scan(index)
+
+    def test_queries_like_scan_after_move(self):
+        with SpatialIndex(self.__objects) as index:
+            for spatial_object in self.__objects[::3]:
+                spatial_object.move(120.0, -40.0)
+            self.__assert_like_scan(index)
+
+    def test_closed_index_keeps_old_bounds(self):
+        moved = self.__objects[0]
+        (left, top), _ = vs.GetBBox(moved.handle)
+        with SpatialIndex(self.__objects) as index:
+            pass
+        moved.move(1000.0, 1000.0)
+        self.assertIn(moved, index.query_point((left, top)))
+        self.assertNotIn(moved, index.query_point((left + 1000.0, top + 1000.0)))
+        index.update(moved)
+        self.assertNotIn(moved, index.query_point((left, top)))
+        self.assertIn(moved, index.query_point((left + 1000.0, top + 1000.0)))
+
+    def test_oversized_objects_are_found(self):
+        border = DrawnObject(mock.create_object(MockObjectTypeEnum.RECTANGLE, bbox=((-500.0, 500.0), (500.0, 490.0))))
+        self.__objects.append(border)
+        with SpatialIndex(self.__objects) as index:
+            self.__assert_like_scan(index)
+            self.assertIn(border, index.query_point((0.0, 495.0)))
+            self.assertIs(index.nearest((0.0, 600.0)), border)
+            border.move(0.0, -400.0)
+            self.__assert_like_scan(index)
+            index.remove(border)
+            self.assertNotIn(border, index.query_point((0.0, 95.0)))
+
+    def test_empty_index(self):
+        with SpatialIndex([]) as index:
+            self.assertEqual(index.query_rect((0.0, 1.0), (1.0, 0.0)), set())
+            self.assertIsNone(index.nearest((0.0, 0.0)))
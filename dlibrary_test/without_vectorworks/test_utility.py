@@ -1,2 +1,41 @@
 """Test module for all test related to the utility module.
 """
+from unittest import TestCase
+
+from dlibrary.utility import ObservableList, LinkedObservableList
+
+
+class ObservableListTest(TestCase):
+
+    def test_set_items_with_one_event(self):
+        observable = ObservableList(['a', 'b', 'c'])
+        events = []
+        observable.list_changed_event.subscribe(lambda removed, added: events.append((removed, added)))
+        observable.set_items({0: 'x', 2: 'z'})
+        self.assertEqual(list(observable), ['x', 'b', 'z'])
+        self.assertEqual(events, [({0: 'a', 2: 'c'}, {0: 'x', 2: 'z'})])
+        observable.set_items({})
+        self.assertEqual(len(events), 1)
+
+    def test_set_items_while_suspended(self):
+        observable = ObservableList(['a', 'b'])
+        events = []
+        observable.list_changed_event.subscribe(lambda removed, added: events.append((removed, added)))
+        observable.suspend_events()
+        observable.set_items({1: 'y'})
+        self.assertEqual(events, [])
+        observable.resume_events()
+        self.assertEqual(events, [({1: 'b'}, {1: 'y'})])
+
+
+class LinkedObservableListTest(TestCase):
+
+    def test_set_items_keeps_model_in_sync(self):
+        model = [1, 2, 3]
+        linked = LinkedObservableList(model, str, int)
+        events = []
+        linked.list_changed_event.subscribe(lambda removed, added: events.append((removed, added)))
+        linked.set_items({1: '20', 2: '30'})
+        self.assertEqual(list(linked), ['1', '20', '30'])
+        self.assertEqual(model, [1, 20, 30])
+        self.assertEqual(events, [({1: '2', 2: '3'}, {1: '20', 2: '30'})])
@@ -1,2 +1,51 @@
 """Test module for all test related to the vectorworks module.
 """
+from unittest import TestCase
+from unittest.mock import patch
+
+from dlibrary_test.without_vectorworks.testing_mock import VectorworksMock
+
+mock = VectorworksMock.get_installed()
+
+import vs
+from dlibrary.document import PioFieldTypeEnum
+from dlibrary.object_base import RecordSchemaRepository
+from dlibrary.vectorworks import AbstractActivePluginParameters
+
+
+class Parameters(AbstractActivePluginParameters):
+    pass
+
+
+class AbstractActivePluginParametersTest(TestCase):
+
+    def setUp(self):
+        mock.reset()
+        vs.SetPrefLongInt(162, 3)  # Length precision, as numbers are rounded by it.
+        mock.create_record_definition('Plug-in', [('Width', PioFieldTypeEnum.REAL, '1'),
+                                                  ('Flipped', PioFieldTypeEnum.BOOLEAN, 'False')],
+                                      plugin_format=True)
+        self.__instance = mock.create_plugin_object('Plug-in', values={'Width': '2.5', 'Flipped': 'True'})
+        mock.set_active_plugin('Plug-in', self.__instance)
+        # VW puts the parameters inside the vs module, which the mock can't do after a reset.
+        for name, value in (('PWidth', 2.5), ('PFlipped', 1)):
+            patcher = patch.object(vs, name, value, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_schema_is_looked_up_by_plugin_name(self):
+        parameters = Parameters()
+        with patch.object(RecordSchemaRepository, 'get', autospec=True,
+                          side_effect=RecordSchemaRepository.get) as get_schema:
+            self.assertIs(parameters.get_parameter('Flipped'), True)
+            self.assertEqual(parameters.get_parameter('Width'), 2.5)
+            self.assertEqual([call[0][1] for call in get_schema.call_args_list], ['Plug-in'])
+
+    def test_set_parameter(self):
+        parameters = Parameters()
+        parameters.set_parameter('Width', 1e-07)
+        parameters.set_parameter('Flipped', False)
+        self.assertEqual(parameters.get_parameter('Width'), 1e-07)
+        self.assertIs(parameters.get_parameter('Flipped'), False)
+        self.assertEqual(vs.GetRField(self.__instance, 'Plug-in', 'Width'), '0.0000001')
+        self.assertEqual(vs.GetRField(self.__instance, 'Plug-in', 'Flipped'), 'False')
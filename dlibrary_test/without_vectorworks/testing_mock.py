@@ -1,2 +1,1704 @@
 """Module for all mock instances needed for testing, from within our outside Vectorworks.
+
+The VectorworksMock is an in-memory stand-in for the vs module, so DLibrary can be run, tested and timed without a
+Vectorworks seat. It holds a complete document: layers with their objects, classes, record definitions and attached
+records, symbol definitions, vector fills, line styles, application resources, preferences and dialog layouts. As all
+DLibrary modules import vs when they are loaded, the mock has to be installed before importing DLibrary:
+
+    mock = VectorworksMock().install()
+    import dlibrary
+
+The mock is kept lean, so it can drive drawings of 100k objects in CI. It doesn't try to mimic Vectorworks to the last
+detail, only the behaviour that DLibrary relies upon.
 """
+import decimal
+import math
+import re
+import sys
+import types
+
+
+class MockObjectTypeEnum(object):
+    """Holds the object type constants the mock knows about, as Vectorworks returns them through vs.GetTypeN.
+    """
+
+    NONE = 0
+    LINE = 2
+    RECTANGLE = 3
+    POLYGON = 5
+    TEXT = 10
+    GROUP = 11
+    SYMBOL = 15
+    SYMBOL_DEFINITION = 16
+    LOCUS = 17
+    LAYER = 31
+    RECORD_DEFINITION = 47
+    HATCH_FILL_DEFINITION = 66
+    PLUGIN_OBJECT = 86
+    CLASS_DEFINITION = 94
+    LINE_STYLE_DEFINITION = 96
+    TILE_FILL_DEFINITION = 108
+    IMAGE_FILL_DEFINITION = 119
+    GRADIENT_FILL_DEFINITION = 120
+    VIEWPORT = 122
+
+    @staticmethod
+    def from_string(value: str) -> int:
+        """Resolves the object type names that can be used inside criteria, like T=VIEWPORT."""
+        return {
+            'LINE': MockObjectTypeEnum.LINE,
+            'RECT': MockObjectTypeEnum.RECTANGLE,
+            'RECTANGLE': MockObjectTypeEnum.RECTANGLE,
+            'POLY': MockObjectTypeEnum.POLYGON,
+            'POLYGON': MockObjectTypeEnum.POLYGON,
+            'TEXT': MockObjectTypeEnum.TEXT,
+            'GROUP': MockObjectTypeEnum.GROUP,
+            'SYMBOL': MockObjectTypeEnum.SYMBOL,
+            'LOCUS': MockObjectTypeEnum.LOCUS,
+            'PLUGINOBJECT': MockObjectTypeEnum.PLUGIN_OBJECT,
+            'VIEWPORT': MockObjectTypeEnum.VIEWPORT
+        }.get(value.upper())
+
+
+class MockContainerEnum(object):
+    """Where an object lives, which decides if it's found by criteria or not.
+    """
+
+    LAYER = 0
+    GROUP = 1
+    SYMBOL = 2       # Only found with INSYMBOL.
+    OBJECT = 3       # Only found with INOBJECT.
+    RESOURCE = 4     # Never found by criteria.
+    APPLICATION = 5  # Resources in application files, never found by criteria.
+
+
+class MockHandle(object):
+    """Mimics vs.Handle, which is only equal to handles of the same VW object and isn't hashable.
+    """
+
+    __slots__ = ('__object',)
+    __hash__ = None
+
+    def __init__(self, mock_object):
+        """
+        :type mock_object: MockObject
+        """
+        self.__object = mock_object
+
+    @property
+    def object(self):
+        """:rtype: MockObject"""
+        return self.__object
+
+    def __eq__(self, other):
+        return isinstance(other, MockHandle) and other.object is self.__object
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __str__(self):
+        return '<vs.Handle object at 0x%x>' % id(self.__object)
+
+    __repr__ = __str__
+
+
+class MockField(object):
+    """A field of a record definition."""
+
+    __slots__ = ('name', 'type', 'default')
+
+    def __init__(self, name: str, field_type: int, default: str):
+        self.name = name
+        self.type = field_type
+        self.default = default
+
+
+class MockObject(object):
+    """Any VW object: layers, drawing objects, resources and attached records.
+
+    Everything that's not needed by most objects is created on first use, to keep big drawings light.
+    """
+
+    __slots__ = ('type', 'name', 'handle', 'parent', 'container', 'children', 'clazz', 'bbox', 'origin', 'rotation',
+                 'points', 'text', 'records', 'variables', 'attributes', 'fields', 'definition', 'values', 'selected',
+                 'visible', 'plugin_format', 'resets', 'deleted')
+
+    def __init__(self, object_type: int, name: str='', clazz: str='None'):
+        self.type = object_type
+        self.name = name
+        self.handle = MockHandle(self)
+        self.parent = None
+        """@type: MockObject"""
+        self.container = MockContainerEnum.LAYER
+        self.children = None
+        """@type: list[MockObject]"""
+        self.clazz = clazz
+        self.bbox = [0.0, 0.0, 0.0, 0.0]  # left, top, right, bottom, where top > bottom, as y goes up in VW.
+        self.origin = (0.0, 0.0)
+        self.rotation = 0.0
+        self.points = None
+        self.text = ''
+        self.records = None
+        """@type: list[MockObject]"""
+        self.variables = None
+        """@type: dict[int, object]"""
+        self.attributes = None
+        """@type: dict[str, object]"""
+        self.fields = None
+        """@type: list[MockField]"""
+        self.definition = None
+        """@type: MockObject"""
+        self.values = None
+        """@type: dict[str, str]"""
+        self.selected = False
+        self.visible = True
+        self.plugin_format = False
+        self.resets = 0
+        self.deleted = False
+
+    def get_variable(self, index: int, default=None):
+        return self.variables.get(index, default) if self.variables is not None else default
+
+    def set_variable(self, index: int, value):
+        if self.variables is None:
+            self.variables = dict()
+        self.variables[index] = value
+
+    def get_attribute(self, name: str):
+        return self.attributes.get(name, MockObject.__DEFAULT_ATTRIBUTES[name]) \
+            if self.attributes is not None else MockObject.__DEFAULT_ATTRIBUTES[name]
+
+    def set_attribute(self, name: str, value):
+        if self.attributes is None:
+            self.attributes = dict()
+        self.attributes[name] = value
+
+    def add_child(self, child, container: int):
+        """
+        :type child: MockObject
+        """
+        if self.children is None:
+            self.children = list()
+        child.parent = self
+        child.container = container
+        self.children.append(child)
+
+    def get_record(self, name: str):
+        """:rtype: MockObject"""
+        for record in self.records or ():
+            if record.definition.name == name:
+                return record
+        return None
+
+    def move(self, delta_x: float, delta_y: float):
+        self.bbox[0] += delta_x
+        self.bbox[1] += delta_y
+        self.bbox[2] += delta_x
+        self.bbox[3] += delta_y
+        self.origin = (self.origin[0] + delta_x, self.origin[1] + delta_y)
+        for child in self.children or ():
+            child.move(delta_x, delta_y)
+
+    @property
+    def center(self) -> tuple:
+        return (self.bbox[0] + self.bbox[2]) / 2, (self.bbox[1] + self.bbox[3]) / 2
+
+    __DEFAULT_ATTRIBUTES = {
+        'LSN': 2, 'LW': 1, 'PenFore': (0, 0, 0), 'PenBack': (65535, 65535, 65535), 'FillFore': (0, 0, 0),
+        'FillBack': (65535, 65535, 65535), 'FPat': 1, 'Opacity': 100,
+        'BeginningMarker': (0, 15, 0.125, 0.0625, 0, 0.0, True), 'EndMarker': (0, 15, 0.125, 0.0625, 0, 0.0, True),
+        'LSByClass': False, 'LWByClass': False, 'PenColorByClass': False, 'FillColorByClass': False,
+        'FPatByClass': False, 'OpacityByClass': False, 'MarkerByClass': False
+    }
+
+
+class MockCriteria(object):
+    """Compiles VW criteria strings, like (T=VIEWPORT) & (L='Layer-1'), into predicates on mock objects.
+
+    Compiled criteria are cached by their string, as scripts tend to use the same criteria over and over again.
+    """
+
+    __TOKENS = re.compile(r"\s*(?:('(?:[^']|'')*')|(<>|<=|>=|=|<|>)|([()\[\],.&|])|(-?\d+(?:\.\d+)?)|([A-Za-z_]\w*))")
+
+    def __init__(self, criteria: str):
+        self.__tokens = self.__tokenize(criteria)
+        self.__position = 0
+        self.in_symbols = False
+        self.in_objects = False
+        self.predicate = self.__parse_or() if self.__tokens else (lambda o: True)
+        if self.__position != len(self.__tokens):
+            raise ValueError('Invalid criteria: %s' % criteria)
+
+    @classmethod
+    def __tokenize(cls, criteria: str) -> list:
+        tokens = list()
+        position = 0
+        criteria = criteria.rstrip()
+        while position < len(criteria):
+            match = cls.__TOKENS.match(criteria, position)
+            if match is None:
+                raise ValueError('Invalid criteria: %s' % criteria)
+            string, operator, symbol, number, word = match.groups()
+            tokens.append(
+                ('STR', string[1:-1].replace("''", "'")) if string is not None else
+                ('OP', operator) if operator is not None else
+                ('SYM', symbol) if symbol is not None else
+                ('NUM', float(number)) if number is not None else
+                ('WORD', word.upper()))
+            position = match.end()
+        return tokens
+
+    def __peek(self) -> tuple:
+        return self.__tokens[self.__position] if self.__position < len(self.__tokens) else (None, None)
+
+    def __next(self, kind: str=None, value=None):
+        token = self.__peek()
+        if (kind is not None and token[0] != kind) or (value is not None and token[1] != value):
+            raise ValueError('Invalid criteria, expected %s but got %s.' % (value or kind, token[1]))
+        self.__position += 1
+        return token[1]
+
+    def __parse_or(self):
+        predicates = [self.__parse_and()]
+        while self.__peek() == ('SYM', '|'):
+            self.__next()
+            predicates.append(self.__parse_and())
+        return predicates[0] if len(predicates) == 1 else (lambda o: any(p(o) for p in predicates))
+
+    def __parse_and(self):
+        predicates = [self.__parse_not()]
+        while self.__peek() == ('SYM', '&'):
+            self.__next()
+            predicates.append(self.__parse_not())
+        return predicates[0] if len(predicates) == 1 else (lambda o: all(p(o) for p in predicates))
+
+    def __parse_not(self):
+        if self.__peek() == ('WORD', 'NOT'):
+            self.__next()
+            predicate = self.__parse_not()
+            return lambda o: not predicate(o)
+        return self.__parse_factor()
+
+    def __parse_factor(self):
+        kind, value = self.__peek()
+        if (kind, value) == ('SYM', '('):
+            self.__next()
+            predicate = self.__parse_or()
+            self.__next('SYM', ')')
+            return predicate
+        if kind == 'STR':
+            return self.__parse_field()
+        self.__next('WORD')
+        return {
+            'INSYMBOL': self.__parse_in_symbols,
+            'INOBJECT': self.__parse_in_objects,
+            'ALL': lambda: (lambda o: True),
+            'T': self.__parse_type,
+            'L': lambda: self.__parse_name(lambda o: MockCriteria.__get_layer_name(o)),
+            'C': lambda: self.__parse_name(lambda o: o.clazz),
+            'N': lambda: self.__parse_name(lambda o: o.name),
+            'R': self.__parse_record,
+            'SEL': lambda: self.__parse_boolean(lambda o: o.selected),
+            'V': lambda: self.__parse_boolean(lambda o: o.visible),
+            'VSEL': lambda: self.__parse_boolean(lambda o: o.visible and o.selected)
+        }[value]()
+
+    def __parse_in_symbols(self):
+        self.in_symbols = True
+        return lambda o: True
+
+    def __parse_in_objects(self):
+        self.in_objects = True
+        return lambda o: True
+
+    def __parse_type(self):
+        operator = self.__next('OP')
+        kind, value = self.__peek()
+        self.__next()
+        object_type = int(value) if kind == 'NUM' else MockObjectTypeEnum.from_string(value)
+        return (lambda o: o.type == object_type) if operator == '=' else (lambda o: o.type != object_type)
+
+    def __parse_name(self, get_name: callable):
+        operator = self.__next('OP')
+        name = self.__next('STR')
+        return (lambda o: get_name(o) == name) if operator == '=' else (lambda o: get_name(o) != name)
+
+    def __parse_record(self):
+        self.__next('WORD', 'IN')
+        self.__next('SYM', '[')
+        names = {self.__next('STR')}
+        while self.__peek() == ('SYM', ','):
+            self.__next()
+            names.add(self.__next('STR'))
+        self.__next('SYM', ']')
+        return lambda o: o.records is not None and any(r.definition.name in names for r in o.records)
+
+    def __parse_boolean(self, get_value: callable):
+        operator = self.__next('OP')
+        expected = self.__next('WORD') == 'TRUE'
+        return (lambda o: get_value(o) == expected) if operator == '=' else (lambda o: get_value(o) != expected)
+
+    def __parse_field(self):
+        record_name = self.__next('STR')
+        self.__next('SYM', '.')
+        field_name = self.__next('STR')
+        operator = self.__next('OP')
+        kind, expected = self.__peek()
+        self.__next()
+        compare = {
+            '=': lambda a, b: a == b, '<>': lambda a, b: a != b, '<': lambda a, b: a < b, '>': lambda a, b: a > b,
+            '<=': lambda a, b: a <= b, '>=': lambda a, b: a >= b
+        }[operator]
+
+        def predicate(o) -> bool:
+            record = o.get_record(record_name)
+            if record is None:
+                return False
+            value = MockCriteria.__get_field_value(record, field_name)
+            if kind == 'NUM':
+                try:
+                    value = float(value)
+                except ValueError:
+                    return False
+            elif kind == 'WORD':  # Boolean fields are compared with TRUE or FALSE.
+                value = 'TRUE' if value.lower() in ('true', 'yes', 'y', '1') else 'FALSE'
+            return compare(value, expected)
+
+        return predicate
+
+    @staticmethod
+    def __get_field_value(record, field_name: str) -> str:
+        """
+        :type record: MockObject
+        """
+        if field_name in record.values:
+            return record.values[field_name]
+        for field in record.definition.fields:
+            if field.name == field_name:
+                return field.default
+        return ''
+
+    @staticmethod
+    def __get_layer_name(mock_object) -> str:
+        """
+        :type mock_object: MockObject
+        """
+        while mock_object is not None and mock_object.type != MockObjectTypeEnum.LAYER:
+            mock_object = mock_object.parent
+        return mock_object.name if mock_object is not None else ''
+
+
+class MockControl(object):
+    """A dialog control, holding the state of all control kinds, as the vs calls decide how it's used."""
+
+    def __init__(self, kind: str, text: str=''):
+        self.kind = kind
+        self.text = text
+        self.help_text = ''
+        self.enabled = True
+        self.value = False
+        self.choices = list()
+        """@type: list[str]"""
+        self.selected_choices = set()
+        self.popup_selected = 0
+        self.columns = list()
+        """@type: list[dict]"""
+        self.rows = list()
+        """@type: list[list[tuple]]"""
+        self.selected_rows = set()
+        self.sort_column = -1
+        self.sort_descending = False
+        self.drag_drop = False
+        self.event_info = (False, 0, -1, -1)
+
+
+class MockDialog(object):
+    """A dialog layout and its controls."""
+
+    def __init__(self, title: str):
+        self.title = title
+        self.controls = {}
+        """@type: dict[int, MockControl]"""
+        self.events = list()
+        """@type: list[(int, int)]"""
+
+
+class MockResourceList(object):
+    """A resource list, build by vs.BuildResourceList, with its resources in document or application files."""
+
+    def __init__(self, resources: list):
+        """
+        :type resources: list[MockObject]
+        """
+        self.resources = resources
+
+
+# noinspection PyPep8Naming
+class VectorworksMock(object):
+    """The in-memory stand-in for the vs module.
+
+    All public CamelCase methods mimic the vs call with the same name, the snake_case methods are for building up the
+    document and scripting the environment, like plugin events and dialog events.
+    """
+
+    __installed = None
+
+    def __init__(self):
+        self.reset()
+
+    @staticmethod
+    def get_installed():
+        """Get the mock that is installed as the vs module, after installing a new one if there is none yet.
+        DLibrary keeps using the vs module it was first loaded with, so all test modules have to share this mock.
+        :rtype: VectorworksMock
+        """
+        return VectorworksMock.__installed or VectorworksMock().install()
+
+    def reset(self):
+        """Starts over with a new, empty document, with one design layer and the None class."""
+        self.__layers = list()
+        """@type: list[MockObject]"""
+        self.__layer_indexes = dict()
+        """@type: dict[MockObject, int]"""
+        self.__resources = list()
+        """@type: list[MockObject]"""
+        self.__names = dict()
+        """@type: dict[str, MockObject]"""
+        self.__application_resources = dict()
+        """@type: dict[(int, str), list[MockObject]]"""
+        self.__resource_lists = dict()
+        """@type: dict[int, MockResourceList]"""
+        self.__dialogs = dict()
+        """@type: dict[int, MockDialog]"""
+        self.__criteria = dict()
+        """@type: dict[str, MockCriteria]"""
+        self.__containers = list()
+        """@type: list[MockObject]"""
+        self.__last_new_object = None
+        self.__active_layer = None
+        self.__active_class = 'None'
+        self.__text_origin = (0.0, 0.0)
+        self.__text_just = 1
+        self.__text_vertical_align = 1
+        self.__pen_location = (0.0, 0.0)
+        self.__closed_poly = True
+        self.__fill_pattern = 1
+        self.__pen_pattern = 2
+        self.__preferences = {
+            57: 10 * 42.42424,   # Text size.
+            152: 25.4,           # Length units per inch, mm.
+            154: 'mm',           # Length unit mark.
+            162: 0,              # Length precision.
+            176: 0.00064516,     # Area units per square inch, m².
+            178: 'm²',           # Area unit mark.
+            179: 2,              # Area precision.
+            180: 1.6387064e-05,  # Volume units per cubic inch, m³.
+            182: 'm³',           # Volume unit mark.
+            183: 3,              # Volume precision.
+            529: 0,              # Fill type.
+            590: 0               # State eventing.
+        }
+        self.__file_name = 'Untitled.vwx'
+        self.__file_directory = ''
+        self.__version = (22, 0, 0, 2, 0)  # 2017 on Windows.
+        self.__serial_number = 'XXXXXX-XXXXXX-XXXXXX-123456'
+        self.__plugin_name = ''
+        self.__plugin_folder = ''
+        self.__folder_paths = dict()
+        """@type: dict[int, str]"""
+        self.__plugin_instance = None
+        """@type: MockObject"""
+        self.__event = (0, 0)
+        self.__alert_answer = 1
+        self.__messages = list()
+        self.__module = None
+        self.__add_resource(MockObject(MockObjectTypeEnum.CLASS_DEFINITION, 'None'))
+        self.create_layer('Design Layer-1')
+        return self
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # SETUP ------------------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def install(self):
+        """Installs the mock as the vs module, to be done before importing DLibrary.
+        :rtype: VectorworksMock
+        """
+        module = types.ModuleType('vs')
+        module.Handle = MockHandle
+        for name in dir(type(self)):
+            if name[:1].isupper() or name.startswith('vso'):
+                setattr(module, name, getattr(self, name))
+        self.__module = module
+        sys.modules['vs'] = module
+        VectorworksMock.__installed = self
+        return self
+
+    @property
+    def module(self) -> types.ModuleType:
+        return self.__module
+
+    @property
+    def messages(self) -> list:
+        """All messages shown with vs.Message and the alert calls, in order."""
+        return self.__messages
+
+    def set_file(self, directory: str, file_name: str):
+        """Sets the file the document is saved as, which is unsaved by default."""
+        self.__file_directory = directory
+        self.__file_name = file_name
+
+    def set_preference(self, index: int, value):
+        self.__preferences[index] = value
+
+    def set_alert_answer(self, answer: int):
+        """Sets the button that will be 'clicked' in alert questions, 1 = Ok by default."""
+        self.__alert_answer = answer
+
+    def set_active_plugin(self, name: str, instance: MockHandle=None, parameters: dict=None, folder: str=''):
+        """Sets the running plugin, with it's instance if the plugin is an object and the parameter values.
+        Parameters are put inside the vs module, prefixed with 'P', just like VW does.
+        """
+        self.__plugin_name = name
+        self.__plugin_instance = instance.object if instance is not None else None
+        self.__plugin_folder = folder
+        for parameter, value in (parameters or {}).items():
+            setattr(self.__module, 'P%s' % parameter, value) if self.__module is not None else None
+
+    def set_folder_path(self, folder: int, path: str):
+        """Sets the path returned by vs.GetFolderPath, negative folders are those in the user folder."""
+        self.__folder_paths[folder] = path
+
+    def set_event(self, event: int, data: int=0):
+        """Sets the plugin event returned by vs.vsoGetEventInfo."""
+        self.__event = (event, data)
+
+    def queue_dialog_event(self, dialog_id: int, item: int, data: int=0, list_browser_event: tuple=None):
+        """Queues a dialog event, which will be sent to the dialog handler when the dialog runs.
+        :type list_browser_event: (int, int, int) -> (event_type, row_index, column_index)
+        """
+        self.__dialogs[dialog_id].events.append((item, data, list_browser_event))
+
+    def get_dialog(self, dialog_id: int) -> MockDialog:
+        return self.__dialogs[dialog_id]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # DOCUMENT BUILDING ------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def create_layer(self, name: str, sheet: bool=False, scale: float=1.0, title: str='',
+                     description: str='') -> MockHandle:
+        """Creates a design or sheet layer, the first design layer created will become the active layer."""
+        layer = MockObject(MockObjectTypeEnum.LAYER, name)
+        layer.set_variable(154, 2 if sheet else 1)
+        layer.set_variable(159, title)
+        layer.set_variable('scale', scale)
+        layer.set_variable('description', description)
+        layer.children = list()
+        self.__layer_indexes[layer] = len(self.__layers)
+        self.__layers.append(layer)
+        self.__names[name] = layer
+        if self.__active_layer is None and not sheet:
+            self.__active_layer = layer
+        return layer.handle
+
+    def set_active_layer(self, layer: MockHandle):
+        self.__active_layer = layer.object
+
+    def create_class(self, name: str) -> MockHandle:
+        clazz = self.__names.get(name)
+        if clazz is None:
+            clazz = self.__add_resource(MockObject(MockObjectTypeEnum.CLASS_DEFINITION, name))
+        return clazz.handle
+
+    def create_record_definition(self, name: str, fields: list, plugin_format: bool=False) -> MockHandle:
+        """
+        :type fields: list[(str, int, str)] -> name, type (DataFieldTypeEnum | PioFieldTypeEnum), default value
+        :param plugin_format: Whether it's the parametric record of a plugin, which uses PioFieldTypeEnum types.
+        """
+        definition = MockObject(MockObjectTypeEnum.RECORD_DEFINITION, name)
+        definition.plugin_format = plugin_format
+        definition.fields = [MockField(field_name, field_type, default) for field_name, field_type, default in fields]
+        return self.__add_resource(definition).handle
+
+    def create_symbol_definition(self, name: str, width: float=1.0, height: float=1.0) -> MockHandle:
+        """Creates a symbol definition holding one rectangle, centered around the insertion point."""
+        definition = self.__add_resource(MockObject(MockObjectTypeEnum.SYMBOL_DEFINITION, name))
+        content = MockObject(MockObjectTypeEnum.RECTANGLE)
+        content.bbox = [-width / 2, height / 2, width / 2, -height / 2]
+        definition.add_child(content, MockContainerEnum.SYMBOL)
+        definition.bbox = list(content.bbox)
+        return definition.handle
+
+    def create_resource(self, resource_type: int, name: str) -> MockHandle:
+        """Creates any other resource, like vector fills and line styles."""
+        return self.__add_resource(MockObject(resource_type, name)).handle
+
+    def create_object(self, object_type: int, bbox: tuple=((0.0, 1.0), (1.0, 0.0)), layer: MockHandle=None,
+                      clazz: str='None', name: str='', records: dict=None, container: MockHandle=None) -> MockHandle:
+        """Creates a drawing object, placed on the given layer or container, or the active layer otherwise.
+
+        :type bbox: ((float, float), (float, float)) -> top left, bottom right
+        :type records: dict[str, dict[str, str]] -> record name, field values
+        """
+        mock_object = MockObject(object_type, name, clazz)
+        (left, top), (right, bottom) = bbox
+        mock_object.bbox = [left, top, right, bottom]
+        mock_object.origin = mock_object.center
+        if object_type == MockObjectTypeEnum.PLUGIN_OBJECT:
+            mock_object.children = list()
+        self.__place(mock_object, container.object if container is not None else
+                     (layer.object if layer is not None else None))
+        for record_name, values in (records or {}).items():
+            self.attach_record(mock_object.handle, record_name, values)
+        return mock_object.handle
+
+    def create_plugin_object(self, name: str, origin: tuple=(0.0, 0.0), values: dict=None,
+                             layer: MockHandle=None) -> MockHandle:
+        """Creates a plugin object instance, which will have it's parametric record attached.
+        The parametric record definition has to exist, with the same name as the plugin.
+        """
+        handle = self.create_object(MockObjectTypeEnum.PLUGIN_OBJECT, (origin, origin), layer, name='',
+                                    records={name: values or {}})
+        handle.object.origin = tuple(origin)
+        self.__names[name].plugin_format = True
+        return handle
+
+    def attach_record(self, handle: MockHandle, record_name: str, values: dict=None) -> MockHandle:
+        """Attaches a record to the object, or updates the values if it's already attached.
+        :type values: dict[str, str]
+        """
+        mock_object = handle.object
+        record = mock_object.get_record(record_name)
+        if record is None:
+            record = MockObject(MockObjectTypeEnum.RECORD_DEFINITION)
+            record.definition = self.__names[record_name]
+            record.values = dict()
+            record.parent = mock_object
+            record.container = MockContainerEnum.RESOURCE
+            if mock_object.records is None:
+                mock_object.records = list()
+            mock_object.records.append(record)
+        record.values.update(values or {})
+        return record.handle
+
+    def add_application_resource(self, resource_type: int, name: str, folder: int=14, path: str='',
+                                 plugin_format: bool=False):
+        """Adds a resource to the application folders, which can be listed through resource lists.
+        :type folder: ResourceFolder
+        """
+        resource = MockObject(resource_type, name)
+        resource.container = MockContainerEnum.APPLICATION
+        resource.plugin_format = plugin_format
+        if resource_type == MockObjectTypeEnum.RECORD_DEFINITION:
+            resource.fields = list()
+        self.__application_resources.setdefault((folder, path), list()).append(resource)
+
+    def objects(self) -> list:
+        """All drawing objects in the document, layer by layer, in stacking order.
+        :rtype: list[MockHandle]
+        """
+        return [o.handle for o in self.__iterate(True, True)]
+
+    def __add_resource(self, resource: MockObject) -> MockObject:
+        resource.container = MockContainerEnum.RESOURCE
+        if resource.type == MockObjectTypeEnum.RECORD_DEFINITION and resource.fields is None:
+            resource.fields = list()
+        self.__resources.append(resource)
+        self.__names[resource.name] = resource
+        return resource
+
+    def __place(self, mock_object: MockObject, container: MockObject=None):
+        if container is None:
+            container = self.__containers[-1] if self.__containers else self.__active_layer
+        container.add_child(mock_object, {
+            MockObjectTypeEnum.LAYER: MockContainerEnum.LAYER,
+            MockObjectTypeEnum.GROUP: MockContainerEnum.GROUP,
+            MockObjectTypeEnum.SYMBOL_DEFINITION: MockContainerEnum.SYMBOL
+        }.get(container.type, MockContainerEnum.OBJECT))
+        if mock_object.name:
+            self.__names[mock_object.name] = mock_object
+        self.__last_new_object = mock_object
+
+    def __create(self, object_type: int, left: float, top: float, right: float, bottom: float) -> MockObject:
+        mock_object = MockObject(object_type, clazz=self.__active_class)
+        mock_object.bbox = [min(left, right), max(top, bottom), max(left, right), min(top, bottom)]
+        mock_object.origin = mock_object.center
+        self.__place(mock_object)
+        return mock_object
+
+    def __iterate(self, in_symbols: bool, in_objects: bool):
+        """Walks over all drawing objects, in document order, the way ForEachObject does."""
+        stack = list()
+        for layer in self.__layers:
+            stack.extend(reversed(layer.children))
+            while stack:
+                mock_object = stack.pop()
+                yield mock_object
+                if mock_object.children and (mock_object.type == MockObjectTypeEnum.GROUP or in_objects):
+                    stack.extend(reversed(mock_object.children))
+        if in_symbols:
+            for resource in self.__resources:
+                if resource.type == MockObjectTypeEnum.SYMBOL_DEFINITION and resource.children:
+                    stack.extend(reversed(resource.children))
+                    while stack:
+                        mock_object = stack.pop()
+                        yield mock_object
+                        if mock_object.children and (mock_object.type == MockObjectTypeEnum.GROUP or in_objects):
+                            stack.extend(reversed(mock_object.children))
+
+    def __get_index(self, name: str) -> int:
+        resource = self.__names.get(name)
+        return self.__resources.index(resource) + 1 if resource in self.__resources else 0
+
+    @staticmethod
+    def __in_document(resource: MockObject) -> bool:
+        return resource.container == MockContainerEnum.RESOURCE and not resource.deleted
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # VS: OBJECTS ------------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def GetObject(self, name: str) -> MockHandle:
+        mock_object = self.__names.get(name)
+        return mock_object.handle if mock_object is not None and not mock_object.deleted else None
+
+    def GetTypeN(self, handle: MockHandle) -> int:
+        return handle.object.type if isinstance(handle, MockHandle) else 0
+
+    def GetName(self, handle: MockHandle) -> str:
+        mock_object = handle.object
+        return mock_object.definition.name if mock_object.definition is not None else mock_object.name
+
+    def LNewObj(self) -> MockHandle:
+        return self.__last_new_object.handle if self.__last_new_object is not None else None
+
+    def ForEachObject(self, callback: callable, criteria: str):
+        compiled = self.__criteria.get(criteria)
+        if compiled is None:
+            compiled = self.__criteria[criteria] = MockCriteria(criteria)
+        predicate = compiled.predicate
+        for mock_object in list(self.__iterate(compiled.in_symbols, compiled.in_objects)):
+            if predicate(mock_object):
+                callback(mock_object.handle)
+
+    def GetLayer(self, handle: MockHandle) -> MockHandle:
+        mock_object = handle.object
+        while mock_object is not None and mock_object.type != MockObjectTypeEnum.LAYER:
+            mock_object = mock_object.parent
+        return mock_object.handle if mock_object is not None else None
+
+    def GetClass(self, handle: MockHandle) -> str:
+        return handle.object.clazz
+
+    def SetClass(self, handle: MockHandle, name: str):
+        self.create_class(name)
+        handle.object.clazz = name
+
+    def GetBBox(self, handle: MockHandle) -> tuple:
+        left, top, right, bottom = handle.object.bbox
+        return (left, top), (right, bottom)
+
+    def Get2DPt(self, handle: MockHandle, index: int) -> tuple:
+        left, top, right, bottom = handle.object.bbox
+        return {1: (left, top), 2: (right, top), 3: (right, bottom), 4: (left, bottom)}.get(
+            index, handle.object.center)
+
+    def HMove(self, handle: MockHandle, delta_x: float, delta_y: float):
+        handle.object.move(delta_x, delta_y)
+
+    def HRotate(self, handle: MockHandle, origin: tuple, angle: float):
+        mock_object = handle.object
+        radians = math.radians(angle)
+        cos, sin = math.cos(radians), math.sin(radians)
+
+        def rotate(point: tuple) -> tuple:
+            x, y = point[0] - origin[0], point[1] - origin[1]
+            return origin[0] + x * cos - y * sin, origin[1] + x * sin + y * cos
+
+        left, top, right, bottom = mock_object.bbox
+        corners = [rotate(point) for point in ((left, top), (right, top), (right, bottom), (left, bottom))]
+        mock_object.bbox = [min(x for x, y in corners), max(y for x, y in corners),
+                            max(x for x, y in corners), min(y for x, y in corners)]
+        mock_object.origin = rotate(mock_object.origin)
+        mock_object.rotation = (mock_object.rotation + angle) % 360
+
+    def HMoveForward(self, handle: MockHandle, to_front: bool):
+        siblings = handle.object.parent.children
+        index = siblings.index(handle.object)
+        siblings.insert(len(siblings) if to_front else min(index + 1, len(siblings) - 1), siblings.pop(index))
+
+    def HMoveBackward(self, handle: MockHandle, to_back: bool):
+        siblings = handle.object.parent.children
+        index = siblings.index(handle.object)
+        siblings.insert(0 if to_back else max(index - 1, 0), siblings.pop(index))
+
+    def NextObj(self, handle: MockHandle) -> MockHandle:
+        siblings = handle.object.parent.children
+        index = siblings.index(handle.object) + 1
+        return siblings[index].handle if index < len(siblings) else None
+
+    def PrevObj(self, handle: MockHandle) -> MockHandle:
+        siblings = handle.object.parent.children
+        index = siblings.index(handle.object) - 1
+        return siblings[index].handle if index >= 0 else None
+
+    def HWidth(self, handle: MockHandle) -> float:
+        left, top, right, bottom = handle.object.bbox
+        return right - left
+
+    def HHeight(self, handle: MockHandle) -> float:
+        left, top, right, bottom = handle.object.bbox
+        return top - bottom
+
+    def SetWidth(self, handle: MockHandle, width: float):
+        handle.object.bbox[2] = handle.object.bbox[0] + width
+
+    def SetHeight(self, handle: MockHandle, height: float):
+        handle.object.bbox[3] = handle.object.bbox[1] - height
+
+    def ResetBBox(self, handle: MockHandle):
+        handle.object.resets += 1
+
+    def ResetObject(self, handle: MockHandle):
+        handle.object.resets += 1
+
+    def GetSymLoc(self, handle: MockHandle) -> tuple:
+        return handle.object.origin
+
+    def GetSymRot(self, handle: MockHandle) -> float:
+        return handle.object.rotation
+
+    def GetObjectVariableInt(self, handle: MockHandle, index: int) -> int:
+        return handle.object.get_variable(index, 1 if index == 101 else 0)
+
+    def GetObjectVariableLongInt(self, handle: MockHandle, index: int) -> int:
+        return handle.object.get_variable(index, 0)
+
+    def GetObjectVariableReal(self, handle: MockHandle, index: int) -> float:
+        return handle.object.get_variable(index, 1.0 if index in (102, 103, 104, 1003) else 0.0)
+
+    def GetObjectVariableString(self, handle: MockHandle, index: int) -> str:
+        return handle.object.get_variable(index, '')
+
+    def GetObjectVariableBoolean(self, handle: MockHandle, index: int) -> bool:
+        return handle.object.get_variable(index, False)
+
+    def SetObjectVariableInt(self, handle: MockHandle, index: int, value: int):
+        handle.object.set_variable(index, value)
+
+    def SetObjectVariableLongInt(self, handle: MockHandle, index: int, value: int):
+        handle.object.set_variable(index, value)
+
+    def SetObjectVariableReal(self, handle: MockHandle, index: int, value: float):
+        handle.object.set_variable(index, value)
+
+    def SetObjectVariableString(self, handle: MockHandle, index: int, value: str):
+        handle.object.set_variable(index, value)
+
+    def SetObjectVariableBoolean(self, handle: MockHandle, index: int, value: bool):
+        handle.object.set_variable(index, value)
+
+    def IsPluginFormat(self, handle: MockHandle) -> bool:
+        mock_object = handle.object
+        return (mock_object.definition or mock_object).plugin_format
+
+    def GetCustomObjectInfo(self) -> tuple:
+        instance = self.__plugin_instance
+        if instance is None:
+            return False, self.__plugin_name, None, None, None
+        return True, self.__plugin_name, instance.handle, self.GetParametricRecord(instance.handle), None
+
+    def GetPluginInfo(self) -> tuple:
+        record = self.__names.get(self.__plugin_name)
+        return True, self.__plugin_name, record.handle if record is not None else None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # VS: CREATION -----------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def Locus(self, point: tuple):
+        self.__create(MockObjectTypeEnum.LOCUS, point[0], point[1], point[0], point[1])
+
+    def Rect(self, top_left: tuple, bottom_right: tuple):
+        self.__create(MockObjectTypeEnum.RECTANGLE, top_left[0], top_left[1], bottom_right[0], bottom_right[1])
+
+    def RectangleN(self, origin: tuple, direction: tuple, width: float, height: float):
+        rectangle = self.__create(
+            MockObjectTypeEnum.RECTANGLE, origin[0], origin[1] + height, origin[0] + width, origin[1])
+        if direction[1] != 0 or direction[0] < 0:
+            self.HRotate(rectangle.handle, origin, math.degrees(math.atan2(direction[1], direction[0])))
+
+    def MoveTo(self, point: tuple):
+        self.__pen_location = tuple(point)
+
+    def LineTo(self, point: tuple):
+        line = self.__create(MockObjectTypeEnum.LINE, self.__pen_location[0], self.__pen_location[1],
+                             point[0], point[1])
+        line.points = (self.__pen_location, tuple(point))
+        self.__pen_location = tuple(point)
+
+    def GetSegPt1(self, handle: MockHandle) -> tuple:
+        return handle.object.points[0]
+
+    def GetSegPt2(self, handle: MockHandle) -> tuple:
+        return handle.object.points[1]
+
+    def ClosePoly(self):
+        self.__closed_poly = True
+
+    def OpenPoly(self):
+        self.__closed_poly = False
+
+    def Poly(self, *coordinates):
+        xs, ys = coordinates[0::2], coordinates[1::2]
+        polygon = self.__create(MockObjectTypeEnum.POLYGON, min(xs), max(ys), max(xs), min(ys))
+        polygon.points = tuple(zip(xs, ys))
+
+    def TextOrigin(self, point: tuple):
+        self.__text_origin = tuple(point)
+
+    def TextJust(self, value: int):
+        self.__text_just = value
+
+    def TextVerticalAlign(self, value: int):
+        self.__text_vertical_align = value
+
+    def CreateText(self, text: str):
+        x, y = self.__text_origin
+        size = self.__preferences[57] / 42.42424 / 72
+        mock_text = self.__create(MockObjectTypeEnum.TEXT, x, y, x + len(text) * size / 2, y - size)
+        mock_text.text = text
+        mock_text.set_variable('just', self.__text_just)
+        mock_text.set_variable('vertical_align', self.__text_vertical_align)
+        mock_text.set_variable('size', self.__preferences[57] / 42.42424)
+
+    def GetTextJust(self, handle: MockHandle) -> int:
+        return handle.object.get_variable('just', 1)
+
+    def SetTextJustN(self, handle: MockHandle, value: int):
+        handle.object.set_variable('just', value)
+
+    def GetTextVerticalAlign(self, handle: MockHandle) -> int:
+        return handle.object.get_variable('vertical_align', 1)
+
+    def SetTextVertAlignN(self, handle: MockHandle, value: int):
+        handle.object.set_variable('vertical_align', value)
+
+    def GetTextSize(self, handle: MockHandle, position: int) -> float:
+        return handle.object.get_variable('size', 10.0)
+
+    def SetTextSize(self, handle: MockHandle, start: int, count: int, size: float):
+        handle.object.set_variable('size', size)
+
+    def GetTextLength(self, handle: MockHandle) -> int:
+        return len(handle.object.text)
+
+    def BeginGroup(self):
+        group = MockObject(MockObjectTypeEnum.GROUP, clazz=self.__active_class)
+        group.children = list()
+        self.__containers.append(group)
+
+    def EndGroup(self):
+        group = self.__containers.pop()
+        if group.children:
+            group.bbox = [min(c.bbox[0] for c in group.children), max(c.bbox[1] for c in group.children),
+                          max(c.bbox[2] for c in group.children), min(c.bbox[3] for c in group.children)]
+        self.__place(group)
+
+    def BeginSym(self, name: str):
+        definition = MockObject(MockObjectTypeEnum.SYMBOL_DEFINITION, name)
+        definition.children = list()
+        self.__add_resource(definition)
+        self.__containers.append(definition)
+
+    def EndSym(self):
+        definition = self.__containers.pop()
+        if definition.children:
+            definition.bbox = [min(c.bbox[0] for c in definition.children),
+                               max(c.bbox[1] for c in definition.children),
+                               max(c.bbox[2] for c in definition.children),
+                               min(c.bbox[3] for c in definition.children)]
+        self.__last_new_object = definition
+
+    def Symbol(self, name: str, point: tuple, rotation: float):
+        definition = self.__names[name]
+        left, top, right, bottom = definition.bbox
+        symbol = self.__create(MockObjectTypeEnum.SYMBOL, point[0] + left, point[1] + top,
+                               point[0] + right, point[1] + bottom)
+        symbol.definition = None
+        symbol.set_variable('definition', name)
+        symbol.origin = tuple(point)
+        if rotation:
+            self.HRotate(symbol.handle, point, rotation)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # VS: RECORDS ------------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def NewField(self, record_name: str, field_name: str, default: str, field_type: int, flag: int):
+        definition = self.__names.get(record_name)
+        if definition is None:
+            definition = self.__add_resource(MockObject(MockObjectTypeEnum.RECORD_DEFINITION, record_name))
+        definition.fields.append(MockField(field_name, field_type, default))
+
+    def NumFields(self, handle: MockHandle) -> int:
+        mock_object = handle.object
+        return len((mock_object.definition or mock_object).fields)
+
+    def GetFldName(self, handle: MockHandle, index: int) -> str:
+        mock_object = handle.object
+        return (mock_object.definition or mock_object).fields[index - 1].name
+
+    def GetFldType(self, handle: MockHandle, index: int) -> int:
+        mock_object = handle.object
+        return (mock_object.definition or mock_object).fields[index - 1].type
+
+    def NumRecords(self, handle: MockHandle) -> int:
+        return len(handle.object.records or ())
+
+    def GetRecord(self, handle: MockHandle, index: int) -> MockHandle:
+        return handle.object.records[index - 1].handle
+
+    def GetParametricRecord(self, handle: MockHandle) -> MockHandle:
+        mock_object = handle.object
+        if mock_object.type != MockObjectTypeEnum.PLUGIN_OBJECT or not mock_object.records:
+            return None
+        return mock_object.records[0].handle
+
+    def GetRField(self, handle: MockHandle, record_name: str, field_name: str) -> str:
+        record = handle.object.get_record(record_name)
+        if record is None:
+            return ''
+        value = record.values.get(field_name)
+        if value is None:
+            for field in record.definition.fields:
+                if field.name == field_name:
+                    return field.default
+            return ''
+        return value
+
+    def SetRField(self, handle: MockHandle, record_name: str, field_name: str, value: str):
+        self.attach_record(handle, record_name, {field_name: value})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # VS: LAYERS -------------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def NumLayers(self) -> int:
+        return len(self.__layers)
+
+    def FLayer(self) -> MockHandle:
+        return self.__layers[0].handle if self.__layers else None
+
+    def NextLayer(self, handle: MockHandle) -> MockHandle:
+        index = self.__layer_indexes[handle.object] + 1
+        return self.__layers[index].handle if index < len(self.__layers) else None
+
+    def ActLayer(self) -> MockHandle:
+        return self.__active_layer.handle
+
+    def GetLName(self, handle: MockHandle) -> str:
+        return handle.object.name
+
+    def GetLScale(self, handle: MockHandle) -> float:
+        return handle.object.get_variable('scale', 1.0)
+
+    def GetDescriptionText(self, handle: MockHandle) -> str:
+        return handle.object.get_variable('description', '')
+
+    def GetDrawingSizeRectN(self, handle: MockHandle) -> tuple:
+        return (-420.0 / 25.4 * 12, 297.0 / 25.4 * 12), (420.0 / 25.4 * 12, -297.0 / 25.4 * 12)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # VS: CLASSES AND RESOURCES ----------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def ActiveClass(self) -> str:
+        return self.__active_class
+
+    def NameClass(self, name: str):
+        self.create_class(name)
+        self.__active_class = name
+
+    def Name2Index(self, name: str) -> int:
+        return self.__get_index(name)
+
+    def Index2Name(self, index: int) -> str:
+        return self.__resources[index - 1].name if 0 < index <= len(self.__resources) else ''
+
+    def BuildResourceList(self, resource_type: int, folder: int, path: str) -> tuple:
+        resources = list()
+        if folder >= 0:
+            resources.extend(r for r in self.__resources if r.type == resource_type and not r.deleted)
+        if folder != 0:
+            resources.extend(r for r in self.__application_resources.get((abs(folder), path), ())
+                             if r.type == resource_type)
+        list_id = len(self.__resource_lists) + 1
+        self.__resource_lists[list_id] = MockResourceList(resources)
+        return list_id, len(resources)
+
+    def GetResourceFromList(self, list_id: int, index: int):
+        resource = self.__resource_lists[list_id].resources[index - 1]
+        return resource.handle if self.__in_document(resource) else 0  # VW returns 0 instead of None!
+
+    def GetNameFromResourceList(self, list_id: int, index: int) -> str:
+        return self.__resource_lists[list_id].resources[index - 1].name
+
+    def GetActualNameFromResourceList(self, list_id: int, index: int) -> str:
+        return self.__resource_lists[list_id].resources[index - 1].name
+
+    def DeleteResourceFromList(self, list_id: int, index: int):
+        del self.__resource_lists[list_id].resources[index - 1]
+
+    def ImportResToCurFileN(self, list_id: int, index: int, callback: callable) -> MockHandle:
+        resources = self.__resource_lists[list_id].resources
+        resource = resources[index - 1]
+        if self.__in_document(resource):
+            return resource.handle
+        existing = self.__names.get(resource.name)
+        imported = MockObject(resource.type, resource.name)
+        imported.fields = list(resource.fields) if resource.fields is not None else None
+        if existing is not None:
+            answer = callback(resource.name)  # 0 = cancel, 1 = replace, 2 = rename.
+            if answer == 0:
+                return None
+            elif answer == 1:
+                existing.deleted = True
+                self.__resources.remove(existing)
+            else:
+                imported.name = '%s-%s' % (resource.name, sum(1 for n in self.__names if n.startswith(resource.name)))
+        self.__add_resource(imported)
+        resources[index - 1] = imported
+        return imported.handle
+
+    def GetVectorFill(self, handle: MockHandle) -> tuple:
+        index = handle.object.get_variable(695, 0)
+        return (True, self.Index2Name(-index)) if index < 0 else (False, '')
+
+    def GetClVectorFill(self, name: str) -> tuple:
+        return self.GetVectorFill(self.__names[name].handle)
+
+    def GetClFPat(self, name: str) -> int:
+        return self.__names[name].get_attribute('FPat')
+
+    def SetClFPat(self, name: str, value: int):
+        self.__names[name].set_attribute('FPat', value)
+
+    def GetClLSN(self, name: str) -> int:
+        return self.__names[name].get_attribute('LSN')
+
+    def SetClLSN(self, name: str, value: int):
+        self.__names[name].set_attribute('LSN', value)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # VS: ATTRIBUTES ---------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def GetFPat(self, handle: MockHandle) -> int:
+        return handle.object.get_attribute('FPat')
+
+    def SetFPat(self, handle: MockHandle, value: int):
+        handle.object.set_attribute('FPat', value)
+        handle.object.set_attribute('FPatByClass', False)
+
+    def GetLSN(self, handle: MockHandle) -> int:
+        return handle.object.get_attribute('LSN')
+
+    def SetLSN(self, handle: MockHandle, value: int):
+        handle.object.set_attribute('LSN', value)
+        handle.object.set_attribute('LSByClass', False)
+
+    def GetLW(self, handle: MockHandle) -> int:
+        return handle.object.get_attribute('LW')
+
+    def SetLW(self, handle: MockHandle, value: int):
+        handle.object.set_attribute('LW', value)
+        handle.object.set_attribute('LWByClass', False)
+
+    def GetPenFore(self, handle: MockHandle) -> tuple:
+        return handle.object.get_attribute('PenFore')
+
+    def SetPenFore(self, handle: MockHandle, color: tuple):
+        handle.object.set_attribute('PenFore', tuple(color))
+        handle.object.set_attribute('PenColorByClass', False)
+
+    def GetPenBack(self, handle: MockHandle) -> tuple:
+        return handle.object.get_attribute('PenBack')
+
+    def SetPenBack(self, handle: MockHandle, color: tuple):
+        handle.object.set_attribute('PenBack', tuple(color))
+        handle.object.set_attribute('PenColorByClass', False)
+
+    def GetFillFore(self, handle: MockHandle) -> tuple:
+        return handle.object.get_attribute('FillFore')
+
+    def SetFillFore(self, handle: MockHandle, color: tuple):
+        handle.object.set_attribute('FillFore', tuple(color))
+        handle.object.set_attribute('FillColorByClass', False)
+
+    def GetFillBack(self, handle: MockHandle) -> tuple:
+        return handle.object.get_attribute('FillBack')
+
+    def SetFillBack(self, handle: MockHandle, color: tuple):
+        handle.object.set_attribute('FillBack', tuple(color))
+        handle.object.set_attribute('FillColorByClass', False)
+
+    def GetOpacity(self, handle: MockHandle) -> int:
+        return handle.object.get_attribute('Opacity')
+
+    def SetOpacity(self, handle: MockHandle, value: int):
+        handle.object.set_attribute('Opacity', value)
+        handle.object.set_attribute('OpacityByClass', False)
+
+    def GetObjBeginningMarker(self, handle: MockHandle) -> tuple:
+        return (True,) + handle.object.get_attribute('BeginningMarker')
+
+    def SetObjBeginningMarker(self, handle: MockHandle, *marker):
+        handle.object.set_attribute('BeginningMarker', tuple(marker))
+        handle.object.set_attribute('MarkerByClass', False)
+
+    def GetObjEndMarker(self, handle: MockHandle) -> tuple:
+        return (True,) + handle.object.get_attribute('EndMarker')
+
+    def SetObjEndMarker(self, handle: MockHandle, *marker):
+        handle.object.set_attribute('EndMarker', tuple(marker))
+        handle.object.set_attribute('MarkerByClass', False)
+
+    def IsLSByClass(self, handle: MockHandle) -> bool:
+        return handle.object.get_attribute('LSByClass')
+
+    def IsLWByClass(self, handle: MockHandle) -> bool:
+        return handle.object.get_attribute('LWByClass')
+
+    def IsPenColorByClass(self, handle: MockHandle) -> bool:
+        return handle.object.get_attribute('PenColorByClass')
+
+    def IsFillColorByClass(self, handle: MockHandle) -> bool:
+        return handle.object.get_attribute('FillColorByClass')
+
+    def IsFPatByClass(self, handle: MockHandle) -> bool:
+        return handle.object.get_attribute('FPatByClass')
+
+    def GetOpacityByClass(self, handle: MockHandle) -> bool:
+        return handle.object.get_attribute('OpacityByClass')
+
+    def IsMarkerByClass(self, handle: MockHandle) -> bool:
+        return handle.object.get_attribute('MarkerByClass')
+
+    def SetLSByClass(self, handle: MockHandle):
+        handle.object.set_attribute('LSByClass', True)
+
+    def SetLWByClass(self, handle: MockHandle):
+        handle.object.set_attribute('LWByClass', True)
+
+    def SetPenColorByClass(self, handle: MockHandle):
+        handle.object.set_attribute('PenColorByClass', True)
+
+    def SetFillColorByClass(self, handle: MockHandle):
+        handle.object.set_attribute('FillColorByClass', True)
+
+    def SetFPatByClass(self, handle: MockHandle):
+        handle.object.set_attribute('FPatByClass', True)
+
+    def SetOpacityByClass(self, handle: MockHandle):
+        handle.object.set_attribute('OpacityByClass', True)
+
+    def SetMarkerByClass(self, handle: MockHandle):
+        handle.object.set_attribute('MarkerByClass', True)
+
+    def FFillPat(self) -> int:
+        return self.__fill_pattern
+
+    def FillPat(self, value: int):
+        self.__fill_pattern = value
+
+    def FPenPatN(self) -> int:
+        return self.__pen_pattern
+
+    def PenPatN(self, value: int):
+        self.__pen_pattern = value
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # VS: DOCUMENT, PREFERENCES AND CONVERSION -------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def GetFName(self) -> str:
+        return self.__file_name
+
+    def GetFPathName(self) -> str:
+        return self.__file_directory + self.__file_name if self.__file_directory else self.__file_name
+
+    def ConvertHSF2PosixPath(self, path: str) -> tuple:
+        return True, path
+
+    def GetPrefReal(self, index: int) -> float:
+        return self.__preferences.get(index, 0.0)
+
+    def GetPrefInt(self, index: int) -> int:
+        return self.__preferences.get(index, 0)
+
+    def GetPrefLongInt(self, index: int) -> int:
+        return self.__preferences.get(index, 0)
+
+    def GetPrefString(self, index: int) -> str:
+        return self.__preferences.get(index, '')
+
+    def SetPrefReal(self, index: int, value: float):
+        self.__preferences[index] = value
+
+    def SetPrefInt(self, index: int, value: int):
+        self.__preferences[index] = value
+
+    def SetPrefLongInt(self, index: int, value: int):
+        self.__preferences[index] = value
+
+    __LENGTH = re.compile(r'''^\s*(-?\d+(?:\.\d*)?|-?\.\d+)\s*(mm|cm|m|km|in|"|ft|'|yd|mi)?\s*$''')
+    __FEET_INCHES = re.compile(r'''^\s*(-?\d+(?:\.\d*)?)\s*'\s*-?\s*(\d+(?:\.\d*)?)?(?:\s+(\d+)/(\d+))?\s*"?\s*$''')
+    __INCHES_PER_UNIT = {
+        'mm': 1 / 25.4, 'cm': 1 / 2.54, 'm': 1 / 0.0254, 'km': 1 / 0.0000254, 'in': 1.0, '"': 1.0, 'ft': 12.0,
+        "'": 12.0, 'yd': 36.0, 'mi': 63360.0
+    }
+
+    def ValidNumStr(self, value: str) -> tuple:
+        match = self.__LENGTH.match(value)
+        if match is not None:
+            number, unit = float(match.group(1)), match.group(2)
+            return True, number * self.__INCHES_PER_UNIT[unit] * self.__preferences[152] if unit else number
+        match = self.__FEET_INCHES.match(value)
+        if match is not None:
+            feet, inches, numerator, denominator = match.groups()
+            inches = float(feet) * 12 + float(inches or 0) + (int(numerator) / int(denominator) if denominator else 0)
+            return True, inches * self.__preferences[152]
+        return False, 0.0
+
+    def Str2Num(self, value: str) -> float:
+        try:
+            return float(value)
+        except ValueError:
+            return 0.0
+
+    def Num2Str(self, precision: int, value: float) -> str:
+        """Negative precisions give as many decimals as needed, without the exponent notation, which VW doesn't know."""
+        if precision < 0:
+            return format(decimal.Decimal(repr(float(value))), 'f')
+        return '%.*f' % (precision, value)
+
+    def Str2Area(self, value: str) -> float:
+        return self.Str2Num(value.split()[0] if value.strip() else '0')
+
+    def Str2Volume(self, value: str) -> float:
+        return self.Str2Num(value.split()[0] if value.strip() else '0')
+
+    def Str2Angle(self, value: str) -> float:
+        return self.Str2Num(value.strip().rstrip('°') or '0')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # VS: APPLICATION, PLUGINS AND MESSAGES ----------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def GetVersionEx(self) -> tuple:
+        return self.__version
+
+    def GetActiveSerialNumber(self) -> str:
+        return self.__serial_number
+
+    def GetFolderPath(self, folder: int) -> str:
+        return self.__folder_paths.get(folder, '')
+
+    def FindFileInPluginFolder(self, filename: str) -> tuple:
+        return True, self.__plugin_folder
+
+    def Message(self, message: str):
+        self.__messages.append(str(message))
+
+    def ClrMessage(self):
+        pass
+
+    def AlertCritical(self, text: str, advice: str):
+        self.__messages.append(text)
+
+    def AlertInform(self, text: str, advice: str, minor_alert: bool):
+        self.__messages.append(text)
+
+    def AlrtDialog(self, text: str):
+        self.__messages.append(text)
+
+    def AlertQuestion(self, question: str, advice: str, default_button: int, ok_text: str, cancel_text: str,
+                      custom_button_a_text: str, custom_button_b_text: str) -> int:
+        self.__messages.append(question)
+        return self.__alert_answer
+
+    def vsoGetEventInfo(self) -> tuple:
+        return self.__event
+
+    def vsoSetEventResult(self, result: int):
+        pass
+
+    def vsoStateAddCurrent(self, handle: MockHandle, data: int):
+        pass
+
+    def vsoStateClear(self, handle: MockHandle):
+        pass
+
+    def vsoStateGet(self, handle: MockHandle, state: int) -> bool:
+        return False
+
+    def vsoStateGetParamChng(self, handle: MockHandle) -> tuple:
+        return False, 0, 0, ''
+
+    def vsoAddParamWidget(self, widget_id: int, parameter: str, alternate_name: str):
+        pass
+
+    def vsoInsertWidget(self, widget_id: int, widget_type: int, event_id: int, text: str, data: int):
+        pass
+
+    def vsoWidgetSetVisible(self, widget_id: int, visible: bool):
+        pass
+
+    def vsoWidgetSetEnable(self, widget_id: int, enabled: bool):
+        pass
+
+    def SetObjPropVS(self, property_id: int, value: bool):
+        pass
+
+    def SetObjPropCharVS(self, property_id: int, value: int):
+        pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # VS: DIALOG LAYOUT ------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def __control(self, dialog_id: int, control_id: int) -> MockControl:
+        return self.__dialogs[dialog_id].controls[control_id]
+
+    def __add_control(self, dialog_id: int, control_id: int, kind: str, text: str=''):
+        self.__dialogs[dialog_id].controls[control_id] = MockControl(kind, text)
+
+    def CreateLayout(self, title: str, has_help: bool, ok_text: str, cancel_text: str) -> int:
+        dialog_id = len(self.__dialogs) + 1
+        self.__dialogs[dialog_id] = MockDialog(title)
+        return dialog_id
+
+    def RunLayoutDialog(self, dialog_id: int, handler: callable) -> int:
+        dialog = self.__dialogs[dialog_id]
+        handler(12255, 0)  # Setup.
+        while dialog.events:
+            item, data, list_browser_event = dialog.events.pop(0)
+            if list_browser_event is not None:
+                self.__control(dialog_id, item).event_info = (True,) + tuple(list_browser_event)
+            if handler(item, data) in (1, 2):
+                return item
+        handler(1, 0)
+        return 1
+
+    def SetFirstLayoutItem(self, dialog_id: int, control_id: int):
+        pass
+
+    def SetFirstGroupItem(self, dialog_id: int, group_id: int, control_id: int):
+        pass
+
+    def SetRightItem(self, dialog_id: int, source_id: int, control_id: int, indent: int, line_spacing: int):
+        pass
+
+    def SetBelowItem(self, dialog_id: int, source_id: int, control_id: int, indent: int, line_spacing: int):
+        pass
+
+    def AlignItemEdge(self, dialog_id: int, control_id: int, edge: int, align_id: int, mode: int):
+        pass
+
+    def SetHelpText(self, dialog_id: int, control_id: int, text: str):
+        if control_id in self.__dialogs[dialog_id].controls:
+            self.__control(dialog_id, control_id).help_text = text
+
+    def EnableItem(self, dialog_id: int, control_id: int, enabled: bool):
+        if control_id in self.__dialogs[dialog_id].controls:
+            self.__control(dialog_id, control_id).enabled = enabled
+
+    def CreatePushButton(self, dialog_id: int, control_id: int, caption: str):
+        self.__add_control(dialog_id, control_id, 'button', caption)
+
+    def CreateCheckBox(self, dialog_id: int, control_id: int, label: str):
+        self.__add_control(dialog_id, control_id, 'check-box', label)
+
+    def CreateEditText(self, dialog_id: int, control_id: int, text: str, width: int):
+        self.__add_control(dialog_id, control_id, 'edit-text', text)
+
+    def CreateEditTextBox(self, dialog_id: int, control_id: int, text: str, width: int, height: int):
+        self.__add_control(dialog_id, control_id, 'edit-text', text)
+
+    def CreateGroupBox(self, dialog_id: int, control_id: int, header: str, border: bool):
+        self.__add_control(dialog_id, control_id, 'group-box', header)
+
+    def CreateListBoxN(self, dialog_id: int, control_id: int, width: int, height: int, multiple: bool):
+        self.__add_control(dialog_id, control_id, 'list-box')
+
+    def CreatePullDownMenu(self, dialog_id: int, control_id: int, width: int):
+        self.__add_control(dialog_id, control_id, 'pull-down-menu')
+
+    def CreateCustThumbPopup(self, dialog_id: int, control_id: int, size: int):
+        self.__add_control(dialog_id, control_id, 'resource-pull-down-menu')
+
+    def CreateSeparator(self, dialog_id: int, control_id: int, width: int):
+        self.__add_control(dialog_id, control_id, 'separator')
+
+    def CreateStyledStatic(self, dialog_id: int, control_id: int, text: str, width: int, style: int):
+        self.__add_control(dialog_id, control_id, 'static-text', text)
+
+    def CreateTabControl(self, dialog_id: int, control_id: int):
+        self.__add_control(dialog_id, control_id, 'tab-control')
+
+    def CreateTabPane(self, dialog_id: int, tab_control_id: int, group_id: int):
+        pass
+
+    def CreateLB(self, dialog_id: int, control_id: int, width: int, height: int):
+        self.__add_control(dialog_id, control_id, 'list-browser')
+
+    def GetBooleanItem(self, dialog_id: int, control_id: int) -> bool:
+        return self.__control(dialog_id, control_id).value
+
+    def SetBooleanItem(self, dialog_id: int, control_id: int, value: bool):
+        self.__control(dialog_id, control_id).value = bool(value)
+
+    def GetItemText(self, dialog_id: int, control_id: int) -> str:
+        return self.__control(dialog_id, control_id).text
+
+    def SetItemText(self, dialog_id: int, control_id: int, text: str):
+        self.__control(dialog_id, control_id).text = text
+
+    def AddChoice(self, dialog_id: int, control_id: int, text: str, index: int):
+        control = self.__control(dialog_id, control_id)
+        control.choices.insert(index, text)
+        control.selected_choices = {i if i < index else i + 1 for i in control.selected_choices}
+
+    def RemoveChoice(self, dialog_id: int, control_id: int, index: int):
+        control = self.__control(dialog_id, control_id)
+        del control.choices[index]
+        control.selected_choices = {i if i < index else i - 1 for i in control.selected_choices if i != index}
+
+    def DeleteAllItems(self, dialog_id: int, control_id: int):
+        control = self.__control(dialog_id, control_id)
+        control.choices.clear()
+        control.selected_choices.clear()
+
+    def GetChoiceCount(self, dialog_id: int, control_id: int) -> int:
+        control = self.__control(dialog_id, control_id)
+        return len(control.choices) if control.kind != 'resource-pull-down-menu' else len(control.rows)
+
+    def SelectChoice(self, dialog_id: int, control_id: int, index: int, select: bool):
+        control = self.__control(dialog_id, control_id)
+        if control.kind == 'pull-down-menu':
+            control.selected_choices.clear()
+        control.selected_choices.add(index) if select else control.selected_choices.discard(index)
+
+    def GetSelectedChoiceIndex(self, dialog_id: int, control_id: int, start: int) -> int:
+        return min((i for i in self.__control(dialog_id, control_id).selected_choices if i >= start), default=-1)
+
+    def InsertImagePopupObjectItem(self, dialog_id: int, control_id: int, name: str) -> int:
+        control = self.__control(dialog_id, control_id)
+        control.rows.append([('object', name)])
+        return len(control.rows)
+
+    def InsertImagePopupResource(self, dialog_id: int, control_id: int, list_id: int, index: int) -> int:
+        control = self.__control(dialog_id, control_id)
+        control.rows.append([('resource', list_id, index)])
+        return len(control.rows)
+
+    def InsertImagePopupSeparator(self, dialog_id: int, control_id: int, label: str):
+        self.__control(dialog_id, control_id).rows.append([('separator', label)])
+
+    def RemoveAllImagePopupItems(self, dialog_id: int, control_id: int):
+        self.__control(dialog_id, control_id).rows.clear()
+
+    def RemoveImagePopupItem(self, dialog_id: int, control_id: int, index: int):
+        rows = self.__control(dialog_id, control_id).rows
+        del rows[min(index, len(rows) - 1)]
+
+    def GetNumImagePopupItems(self, dialog_id: int, control_id: int) -> int:
+        return len(self.__control(dialog_id, control_id).rows)
+
+    def SetImagePopupSelectedItem(self, dialog_id: int, control_id: int, index: int):
+        self.__control(dialog_id, control_id).popup_selected = index
+
+    def GetImagePopupSelectedItem(self, dialog_id: int, control_id: int) -> int:
+        return self.__control(dialog_id, control_id).popup_selected
+
+    def InsertLBColumn(self, dialog_id: int, control_id: int, index: int, header: str, width: int) -> int:
+        control = self.__control(dialog_id, control_id)
+        control.columns.insert(index, {'header': header, 'width': width})
+        for row in control.rows:
+            row.insert(index, ('', -1))
+        return index
+
+    def SetLBControlType(self, dialog_id: int, control_id: int, column: int, control_type: int):
+        self.__control(dialog_id, control_id).columns[column]['control_type'] = control_type
+
+    def SetLBItemDisplayType(self, dialog_id: int, control_id: int, column: int, display_type: int):
+        self.__control(dialog_id, control_id).columns[column]['display_type'] = display_type
+
+    def SetLBEditDisplayType(self, dialog_id: int, control_id: int, column: int, display_type: int):
+        self.__control(dialog_id, control_id).columns[column]['display_type'] = display_type
+
+    def EnableLBDragAndDrop(self, dialog_id: int, control_id: int, enable: bool):
+        self.__control(dialog_id, control_id).drag_drop = enable
+
+    def SetLBDragDropColumn(self, dialog_id: int, control_id: int, column: int):
+        pass
+
+    def EnableLBColumnLines(self, dialog_id: int, control_id: int, enable: bool):
+        pass
+
+    def RefreshLB(self, dialog_id: int, control_id: int):
+        pass
+
+    def SetLBSortColumn(self, dialog_id: int, control_id: int, column: int, descending: bool):
+        control = self.__control(dialog_id, control_id)
+        control.sort_column = column
+        control.sort_descending = descending
+
+    def GetLBSortColumn(self, dialog_id: int, control_id: int) -> int:
+        return self.__control(dialog_id, control_id).sort_column
+
+    def GetLBColumnSortState(self, dialog_id: int, control_id: int, column: int) -> int:
+        control = self.__control(dialog_id, control_id)
+        return 0 if control.sort_column != column else (1 if control.sort_descending else -1)
+
+    def InsertLBItem(self, dialog_id: int, control_id: int, index: int, text: str) -> int:
+        control = self.__control(dialog_id, control_id)
+        control.rows.insert(index, [(text, -1)] + [('', -1)] * (len(control.columns) - 1))
+        control.selected_rows = {i if i < index else i + 1 for i in control.selected_rows}
+        return index
+
+    def DeleteLBItem(self, dialog_id: int, control_id: int, index: int):
+        control = self.__control(dialog_id, control_id)
+        del control.rows[index]
+        control.selected_rows = {i if i < index else i - 1 for i in control.selected_rows if i != index}
+
+    def DeleteAllLBItems(self, dialog_id: int, control_id: int):
+        control = self.__control(dialog_id, control_id)
+        control.rows.clear()
+        control.selected_rows.clear()
+
+    def GetNumLBItems(self, dialog_id: int, control_id: int) -> int:
+        return len(self.__control(dialog_id, control_id).rows)
+
+    def SetLBItemInfo(self, dialog_id: int, control_id: int, row: int, column: int, text, icon: int):
+        self.__control(dialog_id, control_id).rows[row][column] = (str(text), icon)
+
+    def GetLBItemInfo(self, dialog_id: int, control_id: int, row: int, column: int) -> tuple:
+        text, icon = self.__control(dialog_id, control_id).rows[row][column]
+        return True, text, icon
+
+    def SetLBItemTextJust(self, dialog_id: int, control_id: int, row: int, column: int, justification: int):
+        pass
+
+    def SetLBSelection(self, dialog_id: int, control_id: int, start: int, end: int, select: bool):
+        control = self.__control(dialog_id, control_id)
+        for row in range(start, end + 1):
+            control.selected_rows.add(row) if select else control.selected_rows.discard(row)
+
+    def IsLBItemSelected(self, dialog_id: int, control_id: int, row: int) -> bool:
+        return row in self.__control(dialog_id, control_id).selected_rows
+
+    def GetLBEventInfo(self, dialog_id: int, control_id: int) -> tuple:
+        return self.__control(dialog_id, control_id).event_info
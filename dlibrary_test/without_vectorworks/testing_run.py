@@ -1,4 +1,6 @@
 import os
 from unittest import TextTestRunner, TestLoader
 
-TextTestRunner(verbosity=2).run(TestLoader().discover(os.path.dirname(__file__), 'test_*.py'))
+# The top level is the DLibrary folder, so that the tests can import both the dlibrary and the dlibrary_test packages.
+TextTestRunner(verbosity=2).run(TestLoader().discover(
+    os.path.dirname(__file__), 'test_*.py', os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))